@@ -39,6 +39,9 @@ class AliasedGroup(click.Group):
               help=("Change OpenPype log level (debug - critical or 0-50)"))
 @click.option("--automatic-tests", is_flag=True, expose_value=False,
               help=("Run in automatic tests mode"))
+@click.option("--profile-startup", is_flag=True, expose_value=False,
+              help=("Store import times and startup phases to json report"
+                    " (use '--profile-startup=<path>' to define output)"))
 def main(ctx):
     """Pype is main command serving as entry point to pipeline system.
 
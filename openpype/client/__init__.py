@@ -27,6 +27,7 @@ from .entities import (
     get_last_versions,
     get_last_version_by_subset_id,
     get_last_version_by_subset_name,
+    get_subset_ids_with_new_versions,
     get_output_link_versions,
 
     version_is_latest,
@@ -45,6 +46,13 @@ from .entities import (
     get_workfile_info,
 )
 
+from .entity_cache import (
+    EntityCache,
+    entity_cache,
+    invalidate_entity_cache,
+    get_entity_cache_info,
+)
+
 from .entity_links import (
     get_linked_asset_ids,
     get_linked_assets,
@@ -83,6 +91,7 @@ __all__ = (
     "get_last_versions",
     "get_last_version_by_subset_id",
     "get_last_version_by_subset_name",
+    "get_subset_ids_with_new_versions",
     "get_output_link_versions",
 
     "version_is_latest",
@@ -100,6 +109,11 @@ __all__ = (
 
     "get_workfile_info",
 
+    "EntityCache",
+    "entity_cache",
+    "invalidate_entity_cache",
+    "get_entity_cache_info",
+
     "get_linked_asset_ids",
     "get_linked_assets",
     "get_linked_representation_id",
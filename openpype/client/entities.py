@@ -1,6 +1,40 @@
 from openpype import AYON_SERVER_ENABLED
 
+from .entity_cache import cached_entity_query
+
 if not AYON_SERVER_ENABLED:
     from .mongo.entities import *
+    from .mongo import entities as _entities
 else:
     from .server.entities import *
+    from .server import entities as _entities
+
+# Queries which can use opt-in entity cache (see 'entity_cache')
+get_project = cached_entity_query(_entities.get_project)
+
+get_asset_by_id = cached_entity_query(_entities.get_asset_by_id)
+get_asset_by_name = cached_entity_query(_entities.get_asset_by_name)
+get_assets = cached_entity_query(_entities.get_assets)
+
+get_subset_by_id = cached_entity_query(_entities.get_subset_by_id)
+get_subset_by_name = cached_entity_query(_entities.get_subset_by_name)
+get_subsets = cached_entity_query(_entities.get_subsets)
+
+get_version_by_id = cached_entity_query(_entities.get_version_by_id)
+get_version_by_name = cached_entity_query(_entities.get_version_by_name)
+get_versions = cached_entity_query(_entities.get_versions)
+get_hero_version_by_id = cached_entity_query(_entities.get_hero_version_by_id)
+get_hero_version_by_subset_id = cached_entity_query(
+    _entities.get_hero_version_by_subset_id)
+get_hero_versions = cached_entity_query(_entities.get_hero_versions)
+get_last_versions = cached_entity_query(_entities.get_last_versions)
+get_last_version_by_subset_id = cached_entity_query(
+    _entities.get_last_version_by_subset_id)
+get_last_version_by_subset_name = cached_entity_query(
+    _entities.get_last_version_by_subset_name)
+
+get_representation_by_id = cached_entity_query(
+    _entities.get_representation_by_id)
+get_representation_by_name = cached_entity_query(
+    _entities.get_representation_by_name)
+get_representations = cached_entity_query(_entities.get_representations)
@@ -0,0 +1,308 @@
+"""Opt-in cache of entity documents received through 'openpype.client'.
+
+Cache is disabled by default. It is enabled per project only inside
+'entity_cache' context manager, e.g. for a publish or a scene inventory
+refresh, where the same documents are queried repeatedly. Cached queries
+return copies of documents so modifications made by callers don't affect
+the cache. Any changes committed using 'OperationsSession' invalidate
+cache of the changed project.
+
+Example:
+    >>> with entity_cache("my_project"):
+    ...     asset_doc = get_asset_by_name("my_project", "sh010")
+    ...     # Second query is returned from cache
+    ...     asset_doc = get_asset_by_name("my_project", "sh010")
+"""
+
+import re
+import time
+import functools
+import threading
+import contextlib
+import collections
+
+import six
+
+PatternType = type(re.compile(""))
+
+# Default lifetime of cached query result in seconds
+DEFAULT_ENTITY_CACHE_TTL = 60
+# Default maximum number of cached query results per project
+DEFAULT_ENTITY_CACHE_SIZE = 5000
+
+
+class EntityCache(object):
+    """Cache of query results for single project.
+
+    Results are stored with time of creation and expire after 'ttl' seconds.
+    Least recently used results are removed when cache reaches 'max_size'.
+
+    Args:
+        project_name (str): Project name.
+        ttl (Optional[float]): Lifetime of cached results in seconds.
+        max_size (Optional[int]): Maximum number of cached results.
+    """
+
+    def __init__(
+        self,
+        project_name,
+        ttl=DEFAULT_ENTITY_CACHE_TTL,
+        max_size=DEFAULT_ENTITY_CACHE_SIZE
+    ):
+        self.project_name = project_name
+        self.ttl = ttl
+        self.max_size = max_size
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, key):
+        """Get cached result.
+
+        Args:
+            key (Hashable): Query key.
+
+        Returns:
+            tuple[bool, Any]: Result was found and the result.
+        """
+
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                created, value = item
+                if time.time() - created <= self.ttl:
+                    self._hits += 1
+                    # Move item to the end of queue
+                    self._items.pop(key)
+                    self._items[key] = item
+                    return True, value
+                self._items.pop(key)
+            self._misses += 1
+            return False, None
+
+    def set(self, key, value):
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = (time.time(), value)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def invalidate(self):
+        """Remove all cached results."""
+
+        with self._lock:
+            self._items.clear()
+            self._invalidations += 1
+
+    def info(self):
+        """Cache statistics.
+
+        Returns:
+            dict[str, Any]: Hits, misses, invalidations and size of cache.
+        """
+
+        with self._lock:
+            return {
+                "project_name": self.project_name,
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "size": len(self._items),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+            }
+
+
+class _EntityCacheRegistry(object):
+    """Active project caches with count of entered scopes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._caches = {}
+        self._scope_counts = collections.defaultdict(int)
+
+    def enter(self, project_name, ttl, max_size):
+        with self._lock:
+            cache = self._caches.get(project_name)
+            if cache is None:
+                cache = EntityCache(project_name, ttl, max_size)
+                self._caches[project_name] = cache
+            self._scope_counts[project_name] += 1
+            return cache
+
+    def exit(self, project_name):
+        with self._lock:
+            self._scope_counts[project_name] -= 1
+            if self._scope_counts[project_name] > 0:
+                return
+            self._scope_counts.pop(project_name)
+            self._caches.pop(project_name, None)
+
+    def get(self, project_name):
+        # Fast path without lock when no cache is active
+        if not self._caches:
+            return None
+        return self._caches.get(project_name)
+
+    def invalidate(self, project_name=None):
+        with self._lock:
+            if project_name is None:
+                caches = list(self._caches.values())
+            else:
+                cache = self._caches.get(project_name)
+                caches = [cache] if cache is not None else []
+
+        for cache in caches:
+            cache.invalidate()
+
+
+_registry = _EntityCacheRegistry()
+
+
+@contextlib.contextmanager
+def entity_cache(
+    project_name,
+    ttl=DEFAULT_ENTITY_CACHE_TTL,
+    max_size=DEFAULT_ENTITY_CACHE_SIZE
+):
+    """Enable cache of entity queries for a project inside the scope.
+
+    Scopes can be nested, cache is dropped when the most outer scope of
+    the project ends. Arguments of nested scopes are ignored.
+
+    Args:
+        project_name (str): Project name.
+        ttl (Optional[float]): Lifetime of cached results in seconds.
+        max_size (Optional[int]): Maximum number of cached results.
+
+    Yields:
+        EntityCache: Cache of the project.
+    """
+
+    cache = _registry.enter(project_name, ttl, max_size)
+    try:
+        yield cache
+    finally:
+        _registry.exit(project_name)
+
+
+def invalidate_entity_cache(project_name=None):
+    """Invalidate cached queries.
+
+    Args:
+        project_name (Optional[str]): Project which cache should be
+            invalidated. All active caches are invalidated if not passed.
+    """
+
+    _registry.invalidate(project_name)
+
+
+def get_entity_cache_info(project_name):
+    """Statistics of active project cache.
+
+    Args:
+        project_name (str): Project name.
+
+    Returns:
+        Union[dict[str, Any], None]: Cache statistics or None if cache is not
+            active for the project.
+    """
+
+    cache = _registry.get(project_name)
+    if cache is None:
+        return None
+    return cache.info()
+
+
+def _make_hashable(value):
+    if isinstance(value, (six.string_types, int, float, bool, type(None))):
+        return value
+
+    if isinstance(value, dict):
+        return tuple(sorted(
+            (key, _make_hashable(item))
+            for key, item in value.items()
+        ))
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_make_hashable(item) for item in value)
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_make_hashable(item) for item in value)
+
+    if isinstance(value, PatternType):
+        return ("__pattern__", value.pattern, value.flags)
+
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _copy_document(value):
+    """Copy containers of document.
+
+    Faster than 'copy.deepcopy' as only dictionaries and lists are copied,
+    values stored in documents (strings, ObjectId, datetime...) are not
+    modified in place.
+    """
+
+    if isinstance(value, dict):
+        return {
+            key: _copy_document(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_copy_document(item) for item in value]
+    return value
+
+
+def _iter_document_copies(docs):
+    for doc in docs:
+        yield _copy_document(doc)
+
+
+def cached_entity_query(func):
+    """Decorate query function to use active entity cache.
+
+    Decorated function must expect project name as first argument. Results
+    which are not a dictionary or None (cursors, generators) are converted
+    to list and returned as iterator, same as queries of AYON server
+    which return generators. Documents of iterator are copied on demand.
+
+    Args:
+        func (Callable): Query function.
+
+    Returns:
+        Callable: Wrapped function.
+    """
+
+    @functools.wraps(func)
+    def wrapper(project_name, *args, **kwargs):
+        cache = _registry.get(project_name)
+        if cache is None:
+            return func(project_name, *args, **kwargs)
+
+        key = (
+            func.__name__,
+            _make_hashable(args),
+            _make_hashable(kwargs)
+        )
+        found, value = cache.get(key)
+        if not found:
+            value = func(project_name, *args, **kwargs)
+            is_iterator = not (value is None or isinstance(value, dict))
+            if is_iterator:
+                value = list(value)
+            value = (is_iterator, value)
+            cache.set(key, value)
+
+        is_iterator, result = value
+        if is_iterator:
+            return _iter_document_copies(result)
+        return _copy_document(result)
+
+    return wrapper
@@ -7,6 +7,7 @@ that has project name as a context (e.g. on 'ProjectEntity'?).
 """
 
 import re
+import datetime
 import collections
 
 import six
@@ -950,6 +951,36 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
     }
 
 
+def get_subset_ids_with_new_versions(project_name, subset_ids, created_after):
+    """Subset ids which have versions created after passed time.
+
+    Creation time is taken from version id, 'ObjectId' contains time when
+    it was created.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        subset_ids (Iterable[Union[str, ObjectId]]): Subset ids to check.
+        created_after (float): Unix timestamp.
+
+    Returns:
+        set[ObjectId]: Subset ids with new versions.
+    """
+
+    subset_ids = convert_ids(subset_ids)
+    if not subset_ids:
+        return set()
+
+    min_version_id = ObjectId.from_datetime(
+        datetime.datetime.utcfromtimestamp(max(created_after, 0))
+    )
+    conn = get_project_connection(project_name)
+    return set(conn.distinct("parent", {
+        "type": "version",
+        "parent": {"$in": subset_ids},
+        "_id": {"$gte": min_version_id}
+    }))
+
+
 def get_last_version_by_subset_id(project_name, subset_id, fields=None):
     """Last version for passed subset id.
 
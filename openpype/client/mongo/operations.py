@@ -1,6 +1,7 @@
 import re
 import copy
 import collections
+from datetime import datetime
 
 from bson.objectid import ObjectId
 from pymongo import DeleteOne, InsertOne, UpdateOne
@@ -12,6 +13,8 @@ from openpype.client.operations_base import (
     DeleteOperation,
     BaseOperationsSession
 )
+from openpype.client.entity_cache import invalidate_entity_cache
+
 from .mongo import get_project_connection
 from .entities import get_project
 
@@ -31,6 +34,10 @@ CURRENT_REPRESENTATION_SCHEMA = "openpype:representation-2.0"
 CURRENT_WORKFILE_INFO_SCHEMA = "openpype:workfile-1.0"
 CURRENT_THUMBNAIL_SCHEMA = "openpype:thumbnail-1.0"
 
+# Key of representation document with time of last change. Changed
+#   representations are found by the key (e.g. by sync server).
+REPRESENTATION_UPDATED_KEY = "sync_updated_dt"
+
 
 def _create_or_convert_to_mongo_id(mongo_id):
     if mongo_id is None:
@@ -398,7 +405,10 @@ class MongoCreateOperation(CreateOperation):
         return self._data["_id"]
 
     def to_mongo_operation(self):
-        return InsertOne(copy.deepcopy(self._data))
+        data = copy.deepcopy(self._data)
+        if self.entity_type == "representation":
+            data[REPRESENTATION_UPDATED_KEY] = datetime.utcnow()
+        return InsertOne(data)
 
 
 class MongoUpdateOperation(UpdateOperation):
@@ -441,6 +451,11 @@ class MongoUpdateOperation(UpdateOperation):
         if not op_data:
             return None
 
+        if self.entity_type == "representation":
+            op_data.setdefault("$set", {})[REPRESENTATION_UPDATED_KEY] = (
+                datetime.utcnow()
+            )
+
         return UpdateOne(
             {"_id": self.entity_id},
             op_data
@@ -504,7 +519,11 @@ class MongoOperationsSession(BaseOperationsSession):
 
             if bulk_writes:
                 collection = get_project_connection(project_name)
-                collection.bulk_write(bulk_writes)
+                try:
+                    collection.bulk_write(bulk_writes)
+                finally:
+                    # Cached entities may be outdated even if write failed
+                    invalidate_entity_cache(project_name)
 
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'MongoCreateOperation'.
@@ -385,6 +385,12 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
     }
 
 
+def get_subset_ids_with_new_versions(project_name, subset_ids, created_after):
+    # Versions can't be filtered by creation time, all subsets are returned
+    #   so their last versions are queried again
+    return set(subset_ids)
+
+
 def get_last_version_by_subset_id(project_name, subset_id, fields=None):
     versions = _get_versions(
         project_name,
@@ -7,6 +7,7 @@ import datetime
 from bson.objectid import ObjectId
 from ayon_api import get_server_api_connection
 
+from openpype.client.entity_cache import invalidate_entity_cache
 from openpype.client.operations_base import (
     REMOVED_VALUE,
     CreateOperation,
@@ -726,11 +727,15 @@ class OperationsSession(BaseOperationsSession):
                     operations_body.append(body)
 
             if operations_body:
-                result = self._con.post(
-                    "projects/{}/operations".format(project_name),
-                    operations=operations_body,
-                    canFail=False
-                )
+                try:
+                    result = self._con.post(
+                        "projects/{}/operations".format(project_name),
+                        operations=operations_body,
+                        canFail=False
+                    )
+                finally:
+                    # Cached entities may be outdated even if request failed
+                    invalidate_entity_cache(project_name)
                 results.append(result.data)
 
         for result in results:
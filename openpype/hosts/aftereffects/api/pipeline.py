@@ -233,7 +233,7 @@ def ls():
 
 def check_inventory():
     """Checks loaded containers if they are of highest version"""
-    if not any_outdated_containers():
+    if not any_outdated_containers(incremental=True):
         return
 
     # Warn about outdated containers.
@@ -174,7 +174,7 @@ def on_after_open(event):
     comp = event["sender"]
     validate_comp_prefs(comp)
 
-    if any_outdated_containers():
+    if any_outdated_containers(incremental=True):
         log.warning("Scene has outdated content.")
 
         # Find OpenPype menu to attach to
@@ -106,7 +106,7 @@ def check_inventory():
     in Harmony.
     """
 
-    outdated_containers = get_outdated_containers()
+    outdated_containers = get_outdated_containers(incremental=True)
     if not outdated_containers:
         return
 
@@ -345,7 +345,7 @@ def on_open():
     # ensure it is using correct FPS for the asset
     lib.validate_fps()
 
-    if any_outdated_containers():
+    if any_outdated_containers(incremental=True):
         parent = lib.get_main_window()
         if parent is None:
             # When opening Houdini with last workfile on launch the UI hasn't
@@ -599,7 +599,7 @@ def on_open():
     lib.validate_fps()
     lib.fix_incompatible_containers()
 
-    if any_outdated_containers():
+    if any_outdated_containers(incremental=True):
         log.warning("Scene has outdated content.")
 
         # Find maya main window
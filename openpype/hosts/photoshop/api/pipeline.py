@@ -160,7 +160,7 @@ class PhotoshopHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
 
 
 def check_inventory():
-    if not any_outdated_containers():
+    if not any_outdated_containers(incremental=True):
         return
 
     # Warn about outdated containers.
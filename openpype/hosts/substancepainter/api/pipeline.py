@@ -283,7 +283,7 @@ class SubstanceHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
 def on_open():
     log.info("Running callback on open..")
 
-    if any_outdated_containers():
+    if any_outdated_containers(incremental=True):
         from openpype.widgets import popup
 
         log.warning("Scene has outdated content.")
@@ -88,6 +88,9 @@ from .dateutils import (
 
 from .python_module_tools import (
     import_filepath,
+    import_filepath_cached,
+    get_imported_files_cache_info,
+    clear_imported_files_cache,
     modules_from_path,
     recursive_bases_from_class,
     classes_from_module,
@@ -112,6 +115,10 @@ from .transcoding import (
     convert_ffprobe_fps_value,
     convert_ffprobe_fps_to_float,
 )
+from .media_probe_cache import (
+    get_media_probe_cache_info,
+    clear_media_probe_cache,
+)
 
 from .local_settings import (
     IniSettingRegistry,
@@ -145,6 +152,11 @@ from .plugin_tools import (
     source_hash,
 )
 
+from .file_sequences import (
+    FileSequence,
+    FileSequenceIndex,
+)
+
 from .path_tools import (
     format_file_size,
     collect_frames,
@@ -216,6 +228,9 @@ __all__ = [
     "FileDefItem",
 
     "import_filepath",
+    "import_filepath_cached",
+    "get_imported_files_cache_info",
+    "clear_imported_files_cache",
     "modules_from_path",
     "recursive_bases_from_class",
     "classes_from_module",
@@ -233,6 +248,9 @@ __all__ = [
     "convert_ffprobe_fps_value",
     "convert_ffprobe_fps_to_float",
 
+    "get_media_probe_cache_info",
+    "clear_media_probe_cache",
+
     "IniSettingRegistry",
     "JSONSettingRegistry",
     "OpenPypeSecureRegistry",
@@ -261,6 +279,9 @@ __all__ = [
     "prepare_template_data",
     "source_hash",
 
+    "FileSequence",
+    "FileSequenceIndex",
+
     "format_file_size",
     "collect_frames",
     "create_hard_link",
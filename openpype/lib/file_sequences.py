@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+"""Index of file sequences in directory or in list of paths.
+
+Files are grouped into sequences by head, tail and padding of frame in
+their name, same way as 'clique.assemble' creates collections. Each file is
+matched only once with precompiled pattern. Frames of sequence are stored
+as sorted ranges, so lookups of frame and missing frames do not need to go
+through all files.
+"""
+import os
+import re
+import bisect
+
+# Frame is the last group of digits in file name
+FRAME_PATTERN = re.compile(r"(?P<index>(?P<padding>0*)\d+)(?=[^\d\\/]*$)")
+# Frame separated by dots before extension, same as 'clique.PATTERNS["frames"]'
+DOT_FRAME_PATTERN = re.compile(r"\.(?P<index>(?P<padding>0*)\d+)\.\D+\d?$")
+
+
+class FileSequence(object):
+    """Files with same head, tail and padding differing only by frame.
+
+    Args:
+        head (str): Part of path before frame.
+        tail (str): Part of path after frame.
+        padding (int): Padding of frame, 0 if frames are not padded.
+    """
+
+    def __init__(self, head, tail, padding):
+        self.head = head
+        self.tail = tail
+        self.padding = padding
+        # Sorted non-overlapping ranges of frames (start, end)
+        self._ranges = []
+        self._starts = []
+        self._new_frames = set()
+
+    def __repr__(self):
+        return "<{} '{}'>".format(self.__class__.__name__, self.format())
+
+    def __len__(self):
+        return sum(end - start + 1 for start, end in self.get_ranges())
+
+    def __contains__(self, frame):
+        self._merge_new_frames()
+        idx = bisect.bisect_right(self._starts, frame) - 1
+        return idx >= 0 and frame <= self._ranges[idx][1]
+
+    def __iter__(self):
+        """Iterate over paths of the sequence."""
+        for frame in self.frames:
+            yield self.get_path(frame)
+
+    def add_frame(self, frame):
+        self._new_frames.add(frame)
+
+    def _merge_new_frames(self):
+        if not self._new_frames:
+            return
+
+        frames = self._new_frames
+        self._new_frames = set()
+        for start, end in self._ranges:
+            frames.update(range(start, end + 1))
+
+        ranges = []
+        for frame in sorted(frames):
+            if ranges and ranges[-1][1] == frame - 1:
+                ranges[-1][1] = frame
+            else:
+                ranges.append([frame, frame])
+
+        self._ranges = [tuple(item) for item in ranges]
+        self._starts = [start for start, _ in self._ranges]
+
+    def get_ranges(self):
+        """Frame ranges of the sequence.
+
+        Returns:
+            list[tuple[int, int]]: Sorted ranges with inclusive end.
+        """
+
+        self._merge_new_frames()
+        return list(self._ranges)
+
+    @property
+    def frames(self):
+        """Sorted frames of the sequence.
+
+        Returns:
+            list[int]: Frames.
+        """
+
+        return [
+            frame
+            for start, end in self.get_ranges()
+            for frame in range(start, end + 1)
+        ]
+
+    @property
+    def frame_start(self):
+        self._merge_new_frames()
+        return self._ranges[0][0]
+
+    @property
+    def frame_end(self):
+        self._merge_new_frames()
+        return self._ranges[-1][1]
+
+    def format_frame(self, frame):
+        """Frame formatted with padding of the sequence."""
+        return "{:0{}d}".format(frame, self.padding)
+
+    def format(self):
+        """Sequence formatted as 'head[start-end]tail'."""
+        ranges = ",".join(
+            str(start) if start == end else "{}-{}".format(start, end)
+            for start, end in self.get_ranges()
+        )
+        return "{}[{}]{}".format(self.head, ranges, self.tail)
+
+    def get_path(self, frame):
+        """Path of frame.
+
+        Args:
+            frame (int): Frame.
+
+        Returns:
+            Union[str, None]: Path of frame or None if frame is not part
+                of the sequence.
+        """
+
+        if frame not in self:
+            return None
+        return "{}{}{}".format(self.head, self.format_frame(frame), self.tail)
+
+    def get_missing_frames(self, frame_start=None, frame_end=None):
+        """Frames missing in the sequence.
+
+        Args:
+            frame_start (Optional[int]): First expected frame. First frame
+                of the sequence is used if not passed.
+            frame_end (Optional[int]): Last expected frame. Last frame of
+                the sequence is used if not passed.
+
+        Returns:
+            list[int]: Missing frames.
+        """
+
+        ranges = self.get_ranges()
+        if frame_start is None:
+            frame_start = ranges[0][0]
+        if frame_end is None:
+            frame_end = ranges[-1][1]
+
+        missing = []
+        current = frame_start
+        for start, end in ranges:
+            if start > frame_end:
+                break
+            if start > current:
+                missing.extend(range(current, start))
+            current = max(current, end + 1)
+        if current <= frame_end:
+            missing.extend(range(current, frame_end + 1))
+        return missing
+
+
+class FileSequenceIndex(object):
+    """Index of file sequences.
+
+    Files with frame are grouped into sequences by head, tail and padding,
+    files without frame are stored as remainders. Not padded frames with
+    length of padding are part of padded sequence, as 'clique.assemble'
+    would merge them.
+
+    Args:
+        pattern (Optional[re.Pattern]): Pattern matching frame of file with
+            groups 'index' and 'padding'. Frame is the last group of digits
+            in file name by default.
+    """
+
+    def __init__(self, pattern=None):
+        if pattern is None:
+            pattern = FRAME_PATTERN
+        elif not hasattr(pattern, "search"):
+            pattern = re.compile(pattern)
+        self._pattern = pattern
+        self._sequences = {}
+        self._sequences_by_head_tail = {}
+        self._remainders = []
+        self.dirpath = None
+        self.dir_mtime = None
+
+    @classmethod
+    def from_directory(cls, dirpath, pattern=None):
+        """Create index of files in directory.
+
+        Directory is scanned once, subdirectories are ignored. File names
+        without directory are indexed.
+
+        Args:
+            dirpath (str): Path to directory.
+            pattern (Optional[re.Pattern]): Pattern matching frame.
+
+        Returns:
+            FileSequenceIndex: Index of files in the directory.
+        """
+
+        index = cls(pattern)
+        index.dirpath = dirpath
+        index.dir_mtime = os.stat(dirpath).st_mtime
+        index.add_paths(
+            entry.name
+            for entry in os.scandir(dirpath)
+            if entry.is_file()
+        )
+        return index
+
+    @classmethod
+    def from_paths(cls, paths, pattern=None):
+        """Create index of paths.
+
+        Args:
+            paths (Iterable[str]): Paths or file names.
+            pattern (Optional[re.Pattern]): Pattern matching frame.
+
+        Returns:
+            FileSequenceIndex: Index of the paths.
+        """
+
+        index = cls(pattern)
+        index.add_paths(paths)
+        return index
+
+    def parse_path(self, path):
+        """Split path by frame.
+
+        Args:
+            path (str): Path or file name.
+
+        Returns:
+            Union[tuple[str, str, int, int], None]: Head, tail, padding and
+                frame or None if path does not contain frame.
+        """
+
+        match = self._pattern.search(path)
+        if match is None:
+            return None
+        index = match.group("index")
+        padding = len(index) if match.group("padding") else 0
+        return (
+            path[:match.start("index")],
+            path[match.end("index"):],
+            padding,
+            int(index)
+        )
+
+    def add_paths(self, paths):
+        """Add paths to the index.
+
+        Args:
+            paths (Iterable[str]): Paths or file names.
+        """
+
+        unpadded = []
+        for path in paths:
+            parsed = self.parse_path(path)
+            if parsed is None:
+                self._remainders.append(path)
+                continue
+
+            head, tail, padding, frame = parsed
+            if not padding:
+                unpadded.append((head, tail, frame))
+                continue
+            self._get_or_create_sequence(head, tail, padding).add_frame(frame)
+
+        for head, tail, frame in unpadded:
+            sequence = self._sequences.get((head, tail, len(str(frame))))
+            if sequence is None:
+                sequence = self._get_or_create_sequence(head, tail, 0)
+            sequence.add_frame(frame)
+
+    def _get_or_create_sequence(self, head, tail, padding):
+        key = (head, tail, padding)
+        sequence = self._sequences.get(key)
+        if sequence is None:
+            sequence = FileSequence(head, tail, padding)
+            self._sequences[key] = sequence
+            self._sequences_by_head_tail.setdefault(
+                (head, tail), []
+            ).append(sequence)
+        return sequence
+
+    @property
+    def sequences(self):
+        """All sequences in order they were found.
+
+        Returns:
+            list[FileSequence]: Sequences.
+        """
+
+        return [
+            sequence
+            for sequence in self._sequences.values()
+            if len(sequence)
+        ]
+
+    @property
+    def remainders(self):
+        """Paths without frame.
+
+        Returns:
+            list[str]: Paths.
+        """
+
+        return list(self._remainders)
+
+    def get_sequences(self, minimum_items=2):
+        """Sequences with at least minimum count of frames.
+
+        Args:
+            minimum_items (int): Minimum count of frames.
+
+        Returns:
+            list[FileSequence]: Sequences.
+        """
+
+        return [
+            sequence
+            for sequence in self.sequences
+            if len(sequence) >= minimum_items
+        ]
+
+    def get_paths(self):
+        """All indexed paths.
+
+        Returns:
+            list[str]: Paths of sequences and remainders.
+        """
+
+        output = [
+            path
+            for sequence in self.sequences
+            for path in sequence
+        ]
+        output.extend(self._remainders)
+        return output
+
+    def get_sequence(self, path):
+        """Sequence which contains path.
+
+        Args:
+            path (str): Path or file name, as added to index.
+
+        Returns:
+            Union[FileSequence, None]: Sequence or None if path is not
+                part of any sequence.
+        """
+
+        parsed = self.parse_path(path)
+        if parsed is None:
+            return None
+
+        head, tail, _, frame = parsed
+        for sequence in self._sequences_by_head_tail.get((head, tail), []):
+            if sequence.get_path(frame) == path:
+                return sequence
+        return None
+
+    def get_frame(self, path):
+        """Frame of path if path is part of a sequence.
+
+        Args:
+            path (str): Path or file name, as added to index.
+
+        Returns:
+            Union[int, None]: Frame or None.
+        """
+
+        sequence = self.get_sequence(path)
+        if sequence is None:
+            return None
+        return self.parse_path(path)[3]
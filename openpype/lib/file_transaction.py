@@ -2,6 +2,10 @@ import os
 import logging
 import sys
 import errno
+import time
+import hashlib
+import threading
+import collections
 import six
 
 from openpype.lib import create_hard_link
@@ -12,6 +16,10 @@ if sys.platform == "win32":
 else:
     from shutil import copyfile
 
+# 'FICLONE' ioctl request number used for copy-on-write clones on Linux
+#   (Btrfs, XFS with reflink support, OCFS2...)
+FICLONE = 0x40049409
+
 
 class DuplicateDestinationError(ValueError):
     """Error raised when transfer destination already exists in queue.
@@ -23,6 +31,111 @@ class DuplicateDestinationError(ValueError):
     """
 
 
+def reflink_file(src, dst):
+    """Create copy-on-write clone of file.
+
+    Clone shares data blocks with the source file so it does not cost any
+    additional space or data transfer until one of the files is modified.
+
+    Args:
+        src (str): Source file path.
+        dst (str): Destination file path.
+
+    Raises:
+        OSError: When filesystem or platform does not support reflinks or
+            clone does not have size of source.
+    """
+
+    if not sys.platform.startswith("linux"):
+        raise OSError(
+            errno.EOPNOTSUPP,
+            "Reflink is not supported on platform {}".format(sys.platform))
+
+    import fcntl
+
+    with open(src, "rb") as src_stream:
+        with open(dst, "wb") as dst_stream:
+            src_fd = src_stream.fileno()
+            dst_fd = dst_stream.fileno()
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            if os.fstat(dst_fd).st_size != os.fstat(src_fd).st_size:
+                raise OSError(
+                    errno.EIO,
+                    "Reflink of file is incomplete: {}".format(dst))
+
+
+def copy_file_range_file(src, dst):
+    """Copy file using 'copy_file_range' system call.
+
+    Data are copied by kernel without passing them through user space.
+    Filesystems may copy the data on server side (NFS 4.2, SMB) or create
+    reflink (Btrfs, XFS) instead of real copy.
+
+    Args:
+        src (str): Source file path.
+        dst (str): Destination file path.
+
+    Raises:
+        OSError: When 'copy_file_range' is not available for files or did
+            not copy whole file.
+    """
+
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        raise OSError(
+            errno.EOPNOTSUPP,
+            "'copy_file_range' is not available in this Python build")
+
+    with open(src, "rb") as src_stream:
+        with open(dst, "wb") as dst_stream:
+            src_fd = src_stream.fileno()
+            dst_fd = dst_stream.fileno()
+            remaining = os.fstat(src_fd).st_size
+            while remaining > 0:
+                copied = copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+
+            # Some filesystems stop copying early without an error
+            if remaining > 0:
+                raise OSError(
+                    errno.EIO,
+                    "'copy_file_range' did not copy whole file: {}".format(
+                        dst))
+
+
+def _get_checksum_hasher(algorithm):
+    """Create hash object for passed checksum algorithm.
+
+    Args:
+        algorithm (str): Name of algorithm. 'xxhash' uses 64-bit xxHash
+            from optional 'xxhash' module, all other values are passed to
+            'hashlib'.
+
+    Returns:
+        Any: Hash object with 'update' and 'hexdigest' methods.
+
+    Raises:
+        ValueError: When algorithm is not available.
+    """
+
+    if algorithm in ("xxhash", "xxh64"):
+        try:
+            import xxhash
+        except ImportError:
+            raise ValueError(
+                "Checksum algorithm '{}' requires 'xxhash' module".format(
+                    algorithm))
+        return xxhash.xxh64()
+
+    try:
+        return hashlib.new(algorithm)
+    except ValueError:
+        raise ValueError(
+            "Unknown checksum algorithm '{}'".format(algorithm))
+
+
 class FileTransaction(object):
     """File transaction with rollback options.
 
@@ -49,17 +162,79 @@ class FileTransaction(object):
 
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Files can be transferred in parallel by worker threads. Concurrency is
+    limited per destination root (drive, share or mount point) so multiple
+    storages can be written at the same time without flooding one of them.
+    Backup and rollback logic is the same as with sequential transfers.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for output.
+        allow_queue_replacements (Optional[bool]): Allow to replace source
+            of already queued destination.
+        workers_per_root (Optional[int]): Number of concurrent transfers per
+            destination root. Value '1' keeps sequential processing.
+        progress_callback (Optional[Callable[[Dict[str, Any]], None]]):
+            Called after each transferred file with progress information.
+        checksum_algorithm (Optional[str]): Checksum calculated while files
+            are transferred, e.g. 'sha1' or 'xxhash'. Results are available
+            in 'checksums'.
+
+    Modes 'MODE_REFLINK' and 'MODE_COPY_FILE_RANGE' fall back per file to
+    the next cheaper method if filesystem does not support them
+    (reflink -> copy_file_range -> copy). Mode which was really used for
+    each file is available in 'transfer_log'.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
-
-    def __init__(self, log=None, allow_queue_replacements=False):
+    MODE_REFLINK = 2
+    MODE_COPY_FILE_RANGE = 3
+
+    _mode_labels = {
+        MODE_COPY: "copy",
+        MODE_HARDLINK: "hardlink",
+        MODE_REFLINK: "reflink",
+        MODE_COPY_FILE_RANGE: "copy_file_range",
+    }
+
+    # Size of chunk read at once when checksum is calculated during copy
+    checksum_chunk_size = 4 * 1024 * 1024
+
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        workers_per_root=1,
+        progress_callback=None,
+        checksum_algorithm=None
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
 
+        if checksum_algorithm:
+            # Validate algorithm before any file is touched
+            _get_checksum_hasher(checksum_algorithm)
+        else:
+            checksum_algorithm = None
+
+        self._workers_per_root = max(1, int(workers_per_root or 1))
+        self._progress_callback = progress_callback
+        self._checksum_algorithm = checksum_algorithm
+
+        # Checksums of transferred files by destination path
+        self._checksums = {}
+
+        # Source, destination and really used mode of transferred files
+        self._transfer_log = []
+
+        # Progress information
+        self._lock = threading.Lock()
+        self._progress = {}
+        self._root_by_dirpath = {}
+
         # The transfer queue
         # todo: make this an actual FIFO queue?
         self._transfers = {}
@@ -78,7 +253,8 @@ class FileTransaction(object):
         Args:
             src (str): Source path.
             dst (str): Destination path.
-            mode (MODE_COPY, MODE_HARDLINK): Transfer mode.
+            mode (MODE_COPY, MODE_HARDLINK, MODE_REFLINK,
+                MODE_COPY_FILE_RANGE): Transfer mode.
         """
 
         opts = {"mode": mode}
@@ -125,7 +301,7 @@ class FileTransaction(object):
                 "Backup existing file: {} -> {}".format(dst, backup))
             os.rename(dst, backup)
 
-        # Copy the files to transfer
+        transfers = []
         for dst, (src, opts) in self._transfers.items():
             path_same = self._same_paths(src, dst)
             if path_same:
@@ -133,18 +309,279 @@ class FileTransaction(object):
                     "Source and destination are same files {} -> {}".format(
                         src, dst))
                 continue
+            transfers.append((src, dst, opts))
+
+        self._reset_progress(transfers)
+
+        # Copy the files to transfer
+        if self._workers_per_root > 1 and len(transfers) > 1:
+            self._process_parallel(transfers)
+            return
 
-            self._create_folder_for_file(dst)
+        for src, dst, opts in transfers:
+            self._transfer_file(src, dst, opts)
 
-            if opts["mode"] == self.MODE_COPY:
+    def _process_parallel(self, transfers):
+        """Transfer files using worker threads.
+
+        Each destination root has its own pool of workers. When any transfer
+        fails, transfers that did not start yet are cancelled and the first
+        error is raised after running transfers are finished, so rollback
+        knows about every created file.
+
+        Args:
+            transfers (List[Tuple[str, str, Dict[str, Any]]]): Source,
+                destination and options of each transfer.
+        """
+
+        from concurrent.futures import (
+            ThreadPoolExecutor,
+            wait,
+            FIRST_EXCEPTION,
+        )
+
+        transfers_by_root = collections.OrderedDict()
+        for transfer in transfers:
+            root = self._get_destination_root(transfer[1])
+            transfers_by_root.setdefault(root, []).append(transfer)
+
+        self.log.debug((
+            "Transferring {} files to {} destination root/s"
+            " with {} worker/s per root"
+        ).format(
+            len(transfers), len(transfers_by_root), self._workers_per_root
+        ))
+
+        executors = []
+        futures = []
+        try:
+            for root_transfers in transfers_by_root.values():
+                executor = ThreadPoolExecutor(
+                    max_workers=min(
+                        self._workers_per_root, len(root_transfers)
+                    )
+                )
+                executors.append(executor)
+                for src, dst, opts in root_transfers:
+                    futures.append(
+                        executor.submit(self._transfer_file, src, dst, opts)
+                    )
+
+            _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+
+        for future in futures:
+            if future.cancelled():
+                continue
+            exc = future.exception()
+            if exc is not None:
+                raise exc
+
+    def _transfer_file(self, src, dst, opts):
+        self._create_folder_for_file(dst)
+
+        checksum = None
+        used_mode = opts["mode"]
+        try:
+            if used_mode in (self.MODE_REFLINK, self.MODE_COPY_FILE_RANGE):
+                used_mode = self._clone_file(src, dst, used_mode)
+
+            if used_mode == self.MODE_COPY:
                 self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
+                if self._checksum_algorithm:
+                    checksum = self._copy_with_checksum(src, dst)
+                else:
+                    copyfile(src, dst)
+
+            elif used_mode == self.MODE_HARDLINK:
                 self.log.debug("Hardlinking file ... {} -> {}".format(
                     src, dst))
                 create_hard_link(src, dst)
 
+        except BaseException:
+            # Destination is not in transferred files so rollback would not
+            #   remove partially written file
+            self._remove_incomplete_file(dst)
+            raise
+
+        if checksum is None and self._checksum_algorithm:
+            checksum = self._calculate_checksum(src)
+
+        with self._lock:
             self._transferred.append(dst)
+            self._transfer_log.append(
+                (src, dst, self._mode_labels[used_mode])
+            )
+            if checksum is not None:
+                self._checksums[dst] = checksum
+
+        self._update_progress(src, dst)
+
+    def _clone_file(self, src, dst, mode):
+        """Transfer file with reflink or copy_file_range.
+
+        Methods are tried from requested mode to cheaper ones. Mode
+        'MODE_COPY' is returned if none of them is supported and the file
+        must be copied.
+
+        Args:
+            src (str): Source path.
+            dst (str): Destination path.
+            mode (int): 'MODE_REFLINK' or 'MODE_COPY_FILE_RANGE'.
+
+        Returns:
+            int: Mode that was used for the transfer.
+        """
+
+        methods = [(self.MODE_COPY_FILE_RANGE, copy_file_range_file)]
+        if mode == self.MODE_REFLINK:
+            methods.insert(0, (self.MODE_REFLINK, reflink_file))
+
+        for method_mode, func in methods:
+            label = self._mode_labels[method_mode]
+            self.log.debug("Transferring file using {} ... {} -> {}".format(
+                label, src, dst))
+            try:
+                func(src, dst)
+                return method_mode
+
+            except (OSError, IOError) as exc:
+                self.log.debug(
+                    "Transfer using {} failed ({}). Trying fallback.".format(
+                        label, exc))
+                self._remove_incomplete_file(dst)
+
+        return self.MODE_COPY
+
+    def _remove_incomplete_file(self, path):
+        if not os.path.exists(path):
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            self.log.warning(
+                "Failed to remove incomplete file {}".format(path),
+                exc_info=True
+            )
+
+    def _copy_with_checksum(self, src, dst):
+        hasher = _get_checksum_hasher(self._checksum_algorithm)
+        chunk_size = self.checksum_chunk_size
+        with open(src, "rb") as src_stream:
+            with open(dst, "wb") as dst_stream:
+                while True:
+                    chunk = src_stream.read(chunk_size)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    dst_stream.write(chunk)
+        return hasher.hexdigest()
+
+    def _calculate_checksum(self, path):
+        hasher = _get_checksum_hasher(self._checksum_algorithm)
+        chunk_size = self.checksum_chunk_size
+        with open(path, "rb") as stream:
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _reset_progress(self, transfers):
+        total_bytes = 0
+        if self._progress_callback is not None:
+            for src, _, _ in transfers:
+                try:
+                    total_bytes += os.path.getsize(src)
+                except OSError:
+                    pass
+
+        self._progress = {
+            "start_time": time.time(),
+            "total_files": len(transfers),
+            "total_bytes": total_bytes,
+            "transferred_files": 0,
+            "transferred_bytes": 0,
+        }
+
+    def _update_progress(self, src, dst):
+        if self._progress_callback is None:
+            return
+
+        try:
+            size = os.path.getsize(src)
+        except OSError:
+            size = 0
+
+        with self._lock:
+            self._progress["transferred_files"] += 1
+            self._progress["transferred_bytes"] += size
+            elapsed = time.time() - self._progress["start_time"]
+            throughput = 0.0
+            if elapsed > 0:
+                throughput = self._progress["transferred_bytes"] / elapsed
+
+            progress = {
+                "src": src,
+                "dst": dst,
+                "transferred_files": self._progress["transferred_files"],
+                "total_files": self._progress["total_files"],
+                "transferred_bytes": self._progress["transferred_bytes"],
+                "total_bytes": self._progress["total_bytes"],
+                "elapsed": elapsed,
+                "throughput": throughput,
+            }
+
+        try:
+            self._progress_callback(progress)
+        except Exception:
+            self.log.warning(
+                "Failed to process transfer progress callback.",
+                exc_info=True)
+
+    def _get_destination_root(self, path):
+        """Root of destination path used to limit concurrency.
+
+        Drive letter or UNC share is used on Windows, mount point of
+        the closest existing parent directory on other platforms.
+
+        Args:
+            path (str): Destination file path.
+
+        Returns:
+            str: Destination root.
+        """
+
+        drive, _ = os.path.splitdrive(path)
+        if drive:
+            return drive.lower()
+
+        dirpath = os.path.dirname(path)
+        root = self._root_by_dirpath.get(dirpath)
+        if root is not None:
+            return root
+
+        root = dirpath
+        while not os.path.exists(root):
+            parent = os.path.dirname(root)
+            if parent == root:
+                break
+            root = parent
+
+        while not os.path.ismount(root):
+            parent = os.path.dirname(root)
+            if parent == root:
+                break
+            root = parent
+
+        self._root_by_dirpath[dirpath] = root
+        return root
 
     def finalize(self):
         # Delete any backed up files
@@ -195,6 +632,16 @@ class FileTransaction(object):
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
+    @property
+    def transfer_log(self):
+        """Return source, destination and used mode name of transfers"""
+        return list(self._transfer_log)
+
+    @property
+    def checksums(self):
+        """Return checksums of transferred files by destination path"""
+        return dict(self._checksums)
+
     def _create_folder_for_file(self, path):
         dirname = os.path.dirname(path)
         try:
@@ -24,6 +24,11 @@ import traceback
 import threading
 import copy
 
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
 from openpype import AYON_SERVER_ENABLED
 from openpype.client.mongo import (
     MongoEnvNotSet,
@@ -182,6 +187,178 @@ class MongoFormatter(logging.Formatter):
         return document
 
 
+class QueuedMongoHandler(MongoHandler):
+    """Mongo handler which writes records in background thread.
+
+    Records are formatted in thread where they were logged and put to
+    a queue. Background thread inserts them to database with 'insert_many'
+    when 'batch_size' records are collected or each 'flush_interval'
+    seconds.
+
+    When queue is full records with level lower than WARNING are dropped
+    immediately, other records wait up to 'full_queue_timeout' seconds for
+    a free slot. Count of dropped records is stored to database as
+    a warning record once queue has a space again.
+
+    Args:
+        batch_size (int): Maximum count of records in one insert.
+        flush_interval (float): Seconds between inserts of collected records.
+        queue_size (int): Maximum count of records waiting for insert.
+        full_queue_timeout (float): Seconds how long WARNING and higher
+            records wait for free slot in full queue.
+    """
+
+    def __init__(
+        self,
+        batch_size=100,
+        flush_interval=0.5,
+        queue_size=10000,
+        full_queue_timeout=0.1,
+        **kwargs
+    ):
+        super(QueuedMongoHandler, self).__init__(**kwargs)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.full_queue_timeout = full_queue_timeout
+        self.dropped_count = 0
+
+        self._queue = queue.Queue(queue_size)
+        self._dropped_lock = threading.Lock()
+        self._dropped_since_insert = 0
+        self._flush_requests = queue.Queue()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._process_queue, name="QueuedMongoHandler"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def emit(self, record):
+        try:
+            document = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        try:
+            if record.levelno < logging.WARNING:
+                self._queue.put_nowait(document)
+            else:
+                self._queue.put(document, timeout=self.full_queue_timeout)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped_count += 1
+                self._dropped_since_insert += 1
+
+    def flush(self, timeout=5.0):
+        """Wait until records logged so far are stored."""
+        if not self._thread.is_alive():
+            return
+        flushed = threading.Event()
+        self._flush_requests.put(flushed)
+        flushed.wait(timeout)
+
+    def close(self):
+        """Store queued records and stop background thread."""
+        self._stopped.set()
+        self._thread.join(5.0)
+        # Store what is left if thread did not finish in time
+        self._insert_documents(self._get_queued_documents())
+        super(QueuedMongoHandler, self).close()
+
+    def _get_queued_documents(self, limit=None):
+        documents = []
+        while limit is None or len(documents) < limit:
+            try:
+                documents.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return documents
+
+    def _get_dropped_document(self):
+        with self._dropped_lock:
+            dropped_count = self._dropped_since_insert
+            self._dropped_since_insert = 0
+
+        if not dropped_count:
+            return None
+        document = {
+            "timestamp": datetime.datetime.now(),
+            "level": "WARNING",
+            "thread": threading.current_thread().ident,
+            "threadName": threading.current_thread().name,
+            "message": (
+                "Log queue was full, {} records were dropped."
+            ).format(dropped_count),
+            "loggerName": self.__class__.__name__,
+            "fileName": __file__,
+            "module": __name__,
+            "method": "emit",
+            "lineNumber": 0
+        }
+        document.update(Logger.get_process_data())
+        return document
+
+    def _insert_documents(self, documents):
+        dropped_document = self._get_dropped_document()
+        if dropped_document is not None:
+            documents.append(dropped_document)
+
+        if not documents or self.collection is None:
+            return
+
+        try:
+            self.collection.insert_many(documents, ordered=False)
+        except Exception:
+            if not self.fail_silently:
+                sys.stderr.write(
+                    "Failed to store {} log records to mongo.\n{}".format(
+                        len(documents), traceback.format_exc()
+                    )
+                )
+
+    def _process_queue(self):
+        while not self._stopped.is_set():
+            documents = []
+            deadline = time.time() + self.flush_interval
+            flush_events = []
+            while len(documents) < self.batch_size:
+                try:
+                    flush_events.append(self._flush_requests.get_nowait())
+                    break
+                except queue.Empty:
+                    pass
+
+                remaining = deadline - time.time()
+                if remaining <= 0 or self._stopped.is_set():
+                    break
+                try:
+                    documents.append(
+                        self._queue.get(timeout=min(remaining, 0.05))
+                    )
+                except queue.Empty:
+                    pass
+
+            if flush_events or self._stopped.is_set():
+                # Take everything what is in queue
+                documents.extend(self._get_queued_documents())
+
+            while documents:
+                self._insert_documents(documents[:self.batch_size])
+                documents = documents[self.batch_size:]
+
+            for flush_event in flush_events:
+                flush_event.set()
+
+        self._insert_documents(self._get_queued_documents())
+        # Release waiting flush requests
+        while True:
+            try:
+                self._flush_requests.get_nowait().set()
+            except queue.Empty:
+                break
+
+
 class Logger:
     DFT = '%(levelname)s >>> { %(name)s }: [ %(message)s ] '
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -198,6 +375,15 @@ class Logger:
         logging.CRITICAL: CRI,
     }
 
+    # Mongo handler shared by all loggers
+    _mongo_handler = None
+    # Records stored to mongo in one insert
+    mongo_log_batch_size = 100
+    # Seconds between inserts of logged records
+    mongo_log_flush_interval = 0.5
+    # Maximum count of records waiting for insert
+    mongo_log_queue_size = 10000
+
     # Is static class initialized
     bootstraped = False
     initialized = False
@@ -285,6 +471,9 @@ class Logger:
         if not cls.use_mongo_logging:
             return
 
+        if cls._mongo_handler is not None:
+            return cls._mongo_handler
+
         components = get_default_components()
         kwargs = {
             "host": components["host"],
@@ -300,7 +489,13 @@ class Logger:
         if components["auth_db"]:
             kwargs["authentication_db"] = components["auth_db"]
 
-        return MongoHandler(**kwargs)
+        cls._mongo_handler = QueuedMongoHandler(
+            batch_size=cls.mongo_log_batch_size,
+            flush_interval=cls.mongo_log_flush_interval,
+            queue_size=cls.mongo_log_queue_size,
+            **kwargs
+        )
+        return cls._mongo_handler
 
     @classmethod
     def _get_console_handler(cls):
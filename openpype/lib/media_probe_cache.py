@@ -0,0 +1,186 @@
+"""Cache of media probe outputs (oiiotool info, ffprobe).
+
+Probing the same file multiple times during publishing starts a new
+subprocess each time. Output of probe command is cached by path,
+modification time and size of the file so changed files are probed again.
+
+Cache lives in memory of the process. It can be also stored to a directory
+set in 'OPENPYPE_MEDIA_PROBE_CACHE_DIR' environment variable so publishes
+of the same staging files can reuse it.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+import collections
+
+CACHE_DIR_ENV_KEY = "OPENPYPE_MEDIA_PROBE_CACHE_DIR"
+
+
+class MediaProbeCache(object):
+    """Outputs of probe commands by file state.
+
+    Args:
+        max_size (int): Maximum count of outputs kept in memory.
+        cache_dir (Optional[str]): Directory where outputs are persisted.
+    """
+
+    def __init__(self, max_size=10000, cache_dir=None):
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def get_key(probe_name, filepath, args=None):
+        """Key of file probe based on it's current state.
+
+        Args:
+            probe_name (str): Name of probe e.g. 'oiio_info'.
+            filepath (str): Path to probed file.
+            args (Optional[Iterable[str]]): Arguments changing output
+                of probe.
+
+        Returns:
+            Union[tuple, None]: Key or None if file is not available.
+        """
+        try:
+            stat = os.stat(filepath)
+        except (OSError, TypeError, ValueError):
+            return None
+        return (
+            probe_name,
+            os.path.normcase(os.path.abspath(filepath)),
+            stat.st_mtime_ns,
+            stat.st_size,
+            tuple(args or ())
+        )
+
+    def _get_disk_path(self, key):
+        cache_dir = self.cache_dir
+        if not cache_dir:
+            return None
+        key_hash = hashlib.sha1(
+            json.dumps(key).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(cache_dir, key_hash + ".json")
+
+    def get(self, key):
+        """Cached output.
+
+        Returns:
+            Union[str, None]: Output or None if is not cached.
+        """
+        if key is None:
+            return None
+
+        with self._lock:
+            output = self._items.get(key)
+            if output is not None:
+                self._items.move_to_end(key)
+                self._hits += 1
+                return output
+
+        output = self._read_from_disk(key)
+        with self._lock:
+            if output is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._set(key, output)
+        return output
+
+    def set(self, key, output):
+        if key is None:
+            return
+        with self._lock:
+            self._set(key, output)
+        self._write_to_disk(key, output)
+
+    def _set(self, key, output):
+        self._items[key] = output
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def _read_from_disk(self, key):
+        path = self._get_disk_path(key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            return None
+        # Compare keys to be sure it's not a hash collision
+        if data.get("key") != json.loads(json.dumps(key)):
+            return None
+        return data.get("output")
+
+    def _write_to_disk(self, key, output):
+        path = self._get_disk_path(key)
+        if not path:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to temp file first so other processes never read
+            #   partially written file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            with os.fdopen(fd, "w") as stream:
+                json.dump({"key": key, "output": output}, stream)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """Clear outputs in memory and reset counters."""
+        with self._lock:
+            self._items.clear()
+            self._hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+
+    def info(self):
+        """Cache statistics.
+
+        Returns:
+            dict[str, int]: Hits in memory and on disk, misses and count of
+                probe subprocesses which were not launched thanks to cache.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "avoided_launches": self._hits + self._disk_hits,
+                "size": len(self._items),
+            }
+
+
+_media_probe_cache = MediaProbeCache(
+    cache_dir=os.environ.get(CACHE_DIR_ENV_KEY) or None
+)
+
+
+def get_media_probe_cache():
+    """Process wide cache of media probe outputs.
+
+    Returns:
+        MediaProbeCache: Cache object.
+    """
+    return _media_probe_cache
+
+
+def get_media_probe_cache_info():
+    """Statistics of process wide media probe cache."""
+    return _media_probe_cache.info()
+
+
+def clear_media_probe_cache():
+    """Clear process wide media probe cache."""
+    _media_probe_cache.clear()
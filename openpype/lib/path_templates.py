@@ -2,6 +2,7 @@ import os
 import re
 import copy
 import numbers
+import threading
 import collections
 
 import six
@@ -11,6 +12,9 @@ KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
 
+# Maximum number of parsed templates kept in process-wide cache
+TEMPLATES_CACHE_SIZE = 4096
+
 
 def merge_dict(main_dict, enhance_dict):
     """Merges dictionaries by keys.
@@ -38,6 +42,82 @@ def merge_dict(main_dict, enhance_dict):
     return main_dict
 
 
+class CompiledTemplatesCache(object):
+    """Thread safe LRU cache with hit and miss counters.
+
+    Used to store parsed templates so the same template string is parsed
+    only once per process.
+
+    Args:
+        max_size (int): Maximum number of cached items.
+    """
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                self._misses += 1
+                return default
+            self._hits += 1
+            value = self._items.pop(key)
+            # Move item to the end of queue
+            self._items[key] = value
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self):
+        """Cache statistics.
+
+        Returns:
+            dict[str, int]: Hits, misses, current and maximum size.
+        """
+
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._items),
+                "max_size": self._max_size,
+            }
+
+
+_compiled_templates_cache = CompiledTemplatesCache(TEMPLATES_CACHE_SIZE)
+
+
+def get_templates_cache_info():
+    """Statistics of process-wide cache of parsed templates.
+
+    Returns:
+        dict[str, int]: Hits, misses, current and maximum size.
+    """
+
+    return _compiled_templates_cache.info()
+
+
+def clear_templates_cache():
+    """Clear process-wide cache of parsed templates."""
+
+    _compiled_templates_cache.clear()
+
+
 class TemplateMissingKey(Exception):
     """Exception for cases when key does not exist in template."""
 
@@ -89,6 +169,30 @@ class StringTemplate(object):
             ))
 
         self._template = template
+        self._parts = self._get_compiled_parts(template)
+
+    @classmethod
+    def _get_compiled_parts(cls, template):
+        """Parsed parts of template from process-wide cache.
+
+        Parts are not modified during formatting so they can be shared
+        between all objects using the same template string.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            list[Union[str, FormattingPart, OptionalPart]]: Template parts.
+        """
+
+        parts = _compiled_templates_cache.get(template)
+        if parts is None:
+            parts = cls._compile_parts(template)
+            _compiled_templates_cache.set(template, parts)
+        return parts
+
+    @classmethod
+    def _compile_parts(cls, template):
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -119,7 +223,7 @@ class StringTemplate(object):
             if substr:
                 new_parts.append(substr)
 
-        self._parts = self.find_optional_parts(new_parts)
+        return cls.find_optional_parts(new_parts)
 
     def __str__(self):
         return self.template
@@ -182,6 +286,28 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def format_many(self, data_iterable, strict=False):
+        """Format template with each item of data.
+
+        Faster way how to fill e.g. all frames of sequence with the same
+        template.
+
+        Args:
+            data_iterable (Iterable[dict]): Formatting data items.
+            strict (bool): Validate that each result is solved.
+
+        Returns:
+            list[TemplateResult]: Results in order of data items.
+        """
+
+        output = []
+        for data in data_iterable:
+            result = self.format(data)
+            if strict:
+                result.validate()
+            output.append(result)
+        return output
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -355,7 +481,8 @@ class TemplatesDict(object):
                 will raise exceptions with explaned error.
         """
         # Create a copy of inserted data
-        data = copy.deepcopy(in_data)
+        #   - formatting does not modify data so shallow copy is enough
+        data = dict(in_data)
 
         # Add environment variable to data
         if only_keys is False:
@@ -370,6 +497,52 @@ class TemplatesDict(object):
         output.strict = strict
         return output
 
+    def get_template_by_keys(self, template_keys):
+        """Objected template by hierarchy of keys.
+
+        Args:
+            template_keys (Iterable[str]): Keys to template,
+                e.g. ("publish", "path").
+
+        Returns:
+            StringTemplate: Template object.
+
+        Raises:
+            TemplateMissingKey: When template is not available.
+        """
+
+        value = self.objected_templates
+        used_keys = []
+        for key in template_keys:
+            used_keys.append(key)
+            if not isinstance(value, dict) or key not in value:
+                raise TemplateMissingKey(used_keys)
+            value = value[key]
+
+        if not isinstance(value, StringTemplate):
+            raise TemplateMissingKey(used_keys)
+        return value
+
+    def format_many(self, template_keys, data_iterable, strict=True):
+        """Format single template with multiple data items.
+
+        Unlike 'format' are other templates ignored and result is not
+        wrapped into 'TemplatesResultDict' for each data item. Useful to
+        fill paths of all frames in a sequence.
+
+        Args:
+            template_keys (Iterable[str]): Keys to template,
+                e.g. ("publish", "path").
+            data_iterable (Iterable[dict]): Formatting data items.
+            strict (bool): Validate that each result is solved.
+
+        Returns:
+            list[TemplateResult]: Results in order of data items.
+        """
+
+        template = self.get_template_by_keys(template_keys)
+        return template.format_many(data_iterable, strict)
+
 
 class TemplateResult(str):
     """Result of template format with most of information in.
@@ -3,7 +3,7 @@ import re
 import logging
 import platform
 
-import clique
+from .file_sequences import FileSequenceIndex, DOT_FRAME_PATTERN
 
 log = logging.getLogger(__name__)
 
@@ -68,8 +68,8 @@ def create_hard_link(src_path, dst_path):
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
-    Uses clique as most precise solution, used when anatomy template that
-    created files is not known.
+    Uses the same frame pattern as 'clique.PATTERNS["frames"]', used when
+    anatomy template that created files is not known.
 
     Assumption is that frames are separated by '.', negative frames are not
     allowed.
@@ -81,23 +81,19 @@ def collect_frames(files):
         (dict): {'/asset/subset_v001.0001.png': '0001', ....}
     """
 
-    patterns = [clique.PATTERNS["frames"]]
-    collections, remainder = clique.assemble(
-        files, minimum_items=1, patterns=patterns)
+    index = FileSequenceIndex.from_paths(files, DOT_FRAME_PATTERN)
+    sequences = index.sequences
 
     sources_and_frames = {}
-    if collections:
-        for collection in collections:
-            src_head = collection.head
-            src_tail = collection.tail
-
-            for index in collection.indexes:
-                src_frame = collection.format("{padding}") % index
+    if sequences:
+        for sequence in sequences:
+            for frame in sequence.frames:
+                src_frame = sequence.format_frame(frame)
                 src_file_name = "{}{}{}".format(
-                    src_head, src_frame, src_tail)
+                    sequence.head, src_frame, sequence.tail)
                 sources_and_frames[src_file_name] = src_frame
     else:
-        sources_and_frames[remainder.pop()] = None
+        sources_and_frames[index.remainders.pop()] = None
 
     return sources_and_frames
 
@@ -4,6 +4,7 @@ import types
 import importlib
 import inspect
 import logging
+import threading
 
 import six
 
@@ -45,11 +46,138 @@ def import_filepath(filepath, module_name=None):
     return module
 
 
-def modules_from_path(folder_path):
+def _get_module_name(filepath, module_name):
+    if module_name is None:
+        module_name = os.path.splitext(os.path.basename(filepath))[0]
+    # Make sure it is not 'unicode' in Python 2
+    return str(module_name)
+
+
+def _compile_filepath(filepath, module_name):
+    """Compiled code of python file."""
+    if six.PY3:
+        # Loader uses bytecode cache of the file if available
+        module_loader = importlib.machinery.SourceFileLoader(
+            module_name, filepath
+        )
+        return module_loader.get_code(module_name)
+
+    with open(filepath) as _stream:
+        return compile(_stream.read(), filepath, "exec")
+
+
+class ImportedFilesCache(object):
+    """Modules imported from python files, reused until the file changes.
+
+    File is executed again only when its modification time or size changed.
+    Unchanged files return the module from previous import, so its classes
+    are reused and are the same objects for all consumers. Attributes set
+    on them (e.g. plugin settings) are applied again by each discovery.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = {}
+        self._hits = 0
+        self._imports = 0
+
+    @staticmethod
+    def _get_file_state(filepath):
+        stat = os.stat(filepath)
+        return (getattr(stat, "st_mtime_ns", stat.st_mtime), stat.st_size)
+
+    def import_filepath(self, filepath, module_name=None, force=False):
+        """Import python file or return module from previous import.
+
+        Args:
+            filepath (str): Path to python file.
+            module_name (Optional[str]): Name of loaded module.
+            force (Optional[bool]): Execute the file even if it did not
+                change.
+
+        Returns:
+            tuple[types.ModuleType, bool]: Module and if it was reused
+                from cache.
+        """
+        module_name = _get_module_name(filepath, module_name)
+        key = (os.path.normpath(filepath), module_name)
+        file_state = self._get_file_state(filepath)
+        with self._lock:
+            item = self._items.get(key)
+            if not force and item is not None and item[0] == file_state:
+                self._hits += 1
+                return item[1], True
+
+        code = _compile_filepath(filepath, module_name)
+        module = types.ModuleType(module_name)
+        module.__file__ = filepath
+        six.exec_(code, module.__dict__)
+
+        with self._lock:
+            self._imports += 1
+            self._items[key] = (file_state, module)
+        return module, False
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._hits = 0
+            self._imports = 0
+
+    def info(self):
+        """Cache statistics.
+
+        Returns:
+            dict[str, int]: Count of reused and executed files and size
+                of cache.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "imports": self._imports,
+                "size": len(self._items),
+            }
+
+
+_imported_files_cache = ImportedFilesCache()
+
+
+def import_filepath_cached(filepath, module_name=None, force=False):
+    """Import python file using process wide cache of imported files.
+
+    Args:
+        filepath (str): Path to python file.
+        module_name (Optional[str]): Name of loaded module.
+        force (Optional[bool]): Execute the file even if it did not change.
+
+    Returns:
+        tuple[types.ModuleType, bool]: Module and if it was reused
+            from cache.
+    """
+    return _imported_files_cache.import_filepath(
+        filepath, module_name, force
+    )
+
+
+def get_imported_files_cache_info():
+    """Statistics of process wide cache of imported files."""
+    return _imported_files_cache.info()
+
+
+def clear_imported_files_cache():
+    """Clear process wide cache of imported files."""
+    _imported_files_cache.clear()
+
+
+def modules_from_path(folder_path, use_cache=False, force=False):
     """Get python scripts as modules from a path.
 
     Arguments:
         path (str): Path to folder containing python scripts.
+        use_cache (Optional[bool]): Reuse modules of files which did
+            not change since previous import.
+        force (Optional[bool]): Execute files even if they did not change.
+            Cache is updated with new modules.
 
     Returns:
         tuple<list, list>: First list contains successfully imported modules
@@ -89,7 +217,12 @@ def modules_from_path(folder_path):
             continue
 
         try:
-            module = import_filepath(full_path, mod_name)
+            if use_cache:
+                module, _ = import_filepath_cached(
+                    full_path, mod_name, force
+                )
+            else:
+                module = import_filepath(full_path, mod_name)
             modules.append((full_path, module))
 
         except Exception:
@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""Profiling of OpenPype process startup.
+
+Profiler is enabled with '--profile-startup' argument (or
+'OPENPYPE_PROFILE_STARTUP' environment variable) of 'start.py'. It records
+import time of each imported module, same values as python's
+'-X importtime' would print, and durations of named startup phases. Report
+is stored to a json file when process ends.
+
+Module must not import anything from OpenPype. It is loaded by 'start.py'
+from file before OpenPype is bootstrapped, so the running profiler is
+passed to this module of the bootstrapped version with
+'set_startup_profiler'.
+"""
+import os
+import sys
+import json
+import time
+import atexit
+import tempfile
+import threading
+import contextlib
+import collections
+
+try:
+    import _frozen_importlib as _bootstrap
+except ImportError:
+    from importlib import _bootstrap
+
+PROFILE_STARTUP_ARG = "--profile-startup"
+PROFILE_STARTUP_ENV_KEY = "OPENPYPE_PROFILE_STARTUP"
+
+_IMPORTTIME_PREFIX = "import time:"
+
+_startup_profiler = None
+
+
+def _import_record(name, self_us, cumulative_us, depth):
+    return {
+        "name": name,
+        "self_us": self_us,
+        "cumulative_us": cumulative_us,
+        "depth": depth,
+    }
+
+
+def parse_importtime_output(output):
+    """Parse output of python executed with '-X importtime'.
+
+    Lines which are not import time lines are skipped, so whole stderr of
+    the process can be passed in.
+
+    Args:
+        output (str): Output of the process.
+
+    Returns:
+        list[dict[str, Any]]: Import records in order of import finish
+            with keys 'name', 'self_us', 'cumulative_us' and 'depth'.
+    """
+
+    records = []
+    for line in output.splitlines():
+        if not line.startswith(_IMPORTTIME_PREFIX):
+            continue
+        parts = line[len(_IMPORTTIME_PREFIX):].split("|", 2)
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, name = parts
+        try:
+            self_us = int(self_us)
+            cumulative_us = int(cumulative_us)
+        except ValueError:
+            # Header line 'self [us] | cumulative | imported package'
+            continue
+
+        # Name is separated by single space and indented by 2 spaces
+        #   for each nested import
+        name = name[1:]
+        stripped_name = name.lstrip(" ")
+        depth = (len(name) - len(stripped_name)) // 2
+        records.append(
+            _import_record(stripped_name, self_us, cumulative_us, depth)
+        )
+    return records
+
+
+def aggregate_import_records(records, top=20):
+    """Aggregate import records to summary used in report.
+
+    Args:
+        records (list[dict[str, Any]]): Import records.
+        top (int): How many slowest modules should be listed.
+
+    Returns:
+        dict[str, Any]: Total import time, import time of top level
+            packages and the slowest modules.
+    """
+
+    by_package = collections.defaultdict(int)
+    total_us = 0
+    for record in records:
+        total_us += record["self_us"]
+        by_package[record["name"].split(".")[0]] += record["self_us"]
+
+    slowest = sorted(
+        records, key=lambda item: item["self_us"], reverse=True
+    )[:top]
+    return {
+        "modules_count": len(records),
+        "total_us": total_us,
+        "by_package": [
+            {"name": name, "self_us": value}
+            for name, value in sorted(
+                by_package.items(), key=lambda item: item[1], reverse=True
+            )
+        ],
+        "slowest": slowest,
+    }
+
+
+class ImportTimeRecorder(object):
+    """Record import time of modules imported by the process.
+
+    Wraps '_find_and_load' of import machinery which is called only when
+    module is not yet in 'sys.modules', same place where python measures
+    '-X importtime'.
+    """
+
+    def __init__(self):
+        self.records = []
+        self._local = threading.local()
+        self._orig_find_and_load = None
+
+    def is_running(self):
+        return self._orig_find_and_load is not None
+
+    def _get_stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def start(self):
+        if self.is_running():
+            return
+
+        orig_find_and_load = _bootstrap._find_and_load
+        self._orig_find_and_load = orig_find_and_load
+
+        def _find_and_load(name, *args, **kwargs):
+            stack = self._get_stack()
+            depth = len(stack)
+            # Cumulative time of nested imports
+            stack.append(0)
+            start = time.perf_counter()
+            try:
+                return orig_find_and_load(name, *args, **kwargs)
+            finally:
+                cumulative = time.perf_counter() - start
+                nested = stack.pop()
+                if stack:
+                    stack[-1] += cumulative
+                self.records.append(_import_record(
+                    name,
+                    int((cumulative - nested) * 1000000),
+                    int(cumulative * 1000000),
+                    depth
+                ))
+
+        _bootstrap._find_and_load = _find_and_load
+
+    def stop(self):
+        if self.is_running():
+            _bootstrap._find_and_load = self._orig_find_and_load
+            self._orig_find_and_load = None
+
+
+class StartupProfiler(object):
+    """Import times and phase durations of process startup.
+
+    Args:
+        output_path (Optional[str]): Path to json report. Report is stored
+            to temp directory if not passed.
+    """
+
+    def __init__(self, output_path=None):
+        if not output_path:
+            output_path = os.path.join(
+                tempfile.gettempdir(),
+                "openpype_startup_{}_{}.json".format(
+                    time.strftime("%Y%m%d%H%M%S"), os.getpid()
+                )
+            )
+        self.output_path = os.path.abspath(output_path)
+        self._start_time = time.perf_counter()
+        self._phases = collections.OrderedDict()
+        self._import_recorder = ImportTimeRecorder()
+        self._report_written = False
+
+    def start(self):
+        """Start recording of imports and register report on exit."""
+
+        self._import_recorder.start()
+        atexit.register(self._on_exit)
+
+    def _on_exit(self):
+        self._import_recorder.stop()
+        if self._report_written:
+            return
+        try:
+            self.write_report()
+        except Exception as exc:
+            sys.stderr.write(
+                "Failed to write startup profile: {}\n".format(exc)
+            )
+            return
+        sys.stderr.write(
+            "Startup profile stored to: {}\n".format(self.output_path)
+        )
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Measure duration of a startup phase.
+
+        Phase can be entered multiple times, count and total duration are
+        stored.
+
+        Args:
+            name (str): Name of phase.
+        """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            phase = self._phases.get(name)
+            if phase is None:
+                phase = {
+                    "name": name,
+                    "count": 0,
+                    "total_s": 0.0,
+                    "first_start_s": start - self._start_time,
+                }
+                self._phases[name] = phase
+            phase["count"] += 1
+            phase["total_s"] += end - start
+
+    def get_report(self, top=20):
+        """Report data.
+
+        Args:
+            top (int): How many slowest modules should be listed.
+
+        Returns:
+            dict[str, Any]: Report with phases and import times.
+        """
+
+        return {
+            "pid": os.getpid(),
+            "argv": list(sys.argv),
+            "total_s": time.perf_counter() - self._start_time,
+            "phases": [dict(phase) for phase in self._phases.values()],
+            "imports": aggregate_import_records(
+                self._import_recorder.records, top
+            ),
+        }
+
+    def write_report(self, output_path=None):
+        """Write report to json file.
+
+        Args:
+            output_path (Optional[str]): Output path. Path passed on
+                initialization is used if not passed.
+
+        Returns:
+            str: Path to the report.
+        """
+
+        if output_path is None:
+            output_path = self.output_path
+        dirpath = os.path.dirname(output_path)
+        if dirpath and not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        with open(output_path, "w") as stream:
+            json.dump(self.get_report(), stream, indent=4)
+        if output_path == self.output_path:
+            self._report_written = True
+        return output_path
+
+
+def start_startup_profiler(output_path=None):
+    """Create, start and register startup profiler of the process.
+
+    Args:
+        output_path (Optional[str]): Path to json report.
+
+    Returns:
+        StartupProfiler: Running profiler.
+    """
+
+    profiler = get_startup_profiler()
+    if profiler is None:
+        profiler = StartupProfiler(output_path)
+        profiler.start()
+        set_startup_profiler(profiler)
+    return profiler
+
+
+def set_startup_profiler(profiler):
+    """Set running startup profiler of the process.
+
+    Args:
+        profiler (Union[StartupProfiler, None]): Running profiler.
+    """
+
+    global _startup_profiler
+    _startup_profiler = profiler
+
+
+def get_startup_profiler():
+    """Running startup profiler.
+
+    Returns:
+        Union[StartupProfiler, None]: Profiler if startup is profiled.
+    """
+
+    return _startup_profiler
+
+
+@contextlib.contextmanager
+def startup_phase(name):
+    """Measure startup phase if startup profiler is running.
+
+    Args:
+        name (str): Name of phase.
+    """
+
+    profiler = get_startup_profiler()
+    if profiler is None:
+        yield
+        return
+
+    with profiler.phase(name):
+        yield
@@ -10,6 +10,7 @@ import platform
 import xml.etree.ElementTree
 
 from .execute import run_subprocess
+from .media_probe_cache import get_media_probe_cache
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
     get_oiio_tool_args,
@@ -20,6 +21,9 @@ from .vendor_bin_utils import (
 MAX_FFMPEG_STRING_LEN = 8196
 # Not allowed symbols in attributes for ffmpeg
 NOT_ALLOWED_FFMPEG_CHARS = ("\"", )
+# Default max count of concurrent oiiotool conversions
+#   - oiiotool is multi-threaded so more processes don't speed up conversion
+DEFAULT_CONVERSION_WORKERS = 4
 
 # OIIO known xml tags
 STRING_TAGS = {
@@ -81,20 +85,29 @@ def get_transcode_temp_directory():
 def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     """Call oiiotool to get information about input and return stdout.
 
-    Stdout should contain xml format string.
+    Stdout should contain xml format string. Output is cached in media probe
+    cache until file changes.
     """
-    args = get_oiio_tool_args(
-        "oiiotool",
-        "--info",
-        "-v"
+    probe_cache = get_media_probe_cache()
+    cache_key = probe_cache.get_key(
+        "oiio_info", filepath, ["-a"] if subimages else None
     )
-    if subimages:
-        args.append("-a")
+    output = probe_cache.get(cache_key)
+    if output is None:
+        args = get_oiio_tool_args(
+            "oiiotool",
+            "--info",
+            "-v"
+        )
+        if subimages:
+            args.append("-a")
 
-    args.extend(["-i:infoformat=xml", filepath])
+        args.extend(["-i:infoformat=xml", filepath])
 
-    output = run_subprocess(args, logger=logger)
-    output = output.replace("\r\n", "\n")
+        output = run_subprocess(args, logger=logger)
+        output = output.replace("\r\n", "\n")
+        if "<ImageSpec" in output:
+            probe_cache.set(cache_key, output)
 
     xml_started = False
     subimages_lines = []
@@ -677,10 +690,65 @@ def convert_for_ffmpeg(
     run_subprocess(oiio_cmd, logger=logger)
 
 
+def get_conversion_workers_count(
+    frame_size=None, max_workers=None, memory_budget=None
+):
+    """Count of frames that can be converted at the same time.
+
+    Count is limited by 'max_workers' or by 'DEFAULT_CONVERSION_WORKERS'
+    and count of CPUs if not passed, and by memory budget if frame size
+    is known. Memory budget is half of available memory if 'psutil' is
+    available and budget is not passed.
+
+    Args:
+        frame_size (Optional[int]): Estimated memory used to convert one
+            frame in bytes.
+        max_workers (Optional[int]): Maximum count of workers.
+            'DEFAULT_CONVERSION_WORKERS' is used if not passed.
+        memory_budget (Optional[int]): Memory in bytes which can be used
+            by all conversions.
+
+    Returns:
+        int: Count of workers, at least 1.
+    """
+    workers = max_workers
+    if not workers:
+        workers = min(DEFAULT_CONVERSION_WORKERS, os.cpu_count() or 1)
+    if frame_size:
+        if memory_budget is None:
+            try:
+                import psutil
+
+                memory_budget = psutil.virtual_memory().available // 2
+            except ImportError:
+                pass
+
+        if memory_budget:
+            workers = min(workers, memory_budget // frame_size)
+    return max(int(workers), 1)
+
+
+def get_conversion_threads_count(workers):
+    """Count of threads used by each of concurrent oiiotool processes.
+
+    CPUs are split between workers so they don't oversubscribe the machine.
+
+    Args:
+        workers (int): Count of concurrent conversions.
+
+    Returns:
+        int: Count of threads, at least 1.
+    """
+    return max((os.cpu_count() or 1) // max(workers, 1), 1)
+
+
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=None,
+    memory_budget=None,
+    progress_callback=None
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -693,16 +761,29 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Files are converted in parallel, count of concurrent conversions is
+    defined by 'get_conversion_workers_count' and CPUs are split between
+    them. Conversion of remaining files is not started when conversion
+    of a file fails.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of samy type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum count of concurrent conversions.
+        memory_budget (Optional[int]): Memory in bytes which can be used
+            by concurrent conversions.
+        progress_callback (Optional[Callable[[int, int], None]]): Called
+            with count of converted files and count of all files after each
+            converted file.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
             Currently is supported only ".exr" extension.
+        RuntimeError: If conversion of any file failed. Message contains
+            errors of all failed files.
     """
     if logger is None:
         logger = logging.getLogger(__name__)
@@ -749,6 +830,54 @@ def convert_input_paths_for_ffmpeg(
         # - this option is crashing if used on multipart exrs
         input_arg += ":ch={}".format(input_channels_str)
 
+    # Arguments after input path are same for all files
+    attributes_args = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing unallowed symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            attributes_args.extend(["--eraseattrib", attr_name])
+
+    # Estimate memory of one conversion as float pixels of loaded channels
+    #   for input and output buffer
+    frame_size = None
+    width = input_info.get("width")
+    height = input_info.get("height")
+    if width and height:
+        frame_size = width * height * len(input_channels) * 4 * 2
+
+    workers = min(
+        get_conversion_workers_count(frame_size, max_workers, memory_budget),
+        len(input_paths)
+    )
+    # Split CPUs between concurrent oiiotool processes
+    threads = get_conversion_threads_count(workers)
+
+    oiio_cmds = []
     for input_path in input_paths:
         # Prepare subprocess arguments
         oiio_cmd = get_oiio_tool_args(
@@ -756,6 +885,8 @@ def convert_input_paths_for_ffmpeg(
             # Don't add any additional attributes
             "--nosoftwareattrib",
         )
+        if workers > 1:
+            oiio_cmd.extend(["--threads", str(threads)])
         # Add input compression if available
         if compression:
             oiio_cmd.extend(["--compression", compression])
@@ -768,36 +899,7 @@ def convert_input_paths_for_ffmpeg(
             # Use first subimage
             "--subimage", "0"
         ])
-
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
-
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing unallowed symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+        oiio_cmd.extend(attributes_args)
 
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
@@ -805,15 +907,77 @@ def convert_input_paths_for_ffmpeg(
         oiio_cmd.extend([
             "-o", output_path
         ])
+        oiio_cmds.append((input_path, oiio_cmd))
 
+    logger.debug(
+        "Converting {} files using {} workers with {} threads".format(
+            len(oiio_cmds), workers, threads
+        )
+    )
+    _run_conversion_commands(oiio_cmds, workers, logger, progress_callback)
+
+
+def _run_conversion_commands(oiio_cmds, workers, logger, progress_callback):
+    def _convert(oiio_cmd):
         logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
         run_subprocess(oiio_cmd, logger=logger)
 
+    total = len(oiio_cmds)
+    failed = []
+    if workers <= 1:
+        for idx, (input_path, oiio_cmd) in enumerate(oiio_cmds):
+            try:
+                _convert(oiio_cmd)
+            except Exception as exc:
+                failed.append((input_path, exc))
+                # Don't waste time on other files when running serially
+                break
+            if progress_callback is not None:
+                progress_callback(idx + 1, total)
+
+    else:
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        # Threads are enough as the work is done by subprocesses
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_convert, oiio_cmd): input_path
+                for input_path, oiio_cmd in oiio_cmds
+            }
+            done_count = 0
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                exc = future.exception()
+                if exc is not None:
+                    failed.append((futures[future], exc))
+                    # Don't start conversion of other files, conversions
+                    #   which already run are finished and their errors
+                    #   are reported too
+                    for other_future in futures:
+                        other_future.cancel()
+                    continue
+                done_count += 1
+                if progress_callback is not None:
+                    progress_callback(done_count, total)
+
+    if not failed:
+        return
+
+    lines = [
+        "Conversion of {} of {} files failed.".format(len(failed), total)
+    ]
+    for input_path, exc in sorted(failed, key=lambda item: item[0]):
+        lines.append("{}: {}".format(input_path, exc))
+    raise RuntimeError("\n".join(lines))
+
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
 
+    Output is cached in media probe cache until file changes.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
@@ -823,6 +987,12 @@ def get_ffprobe_data(path_to_file, logger=None):
     logger.debug(
         "Getting information about input \"{}\".".format(path_to_file)
     )
+    probe_cache = get_media_probe_cache()
+    cache_key = probe_cache.get_key("ffprobe", path_to_file)
+    cached_output = probe_cache.get(cache_key)
+    if cached_output is not None:
+        return json.loads(cached_output)
+
     ffprobe_args = get_ffmpeg_tool_args("ffprobe")
     args = ffprobe_args + [
         "-hide_banner",
@@ -864,7 +1034,10 @@ def get_ffprobe_data(path_to_file, logger=None):
             popen_stderr.decode("utf-8")
         ))
 
-    return json.loads(popen_stdout)
+    output = json.loads(popen_stdout)
+    if popen.returncode == 0 and "error" not in output:
+        probe_cache.set(cache_key, popen_stdout.decode("utf-8"))
+    return output
 
 
 def get_ffprobe_streams(path_to_file, logger=None):
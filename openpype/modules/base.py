@@ -5,6 +5,7 @@ import os
 import sys
 import json
 import time
+import types
 import inspect
 import logging
 import platform
@@ -38,6 +39,7 @@ from openpype.lib import (
     import_filepath,
     import_module_from_dirpath,
 )
+from openpype.lib.startup_profiler import startup_phase
 
 from .interfaces import (
     OpenPypeInterface,
@@ -68,6 +70,124 @@ IGNORED_FILENAMES_IN_AYON = {
     "slack",
     "kitsu",
 }
+# Static manifest of module directory used by lazy loading
+ADDON_MANIFEST_FILENAME = "manifest.json"
+# Environment variable enabling lazy loading of modules with manifest
+LAZY_MODULES_ENV_KEY = "OPENPYPE_LAZY_MODULES"
+
+
+def is_lazy_modules_enabled():
+    """Modules with manifest are imported on first use.
+
+    Returns:
+        bool: Lazy loading is enabled by environment variable.
+    """
+    value = os.environ.get(LAZY_MODULES_ENV_KEY) or ""
+    return value.lower() in ("1", "true", "yes")
+
+
+class AddonManifest(object):
+    """Static information about module available without its import.
+
+    Manifest is a json file in module directory with keys:
+        "name": Name of module (value of 'name' attribute of module class).
+        "entry_point": Name of module class available in the package.
+        "interfaces": Names of interfaces the module class implements.
+        "host_name": Host name of host addons (optional).
+        "settings_defs": Package contains settings definitions (optional).
+
+    Args:
+        data (dict[str, Any]): Manifest data.
+        path (str): Path to manifest file.
+    """
+
+    def __init__(self, data, path):
+        self.path = path
+        self.name = data["name"]
+        self.entry_point = data["entry_point"]
+        self.interfaces = list(data.get("interfaces") or [])
+        self.host_name = data.get("host_name")
+        self.settings_defs = data.get("settings_defs", False)
+
+    @classmethod
+    def from_dirpath(cls, dirpath):
+        """Load manifest of module directory.
+
+        Returns:
+            Union[AddonManifest, None]: Manifest or None if directory does
+                not have valid manifest.
+        """
+        path = os.path.join(dirpath, ADDON_MANIFEST_FILENAME)
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(load_json_file(path), path)
+        except Exception:
+            Logger.get_logger("ModulesLoader").warning(
+                "Invalid module manifest {}".format(path), exc_info=True
+            )
+        return None
+
+    def implements(self, interface):
+        """Module declares interface or its subclass."""
+        from . import interfaces
+
+        for interface_name in self.interfaces:
+            interface_cls = getattr(interfaces, interface_name, None)
+            if (
+                inspect.isclass(interface_cls)
+                and issubclass(interface_cls, interface)
+            ):
+                return True
+        return False
+
+
+class _LazyModule(types.ModuleType):
+    """Placeholder of python module imported on first attribute access.
+
+    Placeholder is replaced in `sys.modules` and `openpype_modules` by
+    the real python module once it's imported.
+    """
+
+    def __init__(self, name, manifest, import_func, modules_key):
+        super(_LazyModule, self).__init__(name)
+        self._lazy_manifest = manifest
+        self._lazy_import_func = import_func
+        self._lazy_modules_key = modules_key
+        self._lazy_lock = threading.Lock()
+        self._lazy_module = None
+
+    @property
+    def manifest(self):
+        return self._lazy_manifest
+
+    def __getattr__(self, attr_name):
+        if attr_name.startswith("_lazy_"):
+            raise AttributeError(attr_name)
+        return getattr(self.load(), attr_name)
+
+    def load(self):
+        """Import the real python module.
+
+        Returns:
+            types.ModuleType: Imported python module.
+        """
+        with self._lazy_lock:
+            if self._lazy_module is not None:
+                return self._lazy_module
+
+            openpype_modules = sys.modules[self._lazy_modules_key]
+            basename = self.__name__.split(".")[-1]
+            # Remove placeholder so import logic does not use it
+            if sys.modules.get(self.__name__) is self:
+                sys.modules.pop(self.__name__)
+            openpype_modules.__attributes__.pop(basename, None)
+
+            module = self._lazy_import_func()
+            sys.modules[self.__name__] = module
+            openpype_modules.__attributes__[basename] = module
+            self._lazy_module = module
+        return module
 
 
 # Inherit from `object` for Python 2 hosts
@@ -309,7 +429,7 @@ def load_modules(force=False):
     load_interfaces(force)
 
     if not _LoadCache.modules_lock.locked():
-        with _LoadCache.modules_lock:
+        with _LoadCache.modules_lock, startup_phase("modules.load"):
             _load_modules()
             _LoadCache.modules_loaded = True
     else:
@@ -513,6 +633,7 @@ def _load_modules():
     addons_dir = os.path.join(os.path.dirname(current_dir), "addons")
     module_dirs.append(addons_dir)
 
+    lazy_enabled = is_lazy_modules_enabled()
     processed_paths = set()
     for dirpath in frozenset(module_dirs):
         # Skip already processed paths
@@ -563,8 +684,31 @@ def _load_modules():
             elif ext not in (".py", ):
                 continue
 
-            # TODO add more logic how to define if folder is module or not
-            # - check manifest and content of manifest
+            manifest = None
+            if lazy_enabled and os.path.isdir(fullpath):
+                manifest = AddonManifest.from_dirpath(fullpath)
+
+            if manifest is not None:
+                if is_in_current_dir:
+                    import_func = _get_import_func(
+                        "openpype.modules.{}".format(basename)
+                    )
+                elif is_in_host_dir:
+                    import_func = _get_import_func(
+                        "openpype.hosts.{}".format(basename)
+                    )
+                else:
+                    import_func = _get_dirpath_import_func(
+                        dirpath, filename, modules_key
+                    )
+                new_import_str = "{}.{}".format(modules_key, basename)
+                lazy_module = _LazyModule(
+                    new_import_str, manifest, import_func, modules_key
+                )
+                sys.modules[new_import_str] = lazy_module
+                setattr(openpype_modules, basename, lazy_module)
+                continue
+
             try:
                 # Don't import dynamically current directory modules
                 if is_in_current_dir:
@@ -609,6 +753,18 @@ def _load_modules():
                 log.error(msg, exc_info=True)
 
 
+def _get_import_func(import_str):
+    def _import_func():
+        return __import__(import_str, fromlist=("", ))
+    return _import_func
+
+
+def _get_dirpath_import_func(dirpath, filename, modules_key):
+    def _import_func():
+        return import_module_from_dirpath(dirpath, filename, modules_key)
+    return _import_func
+
+
 @six.add_metaclass(ABCMeta)
 class OpenPypeModule:
     """Base class of pype module.
@@ -731,15 +887,66 @@ class OpenPypeAddOn(OpenPypeModule):
         pass
 
 
+class _LazyModulesByName(dict):
+    """Modules by name which initializes lazy modules on access."""
+
+    def __init__(self, initialize_func):
+        super(_LazyModulesByName, self).__init__()
+        self._initialize_func = initialize_func
+
+    def __missing__(self, key):
+        self._initialize_func([key])
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        if not dict.__contains__(self, key):
+            self._initialize_func([key])
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        self._initialize_func()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._initialize_func()
+        return dict.__len__(self)
+
+    def get(self, key, default=None):
+        if key in self:
+            return dict.__getitem__(self, key)
+        return default
+
+    def keys(self):
+        self._initialize_func()
+        return dict.keys(self)
+
+    def values(self):
+        self._initialize_func()
+        return dict.values(self)
+
+    def items(self):
+        self._initialize_func()
+        return dict.items(self)
+
+
 class ModulesManager:
     """Manager of Pype modules helps to load and prepare them to work.
 
+    When modules are loaded lazily (see 'is_lazy_modules_enabled') modules
+    with manifest are initialized on first access by name, or when modules
+    implementing interface from their manifest are requested. Lazily
+    initialized module is connected with modules initialized before it.
+
     Args:
         modules_settings(dict): To be able create module manager with specified
             data. For settings changes callbacks and testing purposes.
     """
     # Helper attributes for report
     _report_total_key = "Total"
+    # Manager can initialize modules with manifest on demand
+    _allow_lazy_modules = True
 
     def __init__(self, _system_settings=None):
         self.log = logging.getLogger(self.__class__.__name__)
@@ -748,16 +955,33 @@ class ModulesManager:
 
         self.modules = []
         self.modules_by_id = {}
-        self.modules_by_name = {}
+        self.modules_by_name = _LazyModulesByName(
+            self._initialize_lazy_modules
+        )
         # For report of time consumption
         self._report = {}
 
-        self.initialize_modules()
-        self.connect_modules()
+        with startup_phase("modules.initialize"):
+            self.initialize_modules()
+            self.connect_modules()
 
     def __getitem__(self, module_name):
         return self.modules_by_name[module_name]
 
+    @property
+    def modules(self):
+        """All initialized modules.
+
+        Returns:
+            list[OpenPypeModule]: Initialized modules.
+        """
+        self._initialize_lazy_modules()
+        return self._modules
+
+    @modules.setter
+    def modules(self, modules):
+        self._modules = modules
+
     def get(self, module_name, default=None):
         """Access module by name.
 
@@ -807,8 +1031,16 @@ class ModulesManager:
         time_start = time.time()
         prev_start_time = time_start
 
+        self._modules_settings = modules_settings
+        self._lazy_modules = {}
         module_classes = []
-        for module in openpype_modules:
+        for module in tuple(openpype_modules):
+            if isinstance(module, _LazyModule):
+                if self._allow_lazy_modules:
+                    self._lazy_modules[module.manifest.name] = module
+                    continue
+                module = module.load()
+
             # Go through globals in `pype.modules`
             for name in dir(module):
                 modules_item = getattr(module, name, None)
@@ -843,32 +1075,131 @@ class ModulesManager:
                 module_classes.append(modules_item)
 
         for modules_item in module_classes:
-            try:
-                name = modules_item.__name__
-                # Try initialize module
-                module = modules_item(self, modules_settings)
-                # Store initialized object
-                self.modules.append(module)
-                self.modules_by_id[module.id] = module
-                self.modules_by_name[module.name] = module
-                enabled_str = "X"
-                if not module.enabled:
-                    enabled_str = " "
-                self.log.debug("[{}] {}".format(enabled_str, name))
-
+            module = self._initialize_module_class(modules_item)
+            if module is not None:
                 now = time.time()
                 report[module.__class__.__name__] = now - prev_start_time
                 prev_start_time = now
 
+        if self._report is not None:
+            report[self._report_total_key] = time.time() - time_start
+            self._report["Initialization"] = report
+
+    def _initialize_module_class(self, modules_item):
+        name = modules_item.__name__
+        try:
+            # Try initialize module
+            module = modules_item(self, self._modules_settings)
+
+        except Exception:
+            self.log.warning(
+                "Initialization of module {} failed.".format(name),
+                exc_info=True
+            )
+            return None
+
+        # Store initialized object
+        self._modules.append(module)
+        self.modules_by_id[module.id] = module
+        dict.__setitem__(self.modules_by_name, module.name, module)
+        enabled_str = "X"
+        if not module.enabled:
+            enabled_str = " "
+        self.log.debug("[{}] {}".format(enabled_str, name))
+        return module
+
+    def _initialize_lazy_modules(self, module_names=None):
+        """Import and initialize modules which were not initialized yet.
+
+        Initialized modules are connected with all initialized enabled
+        modules.
+
+        Args:
+            module_names (Optional[Iterable[str]]): Names of modules to
+                initialize. All remaining modules are initialized if not
+                passed.
+        """
+        lazy_modules = getattr(self, "_lazy_modules", None)
+        if not lazy_modules:
+            return
+
+        if module_names is None:
+            module_names = list(lazy_modules.keys())
+
+        report = {}
+        if self._report is not None:
+            report = self._report.setdefault("Lazy initialization", {})
+        new_modules = []
+        for module_name in module_names:
+            lazy_module = lazy_modules.pop(module_name, None)
+            if lazy_module is None:
+                continue
+
+            start_time = time.time()
+            entry_point = lazy_module.manifest.entry_point
+            try:
+                modules_item = getattr(lazy_module.load(), entry_point)
             except Exception:
                 self.log.warning(
-                    "Initialization of module {} failed.".format(name),
+                    "Failed to import module {}.".format(module_name),
                     exc_info=True
                 )
+                continue
 
-        if self._report is not None:
-            report[self._report_total_key] = time.time() - time_start
-            self._report["Initialization"] = report
+            module = self._initialize_module_class(modules_item)
+            if module is None:
+                continue
+            report[module.__class__.__name__] = time.time() - start_time
+            if module.enabled:
+                new_modules.append(module)
+
+        if not new_modules:
+            return
+
+        enabled_modules = self._get_initialized_enabled_modules()
+        for module in new_modules:
+            try:
+                module.connect_with_modules(enabled_modules)
+            except Exception:
+                self.log.error(
+                    "BUG: Module failed on connection with other modules.",
+                    exc_info=True
+                )
+
+    def _initialize_lazy_modules_by_interface(
+        self, interface, host_name=None
+    ):
+        lazy_modules = getattr(self, "_lazy_modules", None)
+        if not lazy_modules:
+            return
+        module_names = []
+        for module_name, lazy_module in lazy_modules.items():
+            manifest = lazy_module.manifest
+            if not manifest.implements(interface):
+                continue
+            if (
+                host_name is not None
+                and manifest.host_name is not None
+                and manifest.host_name != host_name
+            ):
+                continue
+            module_names.append(module_name)
+        self._initialize_lazy_modules(module_names)
+
+    def _get_initialized_enabled_modules(self):
+        return [
+            module
+            for module in self._modules
+            if module.enabled
+        ]
+
+    def _get_enabled_modules_by_interface(self, interface):
+        self._initialize_lazy_modules_by_interface(interface)
+        return [
+            module
+            for module in self._get_initialized_enabled_modules()
+            if isinstance(module, interface)
+        ]
 
     def connect_modules(self):
         """Trigger connection with other enabled modules.
@@ -878,7 +1209,7 @@ class ModulesManager:
         report = {}
         time_start = time.time()
         prev_start_time = time_start
-        enabled_modules = self.get_enabled_modules()
+        enabled_modules = self._get_initialized_enabled_modules()
         self.log.debug("Has {} enabled modules.".format(len(enabled_modules)))
         for module in enabled_modules:
             try:
@@ -903,11 +1234,8 @@ class ModulesManager:
         Returns:
             list: Initialized and enabled modules.
         """
-        return [
-            module
-            for module in self.modules
-            if module.enabled
-        ]
+        self._initialize_lazy_modules()
+        return self._get_initialized_enabled_modules()
 
     def collect_global_environments(self):
         """Helper to collect global environment variabled from modules.
@@ -950,10 +1278,7 @@ class ModulesManager:
             "inventory": []
         }
         unknown_keys_by_module = {}
-        for module in self.get_enabled_modules():
-            # Skip module that do not inherit from `IPluginPaths`
-            if not isinstance(module, IPluginPaths):
-                continue
+        for module in self._get_enabled_modules_by_interface(IPluginPaths):
             plugin_paths = module.get_plugin_paths()
             for key, value in plugin_paths.items():
                 # Filter unknown keys
@@ -991,11 +1316,7 @@ class ModulesManager:
 
     def _collect_plugin_paths(self, method_name, *args, **kwargs):
         output = []
-        for module in self.get_enabled_modules():
-            # Skip module that do not inherit from `IPluginPaths`
-            if not isinstance(module, IPluginPaths):
-                continue
-
+        for module in self._get_enabled_modules_by_interface(IPluginPaths):
             method = getattr(module, method_name)
             paths = method(*args, **kwargs)
             if paths:
@@ -1079,7 +1400,8 @@ class ModulesManager:
                 host name set to passed 'host_name'.
         """
 
-        for module in self.get_enabled_modules():
+        self._initialize_lazy_modules_by_interface(IHostAddon, host_name)
+        for module in self._get_initialized_enabled_modules():
             if (
                 isinstance(module, IHostAddon)
                 and module.host_name == host_name
@@ -1097,8 +1419,7 @@ class ModulesManager:
 
         host_names = {
             module.host_name
-            for module in self.get_enabled_modules()
-            if isinstance(module, IHostAddon)
+            for module in self._get_enabled_modules_by_interface(IHostAddon)
         }
         return host_names
 
@@ -1140,7 +1461,7 @@ class ModulesManager:
         # Add module names to first columnt
         cols["Module name"] = list(sorted(
             module.__class__.__name__
-            for module in self.modules
+            for module in self._modules
             if module.__class__.__name__ in available_col_names
         ))
         # Add total key (as last module)
@@ -1220,6 +1541,8 @@ class ModulesManager:
 
 
 class TrayModulesManager(ModulesManager):
+    # Tray uses all modules
+    _allow_lazy_modules = False
     # Define order of modules in menu
     modules_menu_order = (
         "user",
@@ -1270,9 +1593,10 @@ class TrayModulesManager(ModulesManager):
 
     def initialize(self, tray_manager, tray_menu):
         self.tray_manager = tray_manager
-        self.initialize_modules()
-        self.tray_init()
-        self.connect_modules()
+        with startup_phase("modules.initialize"):
+            self.initialize_modules()
+            self.tray_init()
+            self.connect_modules()
         self.tray_menu(tray_menu)
 
     def get_enabled_tray_modules(self):
@@ -1411,7 +1735,12 @@ def get_module_settings_defs():
 
     log = Logger.get_logger("ModuleSettingsLoad")
 
-    for raw_module in openpype_modules:
+    for raw_module in tuple(openpype_modules):
+        if isinstance(raw_module, _LazyModule):
+            if not raw_module.manifest.settings_defs:
+                continue
+            raw_module = raw_module.load()
+
         for attr_name in dir(raw_module):
             attr = getattr(raw_module, attr_name)
             if (
@@ -9,12 +9,17 @@ import os
 from abc import abstractmethod
 import platform
 import getpass
+import threading
 from functools import partial
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 import six
 import attr
 import requests
+from requests.adapters import HTTPAdapter
+from six.moves.urllib.parse import urlparse
+from urllib3.util.retry import Retry
 
 import pyblish.api
 from openpype.pipeline.publish import (
@@ -29,6 +34,84 @@ from openpype import AYON_SERVER_ENABLED
 
 JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
 
+# Connections kept alive for each Deadline webservice
+SESSION_POOL_SIZE = 10
+# Retries of failed requests, wait time between retries is
+#   'backoff_factor * (2 ** (retry - 1))' seconds
+SESSION_RETRIES = 3
+SESSION_BACKOFF_FACTOR = 0.5
+# POST requests are retried only when connection failed, so jobs are not
+#   submitted twice
+SESSION_RETRY_METHODS = frozenset(["GET", "HEAD"])
+SESSION_RETRY_STATUSES = (502, 503, 504)
+
+
+class _DeadlineSessions:
+    sessions = {}
+    lock = threading.Lock()
+
+
+def _create_retry():
+    kwargs = {
+        "total": SESSION_RETRIES,
+        "backoff_factor": SESSION_BACKOFF_FACTOR,
+        "status_forcelist": SESSION_RETRY_STATUSES,
+        "raise_on_status": False,
+    }
+    try:
+        return Retry(allowed_methods=SESSION_RETRY_METHODS, **kwargs)
+    except TypeError:
+        # urllib3 < 1.26
+        return Retry(method_whitelist=SESSION_RETRY_METHODS, **kwargs)
+
+
+def get_deadline_session(url):
+    """Pooled session for Deadline webservice.
+
+    Session is shared for all requests to the same webservice, so
+    connections are kept alive between requests. Failed requests are
+    retried with backoff.
+
+    Args:
+        url (str): Any url of the Deadline webservice.
+
+    Returns:
+        requests.Session: Session for the webservice.
+    """
+
+    parsed_url = urlparse(url)
+    key = (parsed_url.scheme, parsed_url.netloc)
+    with _DeadlineSessions.lock:
+        session = _DeadlineSessions.sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=SESSION_POOL_SIZE,
+                max_retries=_create_retry()
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _DeadlineSessions.sessions[key] = session
+    return session
+
+
+def close_deadline_sessions():
+    """Close all pooled sessions of Deadline webservices."""
+
+    with _DeadlineSessions.lock:
+        sessions = list(_DeadlineSessions.sessions.values())
+        _DeadlineSessions.sessions.clear()
+
+    for session in sessions:
+        session.close()
+
+
+def _get_request_url(args, kwargs):
+    if args:
+        return args[0]
+    return kwargs["url"]
+
 
 def requests_post(*args, **kwargs):
     """Wrap request post method.
@@ -38,6 +121,8 @@ def requests_post(*args, **kwargs):
     running with self-signed certificates and their certificate is not
     added to trusted certificates on client machines.
 
+    Request is sent using pooled session of Deadline webservice.
+
     Warning:
         Disabling SSL certificate validation is defeating one line
         of defense SSL is providing, and it is not recommended.
@@ -48,7 +133,8 @@ def requests_post(*args, **kwargs):
                                               True) else True  # noqa
     # add 10sec timeout before bailing out
     kwargs['timeout'] = 10
-    return requests.post(*args, **kwargs)
+    session = get_deadline_session(_get_request_url(args, kwargs))
+    return session.post(*args, **kwargs)
 
 
 def requests_get(*args, **kwargs):
@@ -59,6 +145,8 @@ def requests_get(*args, **kwargs):
     running with self-signed certificates and their certificate is not
     added to trusted certificates on client machines.
 
+    Request is sent using pooled session of Deadline webservice.
+
     Warning:
         Disabling SSL certificate validation is defeating one line
         of defense SSL is providing, and it is not recommended.
@@ -69,7 +157,8 @@ def requests_get(*args, **kwargs):
                                               True) else True  # noqa
     # add 10sec timeout before bailing out
     kwargs['timeout'] = 10
-    return requests.get(*args, **kwargs)
+    session = get_deadline_session(_get_request_url(args, kwargs))
+    return session.get(*args, **kwargs)
 
 
 class DeadlineKeyValueVar(dict):
@@ -420,6 +509,8 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
     use_published = True
     asset_dependencies = False
     default_priority = 50
+    # Maximum number of payloads submitted at the same time by 'submit_batch'
+    submit_workers = 4
 
     def __init__(self, *args, **kwargs):
         super(AbstractSubmitDeadline, self).__init__(*args, **kwargs)
@@ -578,6 +669,167 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
         Throws:
             KnownPublishError: if submission fails.
 
+        """
+        result = self._submit_payload(payload)
+
+        # for submit publish job
+        self._instance.data["deadlineSubmissionJob"] = result
+
+        return result["_id"]
+
+    def submit_batch(self, payloads, dependencies=None):
+        """Submit multiple payloads to Deadline concurrently.
+
+        Payloads which do not wait for any other payload are submitted at
+        the same time, up to 'submit_workers'. Job ids of submitted
+        dependencies are added to 'JobDependencies' of the dependent
+        payload before it is submitted.
+
+        Args:
+            payloads (dict[str, dict]): Payloads by unique key, e.g. created
+                with 'assemble_payload'.
+            dependencies (Optional[dict[str, list[str]]]): Keys of payloads
+                which must be submitted before the payload.
+
+        Returns:
+            dict[str, str]: Deadline job ids by keys of payloads.
+
+        Throws:
+            KnownPublishError: if dependencies are invalid or submission of
+                any payload fails.
+
+        """
+        if not payloads:
+            return {}
+
+        dependencies = dependencies or {}
+        remaining_by_key, dependents_by_key = self._get_batch_dependencies(
+            payloads, dependencies
+        )
+        ready_keys = [
+            key
+            for key in payloads
+            if not remaining_by_key[key]
+        ]
+        results = {}
+        job_ids = {}
+        max_workers = max(1, self.submit_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {}
+            while ready_keys or running:
+                for key in ready_keys:
+                    payload = self._add_job_dependencies(
+                        payloads[key],
+                        [
+                            job_ids[dependency]
+                            for dependency in dependencies.get(key, [])
+                        ]
+                    )
+                    future = executor.submit(self._submit_payload, payload)
+                    running[future] = key
+                ready_keys = []
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    # Raise error of failed submission, payloads which were
+                    #   not submitted yet are skipped
+                    results[key] = future.result()
+                    job_ids[key] = results[key]["_id"]
+                    for dependent in dependents_by_key[key]:
+                        remaining = remaining_by_key[dependent]
+                        remaining.discard(key)
+                        if not remaining:
+                            ready_keys.append(dependent)
+
+        # for submit publish job, same as last payload submitted by 'submit'
+        last_key = list(payloads)[-1]
+        self._instance.data["deadlineSubmissionJob"] = results[last_key]
+
+        return {key: job_ids[key] for key in payloads}
+
+    def _get_batch_dependencies(self, payloads, dependencies):
+        """Validate dependencies of batch payloads.
+
+        Args:
+            payloads (dict[str, dict]): Payloads by unique key.
+            dependencies (dict[str, list[str]]): Keys of payloads which must
+                be submitted before the payload.
+
+        Returns:
+            tuple[dict[str, set[str]], dict[str, list[str]]]: Keys of
+                dependencies and keys of dependents of each payload.
+
+        Throws:
+            KnownPublishError: if dependency is not in payloads or
+                dependencies are circular.
+
+        """
+        remaining_by_key = {key: set() for key in payloads}
+        dependents_by_key = {key: [] for key in payloads}
+        for key, dependency_keys in dependencies.items():
+            for dependency in dependency_keys:
+                if key not in payloads or dependency not in payloads:
+                    raise KnownPublishError((
+                        "Unknown payload in dependency \"{}\" -> \"{}\""
+                    ).format(key, dependency))
+                remaining_by_key[key].add(dependency)
+                dependents_by_key[dependency].append(key)
+
+        # Make sure all payloads can be submitted
+        resolved = set()
+        queue = [key for key, value in remaining_by_key.items() if not value]
+        while queue:
+            key = queue.pop()
+            resolved.add(key)
+            for dependent in dependents_by_key[key]:
+                if remaining_by_key[dependent].issubset(resolved):
+                    queue.append(dependent)
+
+        if len(resolved) != len(payloads):
+            raise KnownPublishError(
+                "Circular dependencies of payloads: {}".format(", ".join(
+                    sorted(key for key in payloads if key not in resolved)
+                ))
+            )
+        return remaining_by_key, dependents_by_key
+
+    @staticmethod
+    def _add_job_dependencies(payload, job_ids):
+        """Copy of payload with job ids added to 'JobDependencies'.
+
+        Args:
+            payload (dict): Deadline payload.
+            job_ids (list[str]): Deadline job ids.
+
+        Returns:
+            dict: Payload with dependencies.
+
+        """
+        if not job_ids:
+            return payload
+
+        job_info = OrderedDict(payload["JobInfo"])
+        current = job_info.get("JobDependencies") or ""
+        job_info["JobDependencies"] = ",".join(
+            [job_id for job_id in current.split(",") if job_id] + job_ids
+        )
+        payload = dict(payload)
+        payload["JobInfo"] = job_info
+        return payload
+
+    def _submit_payload(self, payload):
+        """Send payload to Deadline jobs end-point.
+
+        Args:
+            payload (dict): dict to become json in deadline submission.
+
+        Returns:
+            dict[str, Any]: Deadline job data.
+
+        Throws:
+            KnownPublishError: if submission fails.
+
         """
         url = "{}/api/jobs".format(self._deadline_url)
         response = requests_post(url, json=payload)
@@ -589,14 +841,9 @@ class AbstractSubmitDeadline(pyblish.api.InstancePlugin,
             raise KnownPublishError(response.text)
 
         try:
-            result = response.json()
+            return response.json()
         except JSONDecodeError:
             msg = "Broken response {}. ".format(response)
             msg += "Try restarting the Deadline Webservice."
             self.log.warning(msg, exc_info=True)
             raise KnownPublishError("Broken response from DL")
-
-        # for submit publish job
-        self._instance.data["deadlineSubmissionJob"] = result
-
-        return result["_id"]
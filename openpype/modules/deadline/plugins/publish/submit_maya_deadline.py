@@ -440,15 +440,6 @@ class MayaSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
             )
             file_index += 1
 
-        self.log.debug(
-            "Submitting tile job(s) [{}] ...".format(len(frame_payloads)))
-
-        # Submit frame tile jobs
-        frame_tile_job_id = {}
-        for frame, tile_job_payload in frame_payloads.items():
-            job_id = self.submit(tile_job_payload)
-            frame_tile_job_id[frame] = job_id
-
         # Define assembly payloads
         assembly_job_info = copy.deepcopy(job_info)
         assembly_job_info.Plugin = self.tile_assembler_plugin
@@ -485,11 +476,9 @@ class MayaSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
                 "\\1{}\\3".format("#" * len(frame)), file)
 
             file_hash = frame_file_hash[frame]
-            tile_job_id = frame_tile_job_id[frame]
 
             frame_assembly_job_info.ExtraInfo[0] = file_hash
             frame_assembly_job_info.ExtraInfo[1] = file
-            frame_assembly_job_info.JobDependencies = tile_job_id
             frame_assembly_job_info.Frames = frame
 
             # write assembly job config files
@@ -536,7 +525,8 @@ class MayaSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
                 for k, v in sorted(tiles.items()):
                     print("{}={}".format(k, v), file=cf)
 
-            assembly_payloads.append(
+            assembly_payloads.append((
+                frame,
                 self.assemble_payload(
                     job_info=frame_assembly_job_info,
                     plugin_info=assembly_plugin_info.copy(),
@@ -544,20 +534,32 @@ class MayaSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
                     # using different storage paths.
                     aux_files=[config_file]
                 )
-            )
+            ))
 
-        # Submit assembly jobs
-        assembly_job_ids = []
-        num_assemblies = len(assembly_payloads)
-        for i, payload in enumerate(assembly_payloads):
-            self.log.debug(
-                "submitting assembly job {} of {}".format(i + 1,
-                                                          num_assemblies)
+        # Submit frame tile jobs and assembly jobs depending on them
+        payloads = {}
+        dependencies = {}
+        for frame, tile_job_payload in frame_payloads.items():
+            payloads["tile_{}".format(frame)] = tile_job_payload
+
+        assembly_keys = []
+        for idx, (frame, payload) in enumerate(assembly_payloads):
+            assembly_key = "assembly_{}".format(idx)
+            payloads[assembly_key] = payload
+            dependencies[assembly_key] = ["tile_{}".format(frame)]
+            assembly_keys.append(assembly_key)
+
+        self.log.debug(
+            "Submitting tile job(s) [{}] and assembly job(s) [{}] ...".format(
+                len(frame_payloads), len(assembly_payloads)
             )
-            assembly_job_id = self.submit(payload)
-            assembly_job_ids.append(assembly_job_id)
+        )
+        job_ids = self.submit_batch(payloads, dependencies)
 
-        instance.data["assemblySubmissionJobs"] = assembly_job_ids
+        instance.data["assemblySubmissionJobs"] = [
+            job_ids[assembly_key]
+            for assembly_key in assembly_keys
+        ]
 
         # Remove config files to avoid confusion about where data is coming
         # from in Deadline.
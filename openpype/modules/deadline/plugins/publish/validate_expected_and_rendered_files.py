@@ -4,6 +4,7 @@ import requests
 import pyblish.api
 
 from openpype.lib import collect_frames
+from openpype.pipeline.publish import get_file_sequence_index
 from openpype_modules.deadline.abstract_submit_deadline import requests_get
 
 
@@ -38,7 +39,8 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
             expected_files = self._get_expected_files(repre)
 
             staging_dir = repre["stagingDir"]
-            existing_files = self._get_existing_files(staging_dir)
+            existing_files = self._get_existing_files(
+                instance.context, staging_dir)
 
             if self.allow_user_override:
                 # We always check for user override because the user might have
@@ -225,12 +227,13 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
             return json_content.pop()
         return {}
 
-    def _get_existing_files(self, staging_dir):
-        """Returns set of existing file names from 'staging_dir'"""
-        existing_files = set()
-        for file_name in os.listdir(staging_dir):
-            existing_files.add(file_name)
-        return existing_files
+    def _get_existing_files(self, context, staging_dir):
+        """Returns set of existing file names from 'staging_dir'
+
+        Directory is scanned only once for all instances in the context.
+        """
+        index = get_file_sequence_index(context, staging_dir)
+        return set(index.get_paths())
 
     def _get_expected_files(self, repre):
         """Returns set of file names in representation['files']
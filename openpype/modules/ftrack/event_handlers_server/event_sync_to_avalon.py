@@ -78,6 +78,12 @@ class SyncToAvalonEvent(BaseEvent):
     created_entities = []
     report_splitter = {"type": "label", "value": "---"}
 
+    # Events are collected per project and synchronized together when the
+    #   oldest collected event is older than 'coalesce_window' seconds, when
+    #   'coalesce_max_events' are collected or when event processor is idle
+    coalesce_window = 2.0
+    coalesce_max_events = 500
+
     def __init__(self, session):
         '''Expects a ftrack_api.Session instance'''
         # Debug settings
@@ -89,6 +95,18 @@ class SyncToAvalonEvent(BaseEvent):
         #   only entityTypes in interest instead of filtering by ignored
         self.debug_sync_types = collections.defaultdict(list)
 
+        # Collected events by project id waiting for synchronization
+        self._coalesce_events = False
+        self._pending_events = collections.OrderedDict()
+        self._lag_metrics = {
+            "processed_events": 0,
+            "processed_batches": 0,
+            "merged_changes": 0,
+            "last_lag": 0.0,
+            "max_lag": 0.0,
+            "total_lag": 0.0,
+        }
+
         self.dbcon = AvalonMongoDB()
         # Set processing session to not use global
         self.set_process_session(session)
@@ -113,6 +131,9 @@ class SyncToAvalonEvent(BaseEvent):
         self.log.debug(
             "DEBUG MESSAGE: Known types {}".format(known_entityTypes)
         )
+        self.log.debug("DEBUG MESSAGE: {}".format(
+            ", ".join(self.get_status_info_values())
+        ))
 
     @property
     def cur_project(self):
@@ -594,7 +615,265 @@ class SyncToAvalonEvent(BaseEvent):
                 return "unknown hierarchy"
         return "/".join([ent["name"] for ent in entity["link"]])
 
+    def register(self):
+        super().register()
+        event_hub = self.session.event_hub
+        idle_topic = getattr(event_hub, "idle_topic", None)
+        if idle_topic and self.coalesce_window > 0:
+            self._coalesce_events = True
+            event_hub.subscribe(
+                "topic={}".format(idle_topic), self._on_processor_idle
+            )
+
+        if hasattr(event_hub, "add_status_info_callback"):
+            event_hub.add_status_info_callback(self.get_status_info)
+
+    def _filter_entities_info(self, entities_info):
+        return [
+            ent_info
+            for ent_info in entities_info
+            if (
+                ent_info.get("entityType") in self.interest_entTypes
+                and ent_info.get("entity_type")
+                and ent_info["entity_type"] not in self.ignore_ent_types
+            )
+        ]
+
+    def _get_project_id(self, entities_info):
+        for ent_info in entities_info:
+            for parent in ent_info.get("parents") or []:
+                if parent.get("entityType") == "show":
+                    return parent.get("entityId")
+        return None
+
     def launch(self, session, event):
+        """Collect event to be synchronized with other events of project.
+
+        Entity changes of collected events are merged and synchronized in one
+        pass once collecting window of project expires or when event
+        processor is idle. Event is synchronized immediately if event hub
+        does not handle idle events.
+
+        Args:
+            session (object): session to Ftrack
+            event (dictionary): event content
+
+        Returns:
+            (boolean or None)
+        """
+        entities_info = self._filter_entities_info(event["data"]["entities"])
+        if not entities_info:
+            return True
+
+        pending = [(event, time.time())]
+        if not self._coalesce_events:
+            self._process_events(session, pending)
+            return True
+
+        # Event is set as processed once its batch is synchronized
+        session.event_hub.postpone_event_processed(event)
+        project_id = self._get_project_id(entities_info)
+        self._pending_events.setdefault(project_id, []).extend(pending)
+        self._process_pending_events(session)
+        return True
+
+    def _on_processor_idle(self, event):
+        if not self._pending_events:
+            return
+        self.session.rollback()
+        self.session._local_cache.clear()
+        self._process_pending_events(self.session, force=True)
+
+    def _process_pending_events(self, session, force=False):
+        now = time.time()
+        for project_id in tuple(self._pending_events.keys()):
+            pending = self._pending_events[project_id]
+            if not (
+                force
+                or len(pending) >= self.coalesce_max_events
+                or now - pending[0][1] >= self.coalesce_window
+            ):
+                continue
+            self._pending_events.pop(project_id)
+            self._process_events(session, pending)
+
+    def _process_events(self, session, pending):
+        """Synchronize merged changes of collected events.
+
+        Args:
+            session (ftrack_api.Session): Session of event hub.
+            pending (list[tuple[ftrack_api.event.base.Event, float]]): Events
+                with time when they were received.
+        """
+        events = [event for event, _ in pending]
+        event = events[-1]
+        merged_changes = 0
+        if len(events) > 1:
+            entities_info = []
+            for _event in events:
+                entities_info.extend(
+                    self._filter_entities_info(_event["data"]["entities"])
+                )
+            merged_entities_info = self.merge_entities_info(entities_info)
+            merged_changes = len(entities_info) - len(merged_entities_info)
+            # Last event is used as source of merged event for reports
+            data = dict(event["data"])
+            data["entities"] = merged_entities_info
+            event = ftrack_api.event.base.Event(
+                topic=event["topic"],
+                data=data,
+                source=event["source"]
+            )
+            self.log.debug((
+                "Synchronizing {} events with {} merged changes"
+            ).format(len(events), merged_changes))
+
+        try:
+            self.process_event(session, event)
+
+        except Exception:
+            session.rollback()
+            self.log.error(
+                "Synchronization of {} events failed".format(len(events)),
+                exc_info=True
+            )
+
+        finally:
+            self._update_lag_metrics(pending, merged_changes)
+            if self._coalesce_events:
+                session.event_hub.set_events_processed(
+                    _event["data"].get("_event_mongo_id")
+                    for _event in events
+                )
+
+    def merge_entities_info(self, entities_info):
+        """Merge entity changes of multiple events.
+
+        Changes of the same entity and action are merged into one change
+        with old values of the first change and the rest from the last
+        change. Created entities are synchronized with their current state
+        from ftrack so their other changes are skipped. Entities created and
+        removed in the merged events are skipped completely. Task changes
+        are not skipped as they only mark their parents for refresh.
+
+        Args:
+            entities_info (list[dict]): Entity changes in order of events.
+
+        Returns:
+            list[dict]: Merged entity changes.
+        """
+        merged = collections.OrderedDict()
+        added_ids = set()
+        removed_ids = set()
+        for ent_info in entities_info:
+            ftrack_id = ent_info["entityId"]
+            if isinstance(ftrack_id, list):
+                ftrack_id = tuple(ftrack_id)
+            action = ent_info["action"]
+            if ent_info["entity_type"].lower() != "task":
+                if action == "add":
+                    added_ids.add(ftrack_id)
+                elif action == "remove":
+                    removed_ids.add(ftrack_id)
+
+            key = (ftrack_id, action)
+            new_info = copy.deepcopy(ent_info)
+            prev_info = merged.get(key)
+            if prev_info is not None:
+                keys = list(prev_info.get("keys") or [])
+                for ent_key in new_info.get("keys") or []:
+                    if ent_key not in keys:
+                        keys.append(ent_key)
+
+                changes = dict(prev_info.get("changes") or {})
+                for ent_key, change in (new_info.get("changes") or {}).items():
+                    prev_change = changes.get(ent_key)
+                    if (
+                        isinstance(prev_change, dict)
+                        and isinstance(change, dict)
+                        and "old" in prev_change
+                    ):
+                        change["old"] = prev_change["old"]
+                    changes[ent_key] = change
+                new_info["keys"] = keys
+                new_info["changes"] = changes
+            merged[key] = new_info
+
+        output = []
+        for (ftrack_id, action), ent_info in merged.items():
+            if ftrack_id in added_ids:
+                if ftrack_id in removed_ids or action != "add":
+                    continue
+            elif ftrack_id in removed_ids and action != "remove":
+                continue
+            output.append(ent_info)
+        return output
+
+    def _update_lag_metrics(self, pending, merged_changes):
+        now = time.time()
+        metrics = self._lag_metrics
+        last_lag = 0.0
+        for event, received in pending:
+            # Use time when event was stored by event server if available
+            started = event["data"].get("_event_stored") or received
+            lag = max(now - started, 0.0)
+            last_lag = max(last_lag, lag)
+            metrics["total_lag"] += lag
+
+        metrics["processed_events"] += len(pending)
+        metrics["processed_batches"] += 1
+        metrics["merged_changes"] += merged_changes
+        metrics["last_lag"] = last_lag
+        metrics["max_lag"] = max(metrics["max_lag"], last_lag)
+
+    def get_lag_metrics(self):
+        """Metrics of synchronization lag.
+
+        Lag is time between storing of event by event server (or receiving of
+        event by handler) and end of its synchronization.
+
+        Returns:
+            dict[str, Union[int, float]]: Counts of processed events,
+                batches, merged changes and pending events, last, max and
+                average lag in seconds.
+        """
+        metrics = dict(self._lag_metrics)
+        total_lag = metrics.pop("total_lag")
+        metrics["average_lag"] = 0.0
+        if metrics["processed_events"]:
+            metrics["average_lag"] = total_lag / metrics["processed_events"]
+        metrics["pending_events"] = sum(
+            len(pending) for pending in self._pending_events.values()
+        )
+        return metrics
+
+    def get_status_info_values(self):
+        metrics = self.get_lag_metrics()
+        return [
+            "Lag {:.1f}s (max {:.1f}s, average {:.1f}s)".format(
+                metrics["last_lag"],
+                metrics["max_lag"],
+                metrics["average_lag"]
+            ),
+            (
+                "{} events in {} batches, {} merged changes, {} pending"
+            ).format(
+                metrics["processed_events"],
+                metrics["processed_batches"],
+                metrics["merged_changes"],
+                metrics["pending_events"]
+            )
+        ]
+
+    def get_status_info(self):
+        """Status info of synchronization for event server status."""
+        lag_info, events_info = self.get_status_info_values()
+        return [
+            ["Sync to avalon lag", lag_info],
+            ["Sync to avalon events", events_info]
+        ]
+
+    def process_event(self, session, event):
         """
             Main entry port for synchronization.
             Goes through event (can contain multiple changes) and decides if
@@ -23,6 +23,7 @@ from openpype.pipeline.delivery import (
     check_destination_path,
     deliver_single_file,
     deliver_sequence,
+    DeliveryExecutor,
 )
 
 
@@ -556,6 +557,7 @@ class Delivery(BaseAction):
         format_dict = get_format_dict(anatomy, location_path)
 
         datetime_data = get_datetime_data()
+        executor = DeliveryExecutor()
         for repre in repres_to_deliver:
             source_path = repre.get("data", {}).get("path")
             debug_msg = "Processing representation {}".format(repre["_id"])
@@ -594,9 +596,17 @@ class Delivery(BaseAction):
                 self.log
             )
             if not frame:
-                deliver_single_file(*args)
+                deliver_single_file(*args, executor=executor)
             else:
-                deliver_sequence(*args)
+                deliver_sequence(*args, executor=executor)
+
+        counts = executor.process()
+        for header, items in executor.report_items.items():
+            report_items[header].extend(items)
+        self.log.debug((
+            "Delivered files: {transferred}, already delivered: {skipped},"
+            " failed: {failed}"
+        ).format(**counts))
 
         return self.report(report_items)
 
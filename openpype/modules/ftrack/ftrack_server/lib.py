@@ -31,6 +31,7 @@ from openpype.lib import Logger
 
 TOPIC_STATUS_SERVER = "openpype.event.server.status"
 TOPIC_STATUS_SERVER_RESULT = "openpype.event.server.status.result"
+TOPIC_PROCESSOR_IDLE = "openpype.event.server.processor.idle"
 
 
 def get_host_ip():
@@ -113,6 +114,8 @@ class StorerEventHub(SocketBaseEventHub):
 
 class ProcessEventHub(SocketBaseEventHub):
     hearbeat_msg = b"processor"
+    # Topic of local event handled when there are no events to process
+    idle_topic = TOPIC_PROCESSOR_IDLE
 
     is_collection_created = False
     pypelog = Logger.get_logger("Session Processor")
@@ -120,6 +123,9 @@ class ProcessEventHub(SocketBaseEventHub):
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
+        self._status_info_callbacks = []
+        # Ids of handled events which are set as processed by subscriber
+        self._postponed_event_ids = set()
 
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
@@ -148,7 +154,8 @@ class ProcessEventHub(SocketBaseEventHub):
     def wait(self, duration=None):
         """Overridden wait
         Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        set as processed in Mongo DB unless its processing was postponed
+        by subscriber.
         """
         started = time.time()
         self.prepare_dbcon()
@@ -157,13 +164,17 @@ class ProcessEventHub(SocketBaseEventHub):
                 event = self._event_queue.get(timeout=0.1)
             except queue.Empty:
                 if not self.load_events():
+                    self._handle_idle()
                     time.sleep(0.5)
             else:
                 try:
                     self._handle(event)
 
                     mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
+                    if (
+                        mongo_id is None
+                        or mongo_id in self._postponed_event_ids
+                    ):
                         continue
 
                     self.dbcon.update_one(
@@ -184,6 +195,81 @@ class ProcessEventHub(SocketBaseEventHub):
                 if (time.time() - started) > duration:
                     break
 
+    def _handle_idle(self):
+        """Let subscribers process work postponed until there are no events.
+
+        Idle event is handled only locally and subscribers can't reply.
+        """
+        self._handle(
+            ftrack_api.event.base.Event(topic=self.idle_topic),
+            synchronous=True
+        )
+
+    def postpone_event_processed(self, event):
+        """Do not set event as processed in Mongo DB when it is handled.
+
+        Subscriber which processes event later must call
+        'set_events_processed' once the event is processed. Postponed event
+        is not loaded again but is loaded on restart of processor if was not
+        processed.
+
+        Args:
+            event (ftrack_api.event.base.Event): Handled event.
+
+        Returns:
+            Union[ObjectId, None]: Mongo id of event. None if event was not
+                loaded from Mongo DB.
+        """
+        mongo_id = event["data"].get("_event_mongo_id")
+        if mongo_id is not None:
+            self._postponed_event_ids.add(mongo_id)
+        return mongo_id
+
+    def set_events_processed(self, mongo_ids):
+        """Set events with postponed processing as processed in Mongo DB.
+
+        Args:
+            mongo_ids (Iterable[Union[ObjectId, None]]): Mongo ids of events.
+        """
+        mongo_ids = [
+            mongo_id
+            for mongo_id in mongo_ids
+            if mongo_id is not None
+        ]
+        if not mongo_ids:
+            return
+        # Events are loaded again if update fails
+        self._postponed_event_ids.difference_update(mongo_ids)
+        self.dbcon.update_many(
+            {"_id": {"$in": mongo_ids}},
+            {"$set": {"pype_data.is_processed": True}}
+        )
+
+    def add_status_info_callback(self, callback):
+        """Add callback providing additional info for server status.
+
+        Args:
+            callback (Callable[[], list[list[str]]]): Callback returning
+                pairs of label and value.
+        """
+        self._status_info_callbacks.append(callback)
+
+    def get_status_info(self):
+        """Status info collected from registered callbacks.
+
+        Returns:
+            list[list[str]]: Pairs of label and value.
+        """
+        output = []
+        for callback in self._status_info_callbacks:
+            try:
+                output.extend(callback())
+            except Exception:
+                self.pypelog.warning(
+                    "Failed to get status info", exc_info=True
+                )
+        return output
+
     def load_events(self):
         """Load not processed events sorted by stored date"""
         ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
@@ -192,9 +278,10 @@ class ProcessEventHub(SocketBaseEventHub):
             "pype_data.is_processed": True
         })
 
-        not_processed_events = self.dbcon.find(
-            {"pype_data.is_processed": False}
-        ).sort(
+        not_processed_events = self.dbcon.find({
+            "pype_data.is_processed": False,
+            "_id": {"$nin": list(self._postponed_event_ids)}
+        }).sort(
             [("pype_data.stored", pymongo.ASCENDING)]
         ).limit(100)
 
@@ -207,6 +294,11 @@ class ProcessEventHub(SocketBaseEventHub):
             try:
                 event = ftrack_api.event.base.Event(**new_event_data)
                 event["data"]["_event_mongo_id"] = event_data["_id"]
+                # Timestamp when event was stored to measure processing lag
+                stored = event_data["pype_data"]["stored"]
+                event["data"]["_event_stored"] = stored.replace(
+                    tzinfo=datetime.timezone.utc
+                ).timestamp()
             except Exception:
                 self.logger.exception(L(
                     'Failed to convert payload into event: {0}',
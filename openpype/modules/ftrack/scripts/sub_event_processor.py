@@ -48,6 +48,7 @@ def send_status(event):
             ["OpenPype build version", get_build_version() or "N/A"]
         ]
     }
+    new_event_data["status_info"].extend(session.event_hub.get_status_info())
 
     new_event = ftrack_api.event.base.Event(
         topic="openpype.event.server.status.result",
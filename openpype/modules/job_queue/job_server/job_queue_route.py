@@ -14,7 +14,10 @@ class JobQueueResource:
         self.endpoint_defs = (
             ("POST", "/jobs", self.post_job),
             ("GET", "/jobs", self.get_jobs),
-            ("GET", "/jobs/{job_id}", self.get_job)
+            ("POST", "/jobs/batch", self.post_jobs),
+            ("POST", "/jobs/status", self.get_jobs_status),
+            ("GET", "/jobs/{job_id}", self.get_job),
+            ("GET", "/metrics", self.get_metrics)
         )
 
         self.register()
@@ -40,9 +43,78 @@ class JobQueueResource:
                 status=400, message="Key \"host_name\" not filled."
             )
 
-        job = self._job_queue.create_job(host_name, data)
+        try:
+            priority = self._get_priority(data)
+        except ValueError:
+            return Response(
+                status=400, text="Key \"priority\" must be an integer."
+            )
+
+        job = self._job_queue.create_job(host_name, data, priority)
         return Response(status=201, text=job.id)
 
+    async def post_jobs(self, request):
+        """Create multiple jobs at once.
+
+        Body is list of job data, each must contain "host_name" and may
+        contain "priority". Response contains list of job ids in the same
+        order.
+        """
+        jobs_data = await request.json()
+        if not isinstance(jobs_data, list):
+            return Response(status=400, text="Expected list of jobs.")
+
+        jobs_info = []
+        for idx, data in enumerate(jobs_data):
+            host_name = data.get("host_name")
+            if not host_name:
+                return Response(
+                    status=400,
+                    text="Key \"host_name\" not filled in job {}.".format(idx)
+                )
+            try:
+                priority = self._get_priority(data)
+            except ValueError:
+                return Response(
+                    status=400,
+                    text="Key \"priority\" of job {} must be an integer."
+                    .format(idx)
+                )
+            jobs_info.append((host_name, data, priority))
+
+        jobs = self._job_queue.create_jobs(jobs_info)
+        return Response(
+            status=201,
+            body=self.encode([job.id for job in jobs]),
+            content_type="application/json"
+        )
+
+    async def get_jobs_status(self, request):
+        """Statuses of jobs with ids passed in "job_ids" key of body."""
+        data = await request.json()
+        job_ids = data.get("job_ids") or []
+        return Response(
+            status=200,
+            body=self.encode(self._job_queue.get_jobs_status(job_ids)),
+            content_type="application/json"
+        )
+
+    async def get_metrics(self, request):
+        return Response(
+            status=200,
+            body=self.encode(self._job_queue.get_metrics()),
+            content_type="application/json"
+        )
+
+    @staticmethod
+    def _get_priority(data):
+        priority = data.get("priority")
+        if priority is None:
+            return None
+        if isinstance(priority, bool):
+            raise ValueError("Invalid priority")
+        return int(priority)
+
     async def get_job(self, request):
         job_id = request.match_info["job_id"]
         content = self._job_queue.get_job_status(job_id)
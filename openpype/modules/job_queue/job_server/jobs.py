@@ -1,7 +1,11 @@
+import heapq
 import datetime
+import itertools
 import collections
 from uuid import uuid4
 
+from .journal import JobJournal
+
 
 class Job:
     """Job related to specific host name.
@@ -10,14 +14,23 @@ class Job:
     """
     # Remove done jobs each n days to clear memory
     keep_in_memory_days = 3
+    # Jobs with higher priority are assigned first
+    default_priority = 50
 
-    def __init__(self, host_name, data, job_id=None, created_time=None):
+    def __init__(
+        self, host_name, data, job_id=None, created_time=None, priority=None
+    ):
         if job_id is None:
             job_id = str(uuid4())
         self._id = job_id
         if created_time is None:
             created_time = datetime.datetime.now()
+        if priority is None:
+            priority = self.default_priority
         self._created_time = created_time
+        self.priority = int(priority)
+        # Order in queue, set when job is added to queue for the first time
+        self.queue_order = None
         self._started_time = None
         self._done_time = None
         self.host_name = host_name
@@ -44,6 +57,18 @@ class Job:
     def id(self):
         return self._id
 
+    @property
+    def created_time(self):
+        return self._created_time
+
+    @property
+    def started_time(self):
+        return self._started_time
+
+    @property
+    def done_time(self):
+        return self._done_time
+
     @property
     def done(self):
         return self._done
@@ -101,6 +126,7 @@ class Job:
         output = {
             "id": self.id,
             "worker_id": worker_id,
+            "priority": self.priority,
             "done": self._done
         }
         output["message"] = self._message or None
@@ -122,21 +148,134 @@ class Job:
         return output
 
 
+class HostMetrics:
+    """Queue metrics of jobs of one host name."""
+    def __init__(self):
+        self.submitted = 0
+        self.done = 0
+        self.errored = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._started = 0
+        self._run_time_total = 0.0
+        self._finished_runs = 0
+
+    def job_submitted(self):
+        self.submitted += 1
+
+    def job_started(self, job):
+        wait_time = (job.started_time - job.created_time).total_seconds()
+        self._started += 1
+        self._wait_time_total += wait_time
+        self._wait_time_max = max(self._wait_time_max, wait_time)
+
+    def job_done(self, job, success):
+        if success:
+            self.done += 1
+        else:
+            self.errored += 1
+
+        if job.started_time is not None:
+            run_time = (job.done_time - job.started_time).total_seconds()
+            self._run_time_total += run_time
+            self._finished_runs += 1
+
+    def to_data(self, queued_jobs):
+        now = datetime.datetime.now()
+        oldest_wait_time = 0.0
+        if queued_jobs:
+            oldest_wait_time = max(
+                (now - job.created_time).total_seconds()
+                for job in queued_jobs
+            )
+
+        wait_time_avg = 0.0
+        if self._started:
+            wait_time_avg = self._wait_time_total / self._started
+
+        run_time_avg = 0.0
+        if self._finished_runs:
+            run_time_avg = self._run_time_total / self._finished_runs
+
+        return {
+            "queue_depth": len(queued_jobs),
+            "submitted": self.submitted,
+            "started": self._started,
+            "done": self.done,
+            "errored": self.errored,
+            "wait_time_avg": wait_time_avg,
+            "wait_time_max": self._wait_time_max,
+            "oldest_wait_time": oldest_wait_time,
+            "run_time_avg": run_time_avg,
+        }
+
+
 class JobQueue:
     """Queue holds jobs that should be done and workers that can do them.
 
-    Also asign jobs to a worker.
+    Also asign jobs to a worker. Jobs with higher priority are assigned
+    first, jobs with the same priority in order in which were created.
+
+    Args:
+        journal_path (Optional[str]): Path to SQLite database where jobs
+            which are not finished are stored. Stored jobs are added back
+            to queue on initialization.
     """
     old_jobs_check_minutes_interval = 30
+    # Jobs without available workers are errored only after server runs for
+    #   this amount of seconds so workers have time to connect after restart
+    missing_workers_timeout = 60
 
-    def __init__(self):
+    def __init__(self, journal_path=None):
+        self._started_time = datetime.datetime.now()
         self._last_old_jobs_check = datetime.datetime.now()
         self._jobs_by_id = {}
-        self._job_queue_by_host_name = collections.defaultdict(
-            collections.deque
-        )
+        # Heap of (-priority, order, job) items by host name
+        self._job_queue_by_host_name = collections.defaultdict(list)
+        self._job_order = itertools.count()
         self._workers_by_id = {}
         self._workers_by_host_name = collections.defaultdict(list)
+        self._metrics_by_host_name = collections.defaultdict(HostMetrics)
+
+        self._journal = None
+        if journal_path:
+            self._journal = JobJournal(journal_path)
+            self._restore_jobs()
+
+    def _restore_jobs(self):
+        jobs_data = self._journal.get_jobs_data()
+        for job_data in jobs_data:
+            job = Job(**job_data)
+            self._jobs_by_id[job.id] = job
+            self._push_job(job)
+            self._metrics_by_host_name[job.host_name].job_submitted()
+
+        if jobs_data:
+            print("Restored {} jobs from journal \"{}\"".format(
+                len(jobs_data), self._journal.path
+            ))
+
+    def close(self):
+        """Close journal of jobs."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _push_job(self, job):
+        if job.queue_order is None:
+            job.queue_order = next(self._job_order)
+        heapq.heappush(
+            self._job_queue_by_host_name[job.host_name],
+            (-job.priority, job.queue_order, job)
+        )
+
+    @staticmethod
+    def _pop_job(jobs_heap):
+        while jobs_heap:
+            job = heapq.heappop(jobs_heap)[2]
+            if not job.deleted:
+                return job
+        return None
 
     def workers(self):
         """All currently registered workers."""
@@ -158,8 +297,9 @@ class JobQueue:
             # Reset job
             job.set_worker(None)
             job.reset()
-            # Add job back to queue
-            self._job_queue_by_host_name[job.host_name].appendleft(job)
+            # Add job back to queue, original order puts it before jobs
+            #   created later
+            self._push_job(job)
 
         # Remove worker from registered workers
         self._workers_by_id.pop(worker.id, None)
@@ -174,30 +314,67 @@ class JobQueue:
 
         Error all jobs without needed worker.
         """
-        available_host_names = set()
-        for worker in self._workers_by_id.values():
-            host_name = worker.host_name
-            available_host_names.add(host_name)
-            if worker.is_idle():
-                jobs = self._job_queue_by_host_name[host_name]
-                while jobs:
-                    job = jobs.popleft()
-                    if not job.deleted:
-                        worker.set_current_job(job)
+        uptime = datetime.datetime.now() - self._started_time
+        error_missing = (
+            uptime.total_seconds() >= self.missing_workers_timeout
+        )
+        # Only hosts with queued jobs are processed
+        for host_name, jobs_heap in self._job_queue_by_host_name.items():
+            if not jobs_heap:
+                continue
+
+            workers = self._workers_by_host_name.get(host_name)
+            if workers:
+                for worker in workers:
+                    if not worker.is_idle():
+                        continue
+                    job = self._pop_job(jobs_heap)
+                    if job is None:
                         break
+                    worker.set_current_job(job)
+                continue
 
-        for host_name in tuple(self._job_queue_by_host_name.keys()):
-            if host_name in available_host_names:
+            if not error_missing:
                 continue
 
-            jobs_deque = self._job_queue_by_host_name[host_name]
             message = ("Not available workers for \"{}\"").format(host_name)
-            while jobs_deque:
-                job = jobs_deque.popleft()
-                if not job.deleted:
-                    job.set_done(False, message)
+            while jobs_heap:
+                job = self._pop_job(jobs_heap)
+                if job is not None:
+                    self._set_job_done(job, False, message)
         self._remove_old_jobs()
 
+    def set_job_started(self, job_id):
+        """Mark job as started when worker confirmed it took the job.
+
+        Assigned job is waiting until then.
+
+        Returns:
+            Union[Job, None]: Started job or None if job was not found.
+        """
+        job = self._jobs_by_id.get(job_id)
+        if job is not None and not job.started and not job.done:
+            job.set_started()
+            self._metrics_by_host_name[job.host_name].job_started(job)
+        return job
+
+    def _set_job_done(self, job, success, message=None, data=None):
+        job.set_done(success, message, data)
+        self._metrics_by_host_name[job.host_name].job_done(job, success)
+        if self._journal is not None:
+            self._journal.remove_jobs([job.id])
+
+    def set_job_done(self, job_id, success=True, message=None, data=None):
+        """Mark job as finished.
+
+        Returns:
+            Union[Job, None]: Finished job or None if job was not found.
+        """
+        job = self._jobs_by_id.get(job_id)
+        if job is not None:
+            self._set_job_done(job, success, message, data)
+        return job
+
     def get_jobs(self):
         return self._jobs_by_id.values()
 
@@ -205,12 +382,34 @@ class JobQueue:
         """Job by it's id."""
         return self._jobs_by_id.get(job_id)
 
-    def create_job(self, host_name, job_data):
+    def create_job(self, host_name, job_data, priority=None):
         """Create new job from passed data and add it to queue."""
-        job = Job(host_name, job_data)
-        self._jobs_by_id[job.id] = job
-        self._job_queue_by_host_name[host_name].append(job)
-        return job
+        return self.create_jobs([(host_name, job_data, priority)])[0]
+
+    def create_jobs(self, jobs_info):
+        """Create multiple jobs at once.
+
+        Jobs are stored to journal in single transaction.
+
+        Args:
+            jobs_info (Iterable[tuple[str, dict, Union[int, None]]]): Host
+                name, job data and priority of each job.
+
+        Returns:
+            list[Job]: Created jobs.
+        """
+        jobs = [
+            Job(host_name, job_data, priority=priority)
+            for host_name, job_data, priority in jobs_info
+        ]
+        if self._journal is not None:
+            self._journal.add_jobs(jobs)
+
+        for job in jobs:
+            self._jobs_by_id[job.id] = job
+            self._push_job(job)
+            self._metrics_by_host_name[job.host_name].job_submitted()
+        return jobs
 
     def _remove_old_jobs(self):
         """Once in specific time look if should remove old finished jobs."""
@@ -229,8 +428,11 @@ class JobQueue:
         if job is None:
             return
 
+        # Job is removed from queue heap when it's popped
         job.set_deleted()
         self._jobs_by_id.pop(job.id)
+        if self._journal is not None:
+            self._journal.remove_jobs([job.id])
 
     def get_job_status(self, job_id):
         """Job's status based on id."""
@@ -238,3 +440,35 @@ class JobQueue:
         if job is None:
             return {}
         return job.status()
+
+    def get_jobs_status(self, job_ids):
+        """Statuses of multiple jobs.
+
+        Returns:
+            dict[str, dict[str, Any]]: Status by job id, status of unknown
+                job is empty dictionary.
+        """
+        return {
+            job_id: self.get_job_status(job_id)
+            for job_id in job_ids
+        }
+
+    def get_metrics(self):
+        """Queue depth and latency metrics per host name.
+
+        Returns:
+            dict[str, dict[str, Any]]: Metrics by host name.
+        """
+        output = {}
+        for host_name, metrics in self._metrics_by_host_name.items():
+            queued_jobs = [
+                item[2]
+                for item in self._job_queue_by_host_name.get(host_name, [])
+                if not item[2].deleted
+            ]
+            host_data = metrics.to_data(queued_jobs)
+            host_data["workers"] = len(
+                self._workers_by_host_name.get(host_name) or []
+            )
+            output[host_name] = host_data
+        return output
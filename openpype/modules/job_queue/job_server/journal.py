@@ -0,0 +1,109 @@
+import json
+import sqlite3
+import datetime
+import threading
+
+
+class JobJournal:
+    """On-disk journal of jobs which were not finished yet.
+
+    Jobs are stored to SQLite database in WAL mode when they're added to
+    queue and removed when they're done or deleted. Jobs left in journal are
+    added back to queue when server starts again.
+
+    Args:
+        path (str): Path to database file.
+    """
+    _datetime_format = "%Y-%m-%d %H:%M:%S.%f"
+
+    def __init__(self, path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # Commit is durable enough with WAL and much faster than 'FULL'
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " host_name TEXT NOT NULL,"
+            " priority INTEGER NOT NULL,"
+            " created_time TEXT NOT NULL,"
+            " data TEXT NOT NULL"
+            ")"
+        )
+        self._connection.commit()
+
+    @property
+    def path(self):
+        return self._path
+
+    def add_jobs(self, jobs):
+        """Store jobs in single transaction.
+
+        Args:
+            jobs (Iterable[Job]): Jobs to store.
+        """
+        rows = [
+            (
+                job.id,
+                job.host_name,
+                job.priority,
+                job.created_time.strftime(self._datetime_format),
+                json.dumps(job.data)
+            )
+            for job in jobs
+        ]
+        if not rows:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO jobs"
+                " (id, host_name, priority, created_time, data)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def remove_jobs(self, job_ids):
+        """Remove finished or deleted jobs.
+
+        Args:
+            job_ids (Iterable[str]): Ids of jobs to remove.
+        """
+        rows = [(job_id, ) for job_id in job_ids]
+        if not rows:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM jobs WHERE id = ?", rows
+            )
+
+    def get_jobs_data(self):
+        """Data of stored jobs in order in which they were created.
+
+        Returns:
+            list[dict[str, Any]]: Data to create jobs.
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "SELECT id, host_name, priority, created_time, data"
+                " FROM jobs ORDER BY created_time, rowid"
+            )
+            rows = cursor.fetchall()
+
+        return [
+            {
+                "job_id": job_id,
+                "host_name": host_name,
+                "priority": priority,
+                "created_time": datetime.datetime.strptime(
+                    created_time, self._datetime_format
+                ),
+                "data": json.loads(data),
+            }
+            for job_id, host_name, priority, created_time, data in rows
+        ]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -14,7 +14,7 @@ class SharedObjects:
         cls.stopped = True
 
 
-def main(port=None, host=None):
+def main(port=None, host=None, journal_path=None):
     def signal_handler(sig, frame):
         print("Signal to kill process received. Termination starts.")
         SharedObjects.stop()
@@ -35,7 +35,9 @@ def main(port=None, host=None):
         return 1
 
     print("Running server {}:{}".format(host, port))
-    manager = WebServerManager(port, host)
+    if journal_path:
+        print("Using jobs journal {}".format(journal_path))
+    manager = WebServerManager(port, host, journal_path=journal_path)
     manager.start_server()
 
     stopped = False
@@ -53,9 +53,7 @@ class WorkerRpc(JsonRpc):
         if worker is not None:
             worker.set_current_job(None)
 
-        job = self._job_queue.get_job(job_id)
-        if job is not None:
-            job.set_done(success, message, data)
+        self._job_queue.set_job_done(job_id, success, message, data)
         return True
 
     async def send_jobs(self):
@@ -63,7 +61,9 @@ class WorkerRpc(JsonRpc):
         for worker in self._job_queue.workers():
             if worker.job_assigned() and not worker.is_working():
                 try:
-                    await worker.send_job()
+                    job = worker.current_job
+                    if await worker.send_job():
+                        self._job_queue.set_job_started(job.id)
 
                 except ConnectionResetError:
                     invalid_workers.append(worker)
@@ -27,6 +27,8 @@ workstations know where to send or receive jobs.
 ### start_server
 - start server which is handles jobs
 - it is possible to specify port and host address (default is localhost:8079)
+- it is possible to specify path to jobs journal, unfinished jobs are stored
+    there and are queued again when server is restarted
 
 ### start_worker
 - start worker which will process jobs
@@ -137,21 +139,67 @@ class JobQueueModule(OpenPypeModule):
     def server_url(self):
         return self._server_url
 
-    def send_job(self, host_name, job_data):
+    def send_job(self, host_name, job_data, priority=None):
         import requests
 
         job_data = job_data or {}
         job_data["host_name"] = host_name
+        if priority is not None:
+            job_data["priority"] = priority
         api_path = "{}/api/jobs".format(self._server_url)
         post_request = requests.post(api_path, data=json.dumps(job_data))
         return str(post_request.content.decode())
 
+    def send_jobs(self, host_name, jobs_data, priority=None):
+        """Send multiple jobs in one request.
+
+        Args:
+            host_name (str): Host name which should process the jobs.
+            jobs_data (list[dict]): Data of jobs.
+            priority (Optional[int]): Priority of jobs without priority
+                in their data. Higher priority jobs are processed first.
+
+        Returns:
+            list[str]: Ids of created jobs.
+        """
+        import requests
+
+        payload = []
+        for job_data in jobs_data:
+            job_data = dict(job_data or {})
+            job_data["host_name"] = host_name
+            if priority is not None:
+                job_data.setdefault("priority", priority)
+            payload.append(job_data)
+
+        api_path = "{}/api/jobs/batch".format(self._server_url)
+        response = requests.post(api_path, data=json.dumps(payload))
+        response.raise_for_status()
+        return response.json()
+
     def get_job_status(self, job_id):
         import requests
 
         api_path = "{}/api/jobs/{}".format(self._server_url, job_id)
         return requests.get(api_path).json()
 
+    def get_jobs_status(self, job_ids):
+        """Statuses of multiple jobs by their ids."""
+        import requests
+
+        api_path = "{}/api/jobs/status".format(self._server_url)
+        response = requests.post(
+            api_path, data=json.dumps({"job_ids": list(job_ids)})
+        )
+        return response.json()
+
+    def get_queue_metrics(self):
+        """Queue depth and latency metrics per host name."""
+        import requests
+
+        api_path = "{}/api/metrics".format(self._server_url)
+        return requests.get(api_path).json()
+
     def cli(self, click_group):
         click_group.add_command(cli_main)
 
@@ -165,10 +213,10 @@ class JobQueueModule(OpenPypeModule):
         )
 
     @classmethod
-    def start_server(cls, port=None, host=None):
+    def start_server(cls, port=None, host=None, journal_path=None):
         from .job_server import main
 
-        return main(port, host)
+        return main(port, host, journal_path)
 
     @classmethod
     def start_worker(cls, app_name, server_url=None):
@@ -227,8 +275,12 @@ def cli_main():
 )
 @click.option("--port", help="Server port")
 @click.option("--host", help="Server host (ip address)")
-def cli_start_server(port, host):
-    JobQueueModule.start_server(port, host)
+@click.option(
+    "--journal_path",
+    help="Path to SQLite file where unfinished jobs are stored."
+)
+def cli_start_server(port, host, journal_path):
+    JobQueueModule.start_server(port, host, journal_path)
 
 
 @cli_main.command(
@@ -144,7 +144,15 @@ def push_to_zou(login, password):
     default=False,
     help="Listen to events only without any syncing",
 )
-def sync_service(login, password, projects, listen_only):
+@click.option(
+    "-dr",
+    "--dry-run",
+    "dry_run",
+    is_flag=True,
+    default=False,
+    help="Report sync operations and timing without writing, no listening",
+)
+def sync_service(login, password, projects, listen_only, dry_run):
     """Synchronize openpype database from Zou sever database.
 
     Args:
@@ -152,10 +160,17 @@ def sync_service(login, password, projects, listen_only):
         password (str): Kitsu user password
         projects (tuple): specific kitsu projects
         listen_only (bool): run listen only without any syncing
+        dry_run (bool): only report sync operations without writing them
     """
     from .utils.update_op_with_zou import sync_all_projects
     from .utils.sync_service import start_listeners
 
+    if dry_run:
+        sync_all_projects(
+            login, password, filter_projects=projects, dry_run=True
+        )
+        return
+
     if not listen_only:
         sync_all_projects(login, password, filter_projects=projects)
 
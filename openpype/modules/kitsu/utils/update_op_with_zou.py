@@ -1,16 +1,16 @@
 """Functions to update OpenPype data using Kitsu DB (a.k.a Zou)."""
 from copy import deepcopy
 import re
+import time
 from typing import Dict, List
 
-from pymongo import DeleteOne, UpdateOne
+from bson.objectid import ObjectId
+from pymongo import DeleteOne, InsertOne, UpdateOne
 import gazu
 
 from openpype.client import (
     get_project,
     get_assets,
-    get_asset_by_id,
-    get_asset_by_name,
     create_project,
 )
 from openpype.pipeline import AvalonMongoDB
@@ -23,13 +23,23 @@ log = Logger.get_logger(__name__)
 # Accepted namin pattern for OP
 naming_pattern = re.compile("^[a-zA-Z0-9_.]*$")
 
+# Maximum number of operations sent to database in single bulk write
+BULK_WRITE_CHUNK_SIZE = 1000
+
+# Names of root folders of assets and shots hierarchy
+ROOT_FOLDER_NAMES = ("Assets", "Shots")
+
 
 def create_op_asset(gazu_entity: dict) -> dict:
     """Create OP asset dict from gazu entity.
 
+    Document has generated '_id' so it can be referenced before it is
+    inserted to database.
+
     :param gazu_entity:
     """
     return {
+        "_id": ObjectId(),
         "name": gazu_entity["name"],
         "type": "asset",
         "schema": "openpype:asset-3.0",
@@ -68,16 +78,22 @@ def update_op_assets(
     project_doc: dict,
     entities_list: List[dict],
     asset_doc_ids: Dict[str, dict],
+    root_folder_ids: Dict[str, ObjectId] = None,
 ) -> List[Dict[str, dict]]:
     """Update OpenPype assets.
     Set 'data' and 'parent' fields.
 
+    Assets which are missing in 'asset_doc_ids' are created in database
+    with single query before update data are computed.
+
     Args:
         dbcon (AvalonMongoDB): Connection to DB
         gazu_project (dict): Dict of gazu,
         project_doc (dict): Dict of project,
         entities_list (List[dict]): List of zou entities to update
         asset_doc_ids (Dict[str, dict]): Dicts of [{zou_id: asset_doc}, ...]
+        root_folder_ids (Dict[str, ObjectId]): Ids of root folder docs by
+            their name. Queried from database if not passed.
 
     Returns:
         List[Dict[str, dict]]: List of (doc_id, update_dict) tuples
@@ -87,14 +103,22 @@ def update_op_assets(
 
     project_name = project_doc["name"]
 
+    # Create missing assets
+    new_asset_docs = []
+    for item in entities_list:
+        if not asset_doc_ids.get(item["id"]):
+            asset_doc = create_op_asset(item)
+            asset_doc_ids[item["id"]] = asset_doc
+            new_asset_docs.append(asset_doc)
+    if new_asset_docs:
+        dbcon.insert_many(new_asset_docs)
+
+    if root_folder_ids is None:
+        root_folder_ids = get_root_folder_ids(project_name)
+
     assets_with_update = []
     for item in entities_list:
-        # Check asset exists
-        item_doc = asset_doc_ids.get(item["id"])
-        if not item_doc:  # Create asset
-            op_asset = create_op_asset(item)
-            insert_result = dbcon.insert_one(op_asset)
-            item_doc = get_asset_by_id(project_name, insert_result.inserted_id)
+        item_doc = asset_doc_ids[item["id"]]
 
         # Update asset
         item_data = deepcopy(item_doc["data"])
@@ -232,15 +256,8 @@ def update_op_assets(
                 )
 
         if visual_parent_doc_id is None:
-            # Find root folder doc ("Assets" or "Shots")
-            root_folder_doc = get_asset_by_name(
-                project_name,
-                asset_name=entity_root_asset_name,
-                fields=["_id", "data.root_of"],
-            )
-
-            if root_folder_doc:
-                visual_parent_doc_id = root_folder_doc["_id"]
+            # Use root folder doc ("Assets" or "Shots")
+            visual_parent_doc_id = root_folder_ids.get(entity_root_asset_name)
 
         # Visual parent for hierarchy
         item_data["visualParent"] = visual_parent_doc_id
@@ -293,20 +310,53 @@ def update_op_assets(
     return assets_with_update
 
 
-def write_project_to_op(project: dict, dbcon: AvalonMongoDB) -> UpdateOne:
+def get_root_folder_ids(
+    project_name: str, asset_docs: List[dict] = None
+) -> Dict[str, ObjectId]:
+    """Get ids of root folder docs ("Assets" and "Shots").
+
+    Args:
+        project_name (str): Project name
+        asset_docs (List[dict]): Prefetched asset docs of the project. Root
+            folder docs are queried from database if not passed.
+
+    Returns:
+        Dict[str, ObjectId]: Ids of existing root folder docs by name
+    """
+    if asset_docs is None:
+        asset_docs = get_assets(
+            project_name,
+            asset_names=ROOT_FOLDER_NAMES,
+            fields=["_id", "name"],
+        )
+
+    return {
+        asset_doc["name"]: asset_doc["_id"]
+        for asset_doc in asset_docs
+        if asset_doc["name"] in ROOT_FOLDER_NAMES
+    }
+
+
+def write_project_to_op(
+    project: dict, dbcon: AvalonMongoDB, dry_run: bool = False
+) -> UpdateOne:
     """Write gazu project to OP database.
     Create project if doesn't exist.
 
     Args:
         project (dict): Gazu project
         dbcon (AvalonMongoDB): DB to create project in
+        dry_run (bool): Do not create project and do not update Zou.
 
     Returns:
-        UpdateOne: Update instance for the project
+        UpdateOne: Update instance for the project, None in dry run mode
+            when project does not exist yet.
     """
     project_name = project["name"]
     project_dict = get_project(project_name)
     if not project_dict:
+        if dry_run:
+            return None
         project_dict = create_project(project_name, project_name)
 
     # Project data and tasks
@@ -319,7 +369,8 @@ def write_project_to_op(project: dict, dbcon: AvalonMongoDB) -> UpdateOne:
         project["code"] = project_code
 
         # Update Zou
-        gazu.project.update_project(project)
+        if not dry_run:
+            gazu.project.update_project(project)
 
     # Update data
     project_data.update(
@@ -361,7 +412,8 @@ def sync_all_projects(
     password: str,
     ignore_projects: list = None,
     filter_projects: tuple = None,
-):
+    dry_run: bool = False,
+) -> List[dict]:
     """Update all OP projects in DB with Zou data.
 
     Args:
@@ -369,8 +421,13 @@ def sync_all_projects(
         password (str): Kitsu user password
         ignore_projects (list): List of unsynced project names
         filter_projects (tuple): Tuple of filter project names to sync with
+        dry_run (bool): Only compute and report operations, nothing is
+            written to DB or Zou.
     Raises:
         gazu.exception.AuthFailedException: Wrong user login and/or password
+
+    Returns:
+        List[dict]: Reports of synchronized projects.
     """
 
     # Authenticate
@@ -400,13 +457,58 @@ def sync_all_projects(
         # all project
         project_to_sync = all_projects
 
+    reports = []
     for project in project_to_sync:
         if ignore_projects and project["name"] in ignore_projects:
             continue
-        sync_project_from_kitsu(dbcon, project)
+        report = sync_project_from_kitsu(dbcon, project, dry_run=dry_run)
+        if report:
+            reports.append(report)
+
+    if reports:
+        log.info(
+            "{}Synchronized {} projects: {} inserts, {} updates,"
+            " {} deletes in {:.2f}s".format(
+                "[Dry run] " if dry_run else "",
+                len(reports),
+                sum(report["insert"] for report in reports),
+                sum(report["update"] for report in reports),
+                sum(report["delete"] for report in reports),
+                sum(
+                    report["fetch_time"]
+                    + report["compute_time"]
+                    + report["write_time"]
+                    for report in reports
+                ),
+            )
+        )
+    return reports
+
+
+def bulk_write_in_chunks(
+    dbcon: AvalonMongoDB,
+    operations: list,
+    chunk_size: int = BULK_WRITE_CHUNK_SIZE,
+):
+    """Write operations into DB with bulk writes of limited size.
+
+    Chunks are written in order so operations may depend on previous ones.
+
+    Args:
+        dbcon (AvalonMongoDB): MongoDB connection
+        operations (list): Pymongo write operations
+        chunk_size (int): Maximum number of operations in one bulk write
+    """
+    for idx in range(0, len(operations), chunk_size):
+        dbcon.bulk_write(operations[idx:idx + chunk_size])
 
 
-def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
+def sync_project_from_kitsu(
+    dbcon: AvalonMongoDB,
+    project: dict,
+    dry_run: bool = False,
+    chunk_size: int = BULK_WRITE_CHUNK_SIZE,
+) -> dict:
     """Update OP project in DB with Zou data.
 
     `root_of` is meant to sort entities by type for a better readability in
@@ -414,11 +516,23 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
     asset entities under two different root folders or hierarchy, defined in
     settings.
 
+    All asset docs of the project are queried once, created, updated and
+    deleted docs are computed in memory and written with chunked bulk
+    writes.
+
     Args:
         dbcon (AvalonMongoDB): MongoDB connection
         project (dict): Project dict got using gazu.
+        dry_run (bool): Only compute and report operations, nothing is
+            written to DB or Zou.
+        chunk_size (int): Maximum number of operations in one bulk write.
+
+    Returns:
+        dict: Report with number of 'insert', 'update' and 'delete'
+            operations and 'fetch_time', 'compute_time' and 'write_time'
+            in seconds. None if project is not synchronized.
     """
-    bulk_writes = []
+    start_time = time.time()
 
     # Get project from zou
     if not project:
@@ -432,12 +546,12 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
             break
 
     #  Do not sync closed kitsu project that is not found in openpype
-    if project["project_status_name"] == "Closed" and not get_project(
-        project["name"]
-    ):
+    project_name = project["name"]
+    project_dict = get_project(project_name)
+    if project["project_status_name"] == "Closed" and not project_dict:
         return
 
-    log.info(f"Synchronizing {project['name']}...")
+    log.info(f"Synchronizing {project_name}...")
 
     # Get all assets from zou
     all_assets = gazu.asset.all_assets_for_project(project)
@@ -455,12 +569,32 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
         if naming_pattern.match(item["name"])
     ]
 
+    # Query all assets of the local project
+    asset_docs = []
+    if project_dict:
+        asset_docs = list(get_assets(project_name))
+
+    report = {
+        "project": project_name,
+        "insert": 0,
+        "update": 0,
+        "delete": 0,
+        "fetch_time": time.time() - start_time,
+        "compute_time": 0.0,
+        "write_time": 0.0,
+    }
+    start_time = time.time()
+
     # Sync project. Create if doesn't exist
-    project_name = project["name"]
-    project_dict = get_project(project_name)
-    if not project_dict:
+    if not project_dict and not dry_run:
         log.info("Project created: {}".format(project_name))
-    bulk_writes.append(write_project_to_op(project, dbcon))
+    project_update = write_project_to_op(project, dbcon, dry_run=dry_run)
+    if project_update is None:
+        # Project would be created, its assets can't be computed without it
+        report["insert"] += 1
+        report["compute_time"] = time.time() - start_time
+        _log_sync_report(report, dry_run)
+        return report
 
     if project["project_status_name"] == "Closed":
         return
@@ -470,80 +604,99 @@ def sync_project_from_kitsu(dbcon: AvalonMongoDB, project: dict):
         project_dict = get_project(project_name)
     dbcon.Session["AVALON_PROJECT"] = project_name
 
-    # Query all assets of the local project
     zou_ids_and_asset_docs = {
         asset_doc["data"]["zou"]["id"]: asset_doc
-        for asset_doc in get_assets(project_name)
+        for asset_doc in asset_docs
         if asset_doc["data"].get("zou", {}).get("id")
     }
     zou_ids_and_asset_docs[project["id"]] = project_dict
 
     # Create entities root folders
-    to_insert = [
-        {
-            "name": r,
+    root_folder_ids = get_root_folder_ids(project_name, asset_docs)
+    new_asset_docs = []
+    for root_name in ROOT_FOLDER_NAMES:
+        if root_name in root_folder_ids:
+            continue
+        root_folder_doc = {
+            "_id": ObjectId(),
+            "name": root_name,
             "type": "asset",
             "schema": "openpype:asset-3.0",
             "data": {
-                "root_of": r,
+                "root_of": root_name,
                 "tasks": {},
                 "visualParent": None,
                 "parents": [],
             },
         }
-        for r in ["Assets", "Shots"]
-        if not get_asset_by_name(
-            project_name, r, fields=["_id", "data.root_of"]
-        )
-    ]
-
-    # Create
-    to_insert.extend(
-        [
-            create_op_asset(item)
-            for item in all_entities
-            if item["id"] not in zou_ids_and_asset_docs.keys()
-        ]
-    )
-    if to_insert:
-        # Insert doc in DB
-        dbcon.insert_many(to_insert)
-
-        # Update existing docs
-        zou_ids_and_asset_docs.update(
-            {
-                asset_doc["data"]["zou"]["id"]: asset_doc
-                for asset_doc in get_assets(project_name)
-                if asset_doc["data"].get("zou")
-            }
-        )
-
-    # Update
-    bulk_writes.extend(
-        [
-            UpdateOne({"_id": id}, update)
-            for id, update in update_op_assets(
-                dbcon,
-                project,
-                project_dict,
-                all_entities,
-                zou_ids_and_asset_docs,
-            )
-        ]
-    )
+        root_folder_ids[root_name] = root_folder_doc["_id"]
+        new_asset_docs.append(root_folder_doc)
+
+    # Create missing asset docs in memory, they're inserted with their data
+    for item in all_entities:
+        if item["id"] not in zou_ids_and_asset_docs:
+            asset_doc = create_op_asset(item)
+            zou_ids_and_asset_docs[item["id"]] = asset_doc
+            new_asset_docs.append(asset_doc)
+
+    new_asset_docs_by_id = {
+        asset_doc["_id"]: asset_doc for asset_doc in new_asset_docs
+    }
+    update_operations = []
+    for doc_id, update in update_op_assets(
+        dbcon,
+        project,
+        project_dict,
+        all_entities,
+        zou_ids_and_asset_docs,
+        root_folder_ids,
+    ):
+        new_asset_doc = new_asset_docs_by_id.get(doc_id)
+        if new_asset_doc is not None:
+            new_asset_doc.update(update["$set"])
+        else:
+            update_operations.append(UpdateOne({"_id": doc_id}, update))
 
     # Delete
     diff_assets = set(zou_ids_and_asset_docs.keys()) - {
         e["id"] for e in all_entities + [project]
     }
-    if diff_assets:
-        bulk_writes.extend(
-            [
-                DeleteOne(zou_ids_and_asset_docs[asset_id])
-                for asset_id in diff_assets
-            ]
-        )
+    delete_operations = [
+        DeleteOne({"_id": zou_ids_and_asset_docs[asset_id]["_id"]})
+        for asset_id in diff_assets
+    ]
+
+    bulk_writes = [project_update]
+    bulk_writes.extend(InsertOne(asset_doc) for asset_doc in new_asset_docs)
+    bulk_writes.extend(update_operations)
+    bulk_writes.extend(delete_operations)
+
+    report["insert"] += len(new_asset_docs)
+    report["update"] += len(update_operations) + 1
+    report["delete"] += len(delete_operations)
+    report["compute_time"] = time.time() - start_time
 
     # Write into DB
-    if bulk_writes:
-        dbcon.bulk_write(bulk_writes)
+    if not dry_run:
+        start_time = time.time()
+        bulk_write_in_chunks(dbcon, bulk_writes, chunk_size)
+        report["write_time"] = time.time() - start_time
+
+    _log_sync_report(report, dry_run)
+    return report
+
+
+def _log_sync_report(report: dict, dry_run: bool):
+    log.info(
+        "{}{}: {} inserts, {} updates, {} deletes"
+        " (fetch {:.2f}s, compute {:.2f}s, write {:.2f}s)".format(
+            "[Dry run] " if dry_run else "",
+            report["project"],
+            report["insert"],
+            report["update"],
+            report["delete"],
+            report["fetch_time"],
+            report["compute_time"],
+            report["write_time"],
+        )
+    )
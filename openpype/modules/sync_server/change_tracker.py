@@ -0,0 +1,191 @@
+"""Tracking of representations changed between sync loops.
+
+Used by incremental mode of sync server. Instead of aggregating all
+representations of a project on each loop only representations changed since
+previous loop are rescanned. Changes are received from Mongo change stream
+when DB supports it (replica set), otherwise representations are queried
+by watermark of their creation time (ObjectId) and of 'sync_updated_dt'
+which is stamped on each create and update of representation by client
+operations (e.g. by integrator) and by sync server on each site update.
+
+Full scan of project is still triggered periodically as a safety net for
+changes not caught by watermark (e.g. documents changed directly in DB).
+"""
+
+import time
+import threading
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
+from pymongo.errors import PyMongoError
+
+from openpype.lib import Logger
+from openpype.client.mongo.operations import REPRESENTATION_UPDATED_KEY
+
+# Key of representation document stamped on changes of representation
+SYNC_UPDATED_KEY = REPRESENTATION_UPDATED_KEY
+
+
+class RepresentationChangeTracker(object):
+    """Queue of dirty representation ids of single project.
+
+    Args:
+        collection (pymongo.collection.Collection): Project collection.
+        full_sync_interval (float): Seconds between full reconciliations.
+        watermark_overlap (float): Seconds subtracted from watermark to
+            compensate time difference of machines writing to DB.
+        log (Optional[logging.Logger]): Logger.
+    """
+
+    def __init__(
+        self,
+        collection,
+        full_sync_interval=3600,
+        watermark_overlap=60,
+        log=None
+    ):
+        if log is None:
+            log = Logger.get_logger(self.__class__.__name__)
+        self.log = log
+        self._collection = collection
+        self._full_sync_interval = full_sync_interval
+        self._watermark_overlap = timedelta(seconds=watermark_overlap)
+
+        self._lock = threading.Lock()
+        self._dirty_ids = set()
+        self._last_full_sync = None
+        self._watermark = None
+
+        self._stream = None
+        self._stream_thread = None
+        self._stream_failed = False
+        self._is_running = False
+
+    @property
+    def uses_change_stream(self):
+        return self._stream_thread is not None and not self._stream_failed
+
+    def start(self):
+        """Start receiving changes from change stream if possible."""
+
+        if self._is_running:
+            return
+        self._is_running = True
+        try:
+            self._stream = self._collection.watch(
+                [{"$match": {
+                    "operationType": {"$in": ["insert", "update", "replace"]}
+                }}]
+            )
+        except PyMongoError as exc:
+            # Standalone Mongo servers don't support change streams
+            self.log.info((
+                "Change stream of '{}' is not available ({}),"
+                " using watermark of changes."
+            ).format(self._collection.name, exc))
+            self._stream = None
+            return
+
+        self._stream_thread = threading.Thread(
+            target=self._stream_loop, daemon=True
+        )
+        self._stream_thread.start()
+
+    def stop(self):
+        """Stop receiving changes."""
+
+        self._is_running = False
+        stream = self._stream
+        self._stream = None
+        if stream is not None:
+            try:
+                stream.close()
+            except PyMongoError:
+                pass
+        if self._stream_thread is not None:
+            self._stream_thread.join(1)
+            self._stream_thread = None
+
+    def _stream_loop(self):
+        try:
+            while self._is_running and self._stream is not None:
+                change = self._stream.try_next()
+                if change is None:
+                    time.sleep(0.1)
+                    continue
+                self.add_dirty_ids([change["documentKey"]["_id"]])
+
+        except Exception:
+            if not self._is_running:
+                return
+            # Changes may have been lost, full scan will catch them and
+            #   watermark is used from now on
+            self.log.warning(
+                "Change stream of '{}' failed, using watermark of changes."
+                .format(self._collection.name),
+                exc_info=True
+            )
+            with self._lock:
+                self._stream_failed = True
+                self._last_full_sync = None
+
+    def add_dirty_ids(self, representation_ids):
+        """Mark representations to be rescanned in next loop.
+
+        Args:
+            representation_ids (Iterable[ObjectId]): Representation ids.
+        """
+
+        with self._lock:
+            self._dirty_ids.update(representation_ids)
+
+    def request_full_sync(self):
+        """Next call of 'pop_dirty_ids' will request full scan."""
+
+        with self._lock:
+            self._last_full_sync = None
+
+    def pop_dirty_ids(self):
+        """Representation ids which should be rescanned.
+
+        Returns:
+            Union[list[ObjectId], None]: Ids of changed representations or
+                None if all representations of project should be scanned.
+        """
+
+        now = datetime.utcnow()
+        current_time = time.time()
+        with self._lock:
+            if (
+                self._last_full_sync is None
+                or current_time - self._last_full_sync
+                >= self._full_sync_interval
+            ):
+                self._last_full_sync = current_time
+                self._watermark = now
+                self._dirty_ids = set()
+                return None
+
+        if not self.uses_change_stream:
+            self._query_watermark_changes(now)
+
+        with self._lock:
+            dirty_ids = list(self._dirty_ids)
+            self._dirty_ids = set()
+        return dirty_ids
+
+    def _query_watermark_changes(self, now):
+        watermark = self._watermark - self._watermark_overlap
+        query = {
+            "type": "representation",
+            "$or": [
+                {"_id": {"$gte": ObjectId.from_datetime(watermark)}},
+                {SYNC_UPDATED_KEY: {"$gte": watermark}},
+            ]
+        }
+        repre_ids = [
+            doc["_id"]
+            for doc in self._collection.find(query, {"_id": True})
+        ]
+        self._watermark = now
+        self.add_dirty_ids(repre_ids)
@@ -349,10 +349,23 @@ class SyncServerThread(threading.Thread):
                     if not all([local_site, remote_site]):
                         continue
 
+                    # incremental sync rescans only changed representations
+                    tracker = self.module.get_change_tracker(project_name)
+                    representation_ids = None
+                    if tracker is not None:
+                        representation_ids = tracker.pop_dirty_ids()
+                        if representation_ids is not None:
+                            self.log.debug(
+                                "Changed representations in {}: {}".format(
+                                    project_name, len(representation_ids)))
+                            if not representation_ids:
+                                continue
+
                     sync_repres = self.module.get_sync_representations(
                         project_name,
                         local_site,
-                        remote_site
+                        remote_site,
+                        representation_ids
                     )
 
                     task_files_to_process = []
@@ -376,15 +389,23 @@ class SyncServerThread(threading.Thread):
                     # first call to get_provider could be expensive, its
                     # building folder tree structure in memory
                     # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
+                    # representations not fully processed in this loop
+                    postponed_ids = set()
                     for sync in sync_repres:
                         if limit <= 0:
+                            postponed_ids.add(sync["_id"])
                             continue
+                        # representation waiting for sync is checked again
+                        #   in next loop if none of its files was processed
+                        #   (processed are found by their changes)
+                        tasks_count = len(task_files_to_process)
                         files = sync.get("files") or []
                         if files:
                             for file in files:
                                 # skip already processed files
                                 file_path = file.get('path', '')
                                 if file_path in processed_file_path:
+                                    postponed_ids.add(sync["_id"])
                                     continue
                                 status = self.module.check_status(
                                     file,
@@ -431,6 +452,8 @@ class SyncServerThread(threading.Thread):
                                                                  project_name
                                                                  ))
                                     processed_file_path.add(file_path)
+                        if tasks_count == len(task_files_to_process):
+                            postponed_ids.add(sync["_id"])
 
                     self.log.debug("Sync tasks count {}".format(
                         len(task_files_to_process)
@@ -438,19 +461,21 @@ class SyncServerThread(threading.Thread):
                     files_created = await asyncio.gather(
                         *task_files_to_process,
                         return_exceptions=True)
+                    # all results of project are stored in single bulk write
+                    results = []
                     for file_id, info in zip(files_created,
                                              files_processed_info):
-                        file, representation, site, project_name = info
+                        file, representation, site, _ = info
                         error = None
                         if isinstance(file_id, BaseException):
                             error = str(file_id)
                             file_id = None
-                        self.module.update_db(project_name,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
+                        results.append(
+                            (file_id, file, representation, site, error)
+                        )
+                    self.module.update_db_many(project_name, results)
+                    if tracker is not None and postponed_ids:
+                        tracker.add_dirty_ids(postponed_ids)
 
                 duration = time.time() - start_time
                 self.log.debug("One loop took {:.2f}s".format(duration))
@@ -494,6 +519,7 @@ class SyncServerThread(threading.Thread):
                 self.log.info("finished long running")
                 self.module.projects_processed.remove(task["project_name"])
             await asyncio.sleep(0.5)
+        self.module.stop_change_trackers()
         tasks = [task for task in asyncio.all_tasks() if
                  task is not asyncio.current_task()]
         list(map(lambda task: task.cancel(), tasks))  # cancel all the tasks
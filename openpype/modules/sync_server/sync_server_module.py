@@ -9,6 +9,7 @@ from collections import deque, defaultdict
 
 import click
 from bson.objectid import ObjectId
+from pymongo import UpdateOne
 
 from openpype.client import (
     get_projects,
@@ -32,6 +33,7 @@ from openpype.settings.constants import (
 )
 
 from .providers.local_drive import LocalDriveHandler
+from .change_tracker import RepresentationChangeTracker, SYNC_UPDATED_KEY
 from .providers import lib
 
 from .utils import (
@@ -135,6 +137,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         self._anatomies = {}
 
         self._connection = None
+        # trackers of changed representations for incremental sync
+        self._change_trackers = {}
 
         # list of long blocking tasks
         self.long_running_tasks = deque()
@@ -1682,7 +1686,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         return sites.get(site, 'N/A')
 
     @time_function
-    def get_sync_representations(self, project_name, active_site, remote_site):
+    def get_sync_representations(self, project_name, active_site, remote_site,
+                                 representation_ids=None):
         """
             Get representations that should be synced, these could be
             recognised by presence of document in 'files.sites', where key is
@@ -1698,6 +1703,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
                 'local_0' when working from home, 'studio' when working in the
                 studio (default)
             remote_site (string): identifier of remote site I want to sync to
+            representation_ids (list[ObjectId]): limit query only to these
+                representations (incremental sync), all are checked if None
 
         Returns:
             (list) of dictionaries
@@ -1746,6 +1753,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
                 ]}
             ]
         }
+        if representation_ids is not None:
+            match["_id"] = {"$in": list(representation_ids)}
 
         aggr = [
             {"$match": match},
@@ -1867,6 +1876,82 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         Returns:
             None
         """
+        query, update, arr_filter = self._prepare_update_db_operation(
+            new_file_id, file, representation, site, error, progress, priority
+        )
+
+        self.connection.database[project_name].update_one(
+            query,
+            update,
+            upsert=True,
+            array_filters=arr_filter
+        )
+
+        if progress is not None or priority is not None:
+            return
+
+        self._log_update_db_result(new_file_id, file, representation, error)
+
+    def update_db_many(self, project_name, results):
+        """Update DB with results of multiple synced files at once.
+
+        Same as calling 'update_db' for each result but all changes are sent
+        to DB in single bulk write. Updates are ordered so multiple results
+        of the same representation are applied in the same order as with
+        'update_db'.
+
+        Args:
+            project_name (str): Name of project.
+            results (Iterable[tuple]): Each item contains 'new_file_id',
+                'file', 'representation', 'site' and 'error' as expected by
+                'update_db'.
+        """
+
+        operations = []
+        processed = []
+        for new_file_id, file, representation, site, error in results:
+            query, update, arr_filter = self._prepare_update_db_operation(
+                new_file_id, file, representation, site, error
+            )
+            operations.append(UpdateOne(
+                query,
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            ))
+            processed.append((new_file_id, file, representation, error))
+
+        if not operations:
+            return
+
+        self.connection.database[project_name].bulk_write(
+            operations, ordered=True
+        )
+        self.log.debug("Updated {} file records in project {}".format(
+            len(operations), project_name
+        ))
+
+        for new_file_id, file, representation, error in processed:
+            self._log_update_db_result(
+                new_file_id, file, representation, error
+            )
+
+    def _prepare_update_db_operation(
+        self,
+        new_file_id,
+        file,
+        representation,
+        site,
+        error=None,
+        progress=None,
+        priority=None
+    ):
+        """Prepare query, update and array filters for file site update.
+
+        Returns:
+            tuple[dict, dict, list]: Query, update data and array filters.
+        """
+
         representation_id = representation.get("_id")
         file_id = None
         if file:
@@ -1891,22 +1976,19 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
             update["$set"] = self._get_error_dict(error, tries)
 
+        # progress doesn't change what should be synced
+        if progress is None:
+            update["$set"][SYNC_UPDATED_KEY] = datetime.utcnow()
+
         arr_filter = [
             {'s.name': site}
         ]
         if file_id:
             arr_filter.append({'f._id': ObjectId(file_id)})
 
-        self.connection.database[project_name].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
-
-        if progress is not None or priority is not None:
-            return
+        return query, update, arr_filter
 
+    def _log_update_db_result(self, new_file_id, file, representation, error):
         status = 'failed'
         error_str = 'with error {}'.format(error)
         if new_file_id:
@@ -1918,7 +2000,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             (
                 "File for {} - {source_file} process {status} {error_str}"
             ).format(
-                representation_id,
+                representation.get("_id"),
                 status=status,
                 source_file=source_file,
                 error_str=error_str
@@ -2048,6 +2130,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         query = {
             "_id": ObjectId(representation_id)
         }
+        # mark change for watermark of incremental sync
+        update.setdefault("$set", {})[SYNC_UPDATED_KEY] = datetime.utcnow()
 
         self.connection.database[project_name].update_one(
             query,
@@ -2274,6 +2358,41 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         ld = self.sync_project_settings[project_name]["config"]["loop_delay"]
         return int(ld)
 
+    def get_change_tracker(self, project_name):
+        """
+            Return tracker of changed representations for 'project_name'.
+
+            Tracker is created (and started) on first call, only if
+            incremental sync is enabled for project.
+        Returns:
+            (RepresentationChangeTracker|None): None if incremental sync
+                is disabled
+        """
+        config = self.sync_project_settings[project_name]["config"]
+        if not config.get("incremental_sync"):
+            tracker = self._change_trackers.pop(project_name, None)
+            if tracker is not None:
+                tracker.stop()
+            return None
+
+        tracker = self._change_trackers.get(project_name)
+        if tracker is None:
+            tracker = RepresentationChangeTracker(
+                self.connection.database[project_name],
+                full_sync_interval=int(config.get("full_sync_interval")
+                                       or 3600),
+                log=self.log
+            )
+            tracker.start()
+            self._change_trackers[project_name] = tracker
+        return tracker
+
+    def stop_change_trackers(self):
+        """Stop all trackers of changed representations."""
+        for tracker in self._change_trackers.values():
+            tracker.stop()
+        self._change_trackers = {}
+
     def show_widget(self):
         """Show dialog for Sync Queue"""
         no_errors = False
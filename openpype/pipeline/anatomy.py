@@ -1,6 +1,8 @@
 import os
 import re
 import copy
+import json
+import hashlib
 import platform
 import collections
 import numbers
@@ -24,6 +26,7 @@ from openpype.lib.path_templates import (
     StringTemplate,
     TemplatesDict,
     FormatObject,
+    CompiledTemplatesCache,
 )
 from openpype.modules import ModulesManager
 
@@ -634,17 +637,48 @@ class AnatomyStringTemplate(StringTemplate):
 
         anatomy_templates = self.anatomy_templates
         if not data.get("root"):
-            data = copy.deepcopy(data)
+            # Formatting does not modify data so shallow copy is enough
+            data = dict(data)
             data["root"] = anatomy_templates.anatomy.roots
         result = StringTemplate.format(self, data)
         rootless_path = anatomy_templates.rootless_path_from_result(result)
         return AnatomyTemplateResult(result, rootless_path)
 
+    def format_many(self, data_iterable, strict=False):
+        """Format template with each item of data.
+
+        Roots are resolved only once for all data items.
+
+        Args:
+            data_iterable (Iterable[dict[str, Any]]): Formatting data items.
+            strict (bool): Validate that each result is solved.
+
+        Returns:
+            list[AnatomyTemplateResult]: Results in order of data items.
+        """
+
+        roots = self.anatomy_templates.anatomy.roots
+
+        def _data_with_roots():
+            for data in data_iterable:
+                if not data.get("root"):
+                    data = dict(data)
+                    data["root"] = roots
+                yield data
+
+        return super(AnatomyStringTemplate, self).format_many(
+            _data_with_roots(), strict
+        )
+
 
 class AnatomyTemplates(TemplatesDict):
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
     inner_key_name_pattern = re.compile(r"\{@(.*?[^{}0]*)\}")
 
+    # Templates with solved inner links by project name and hash of raw
+    #   templates, shared by all anatomy objects in process
+    _solved_templates_cache = CompiledTemplatesCache(32)
+
     def __init__(self, anatomy):
         super(AnatomyTemplates, self).__init__()
         self.anatomy = anatomy
@@ -692,6 +726,44 @@ class AnatomyTemplates(TemplatesDict):
             return
 
         self._raw_templates = copy.deepcopy(templates)
+        cache_key = self._get_templates_cache_key(templates)
+        solved_templates = None
+        if cache_key is not None:
+            solved_templates = self._solved_templates_cache.get(cache_key)
+
+        if solved_templates is None:
+            solved_templates = self._solve_templates(templates)
+            if cache_key is not None:
+                self._solved_templates_cache.set(
+                    cache_key, copy.deepcopy(solved_templates)
+                )
+        else:
+            solved_templates = copy.deepcopy(solved_templates)
+
+        self._templates = solved_templates
+        self._objected_templates = self.create_objected_templates(
+            solved_templates
+        )
+
+    def _get_templates_cache_key(self, templates):
+        """Key of solved templates cache.
+
+        Args:
+            templates (dict[str, Any]): Raw templates.
+
+        Returns:
+            Union[tuple[str, str], None]: Project name and hash of templates
+                or None if templates can't be hashed.
+        """
+
+        try:
+            serialized = json.dumps(templates, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        templates_hash = hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+        return (self.project_name, templates_hash)
+
+    def _solve_templates(self, templates):
         templates = copy.deepcopy(templates)
         v_queue = collections.deque()
         v_queue.append(templates)
@@ -711,11 +783,7 @@ class AnatomyTemplates(TemplatesDict):
                 ):
                     item[key] = value.replace("{task}", "{task[name]}")
 
-        solved_templates = self.solve_template_inner_links(templates)
-        self._templates = solved_templates
-        self._objected_templates = self.create_objected_templates(
-            solved_templates
-        )
+        return self.solve_template_inner_links(templates)
 
     def _create_template_object(self, template):
         return AnatomyStringTemplate(self, template)
@@ -986,7 +1054,7 @@ class AnatomyTemplates(TemplatesDict):
         return output
 
     def format(self, data, strict=True):
-        copy_data = copy.deepcopy(data)
+        copy_data = dict(data)
         roots = self.roots
         if roots:
             copy_data["root"] = roots
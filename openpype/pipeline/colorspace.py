@@ -1,18 +1,28 @@
 import re
 import os
 import json
+import time
+import atexit
 import contextlib
 import functools
 import platform
 import tempfile
 import warnings
+import threading
+import subprocess
 from copy import deepcopy
 
-from openpype import PACKAGE_DIR
+from six.moves import queue
+
+from openpype import PACKAGE_DIR, AYON_SERVER_ENABLED
 from openpype.settings import get_project_settings
 from openpype.lib import (
     StringTemplate,
     run_openpype_process,
+    get_openpype_execute_args,
+    get_ayon_launcher_args,
+    clean_envs_for_openpype_process,
+    is_running_from_build,
     Logger
 )
 from openpype.pipeline import Anatomy
@@ -22,11 +32,18 @@ from openpype.lib.transcoding import VIDEO_EXTENSIONS, IMAGE_EXTENSIONS
 log = Logger.get_logger(__name__)
 
 
+# Must match 'SERVE_RESPONSE_PREFIX' in 'openpype/scripts/ocio_wrapper.py'
+OCIO_WRAPPER_RESPONSE_PREFIX = "__ocio_wrapper_response__:"
+
+
 class CachedData:
     remapping = None
     has_compatible_ocio_package = None
     config_version_data = {}
     ocio_config_colorspaces = {}
+    ocio_wrapper_process = None
+    # Results of ocio wrapper queries by config path and its mtime
+    ocio_wrapper_results = {}
     allowed_exts = {
         ext.lstrip(".") for ext in IMAGE_EXTENSIONS.union(VIDEO_EXTENSIONS)
     }
@@ -420,10 +437,282 @@ def get_data_subprocess(config_path, data_type):
     )
 
 
+class OCIOWrapperProcessError(RuntimeError):
+    """Persistent ocio wrapper process failed or is not responding."""
+    pass
+
+
+class OCIOWrapperProcess(object):
+    """Persistent ocio wrapper process answering queries.
+
+    Process is started on first request and is reused for all following
+    requests, so OpenPype bootstrap and loading of ocio config happen only
+    once. Requests and responses are line-delimited json sent over stdin
+    and stdout of the process (see 'serve' command in ocio wrapper).
+
+    Args:
+        args (Optional[list[str]]): Arguments to launch the process. Ocio
+            wrapper script in OpenPype process is used if not passed.
+        env (Optional[dict[str, str]]): Environments of the process.
+        timeout (Optional[float]): Seconds to wait for response. Process
+            is stopped and request fails when it does not respond in time.
+    """
+
+    # First response includes OpenPype bootstrap of the process
+    default_timeout = 60
+
+    def __init__(self, args=None, env=None, timeout=None):
+        if timeout is None:
+            timeout = self.default_timeout
+        self._args = args
+        self._env = env
+        self._timeout = timeout
+        self._process = None
+        self._output_queue = None
+        self._last_request_id = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pid(self):
+        if self._process is None:
+            return None
+        return self._process.pid
+
+    def is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def _get_launch_args(self):
+        if self._args is not None:
+            return list(self._args)
+
+        args = ("run", get_ocio_config_script_path(), "serve")
+        if AYON_SERVER_ENABLED:
+            return get_ayon_launcher_args(*args)
+        return get_openpype_execute_args(*args)
+
+    def _get_env(self):
+        env = self._env
+        if env is None:
+            env = clean_envs_for_openpype_process(os.environ)
+            # Only keep OpenPype version if we are running from build.
+            if not is_running_from_build():
+                env.pop("OPENPYPE_VERSION", None)
+        return {str(key): str(value) for key, value in env.items()}
+
+    def start(self):
+        """Start the process if is not running."""
+        if self.is_running():
+            return
+
+        kwargs = {}
+        if platform.system().lower() == "windows":
+            kwargs["creationflags"] = getattr(
+                subprocess, "CREATE_NO_WINDOW", 0
+            )
+
+        args = self._get_launch_args()
+        log.debug("Starting ocio wrapper process: {}".format(" ".join(args)))
+        with open(os.devnull, "w") as devnull:
+            self._process = subprocess.Popen(
+                args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=devnull,
+                env=self._get_env(),
+                universal_newlines=True,
+                bufsize=1,
+                **kwargs
+            )
+        # Output is read in thread so response can be awaited with timeout
+        self._output_queue = queue.Queue()
+        reader_thread = threading.Thread(
+            target=self._read_output,
+            args=(self._process.stdout, self._output_queue)
+        )
+        reader_thread.daemon = True
+        reader_thread.start()
+
+    @staticmethod
+    def _read_output(stdout, output_queue):
+        try:
+            for line in iter(stdout.readline, ""):
+                output_queue.put(line)
+        except (IOError, OSError, ValueError):
+            pass
+        # Mark end of output
+        output_queue.put(None)
+
+    def stop(self, timeout=5):
+        """Stop the process.
+
+        Process ends when its stdin is closed, it is killed if does not end
+        in timeout.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for the process end.
+        """
+
+        process = self._process
+        self._process = None
+        if process is None:
+            return
+
+        try:
+            process.stdin.close()
+        except (IOError, OSError):
+            pass
+
+        end_time = time.time() + timeout
+        while process.poll() is None and time.time() < end_time:
+            time.sleep(0.01)
+
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+
+    def request(self, command_group, command, **kwargs):
+        """Send query to the process and wait for result.
+
+        Args:
+            command_group (str): Command group name.
+            command (str): Command name.
+            **kwargs: Command arguments.
+
+        Returns:
+            Any: Result of the query.
+
+        Raises:
+            OCIOWrapperProcessError: Process failed or is not responding.
+            RuntimeError: Query failed in the process.
+        """
+
+        with self._lock:
+            self._last_request_id += 1
+            request_id = self._last_request_id
+            try:
+                self.start()
+                self._process.stdin.write(json.dumps({
+                    "id": request_id,
+                    "command_group": command_group,
+                    "command": command,
+                    "kwargs": kwargs,
+                }) + "\n")
+                self._process.stdin.flush()
+                response = self._read_response(request_id)
+
+            except (
+                IOError, OSError, ValueError, OCIOWrapperProcessError
+            ) as exc:
+                self.stop()
+                raise OCIOWrapperProcessError(
+                    "Ocio wrapper process failed: {}".format(exc)
+                )
+
+        if "error" in response:
+            raise RuntimeError(
+                "Ocio wrapper query '{} {}' failed: {}".format(
+                    command_group, command, response["error"]
+                )
+            )
+        return response.get("result")
+
+    def _read_response(self, request_id):
+        end_time = time.time() + self._timeout
+        while True:
+            try:
+                line = self._output_queue.get(
+                    timeout=max(end_time - time.time(), 0)
+                )
+            except queue.Empty:
+                raise OCIOWrapperProcessError(
+                    "Process did not respond in {} seconds".format(
+                        self._timeout
+                    )
+                )
+
+            if line is None:
+                raise IOError("Process ended without response")
+
+            # Skip output of OpenPype bootstrap
+            if not line.startswith(OCIO_WRAPPER_RESPONSE_PREFIX):
+                continue
+
+            response = json.loads(line[len(OCIO_WRAPPER_RESPONSE_PREFIX):])
+            if response.get("id") == request_id:
+                return response
+
+
+def get_ocio_wrapper_process():
+    """Persistent ocio wrapper process shared in current process.
+
+    Returns:
+        OCIOWrapperProcess: Ocio wrapper process.
+    """
+
+    if CachedData.ocio_wrapper_process is None:
+        CachedData.ocio_wrapper_process = OCIOWrapperProcess()
+        atexit.register(CachedData.ocio_wrapper_process.stop)
+    return CachedData.ocio_wrapper_process
+
+
+def _get_ocio_wrapper_cache_key(command_group, command, kwargs):
+    config_path = kwargs.get("config_path") or kwargs.get("in_path")
+    if not config_path:
+        return None
+
+    try:
+        mtime = os.path.getmtime(config_path)
+    except OSError:
+        return None
+
+    return (
+        os.path.normpath(config_path),
+        mtime,
+        command_group,
+        command,
+        tuple(sorted(kwargs.items()))
+    )
+
+
 def _get_wrapped_with_subprocess(command_group, command, **kwargs):
     """Get data via subprocess
 
-    Wrapper for Python 2 hosts.
+    Wrapper for Python 2 hosts. Queries are processed by persistent ocio
+    wrapper process and results are cached until config file is modified.
+
+    Args:
+        command_group (str): command group name
+        command (str): command name
+        **kwargs: command arguments
+
+    Returns:
+        Any[dict, None]: data
+    """
+    cache_key = _get_ocio_wrapper_cache_key(command_group, command, kwargs)
+    if cache_key is not None and cache_key in CachedData.ocio_wrapper_results:
+        return deepcopy(CachedData.ocio_wrapper_results[cache_key])
+
+    try:
+        result = get_ocio_wrapper_process().request(
+            command_group, command, **kwargs
+        )
+    except OCIOWrapperProcessError:
+        log.warning(
+            "Ocio wrapper process failed. Using new process for query.",
+            exc_info=True
+        )
+        result = _run_wrapped_subprocess(command_group, command, **kwargs)
+
+    if cache_key is not None:
+        CachedData.ocio_wrapper_results[cache_key] = deepcopy(result)
+    return result
+
+
+def _run_wrapped_subprocess(command_group, command, **kwargs):
+    """Get data via new OpenPype process for single query.
+
+    Used when persistent ocio wrapper process is not available.
 
     Args:
         command_group (str): command group name
@@ -1175,20 +1464,9 @@ def get_display_view_colorspace_subprocess(config_path, display, view):
         view color space name (str) e.g. "Output - sRGB"
     """
 
-    with _make_temp_json_file() as tmp_json_path:
-        # Prepare subprocess arguments
-        args = [
-            "run", get_ocio_config_script_path(),
-            "config", "get_display_view_colorspace_name",
-            "--in_path", config_path,
-            "--out_path", tmp_json_path,
-            "--display", display,
-            "--view", view
-        ]
-        log.debug("Executing: {}".format(" ".join(args)))
-
-        run_openpype_process(*args, logger=log)
-
-        # return default view colorspace name
-        with open(tmp_json_path, "r") as f:
-            return json.load(f)
+    return _get_wrapped_with_subprocess(
+        "config", "get_display_view_colorspace_name",
+        in_path=config_path,
+        display=display,
+        view=view
+    )
@@ -19,6 +19,7 @@ from openpype.client import (
     version_is_latest,
 )
 from openpype.lib.events import emit_event
+from openpype.lib.startup_profiler import startup_phase
 from openpype.modules import load_modules, ModulesManager
 from openpype.settings import get_project_settings
 from openpype.tests.lib import is_in_tests
@@ -101,6 +102,12 @@ def install_host(host):
         host (module): A Python module containing the Avalon
             avalon host-interface.
     """
+
+    with startup_phase("host.install"):
+        _install_host(host)
+
+
+def _install_host(host):
     global _is_installed
 
     _is_installed = True
@@ -124,7 +131,8 @@ def install_host(host):
 
     # Optional host install function
     if hasattr(host, "install"):
-        host.install()
+        with startup_phase("host.install.host"):
+            host.install()
 
     register_host(host)
 
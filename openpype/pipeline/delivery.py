@@ -1,12 +1,24 @@
 """Functions useful for delivery of published representations."""
 import os
+import re
 import copy
 import shutil
-import glob
-import clique
+import fnmatch
+import threading
 import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import clique
 
-from openpype.lib import create_hard_link
+from openpype.lib import create_hard_link, FileSequenceIndex
+
+# Difference of modification time in seconds which is considered as same
+#   time (some file systems store modification time with low precision)
+MTIME_TOLERANCE = 2
+
+DeliveryTransfer = collections.namedtuple(
+    "DeliveryTransfer", ["src_path", "dst_path"]
+)
 
 
 def _copy_file(src_path, dst_path):
@@ -27,6 +39,226 @@ def _copy_file(src_path, dst_path):
         shutil.copyfile(src_path, dst_path)
 
 
+def _is_delivered_file_stat(src_stat, dst_stat):
+    # Older deliveries did not keep modification time of source so
+    #   destination which is newer than source is considered as delivered
+    return (
+        src_stat.st_size == dst_stat.st_size
+        and dst_stat.st_mtime > src_stat.st_mtime - MTIME_TOLERANCE
+    )
+
+
+def _transfer_file(src_path, dst_path):
+    """Hardlink or copy file unless destination is already delivered.
+
+    Destination with same size as source which is not older than source
+    is skipped. Other existing destination is removed first, so content of
+    file which may be hardlinked to destination is not changed. Copy is
+    written to temporary file which is renamed when copy is finished.
+
+    Returns:
+        bool: File was transferred, False if was skipped.
+    """
+
+    src_stat = os.stat(src_path)
+    try:
+        dst_stat = os.stat(dst_path)
+    except OSError:
+        dst_stat = None
+
+    if dst_stat is not None:
+        if _is_delivered_file_stat(src_stat, dst_stat):
+            return False
+        os.remove(dst_path)
+    else:
+        dst_dir = os.path.dirname(dst_path)
+        if not os.path.exists(dst_dir):
+            os.makedirs(dst_dir, exist_ok=True)
+
+    try:
+        create_hard_link(src_path, dst_path)
+        return True
+    except OSError:
+        pass
+
+    tmp_path = dst_path + ".delivery_tmp"
+    try:
+        # Keep modification time to be able to skip the file next time
+        shutil.copy2(src_path, tmp_path)
+        os.replace(tmp_path, dst_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return True
+
+
+class DeliveryExecutor(object):
+    """Plan all transfers of delivery and process them concurrently.
+
+    Transfers are collected first (e.g. by passing the executor to
+    'deliver_single_file' and 'deliver_sequence') and deduplicated by
+    destination path. Processing hardlinks files if possible and copies them
+    otherwise. Destinations which have same size as source and are not older
+    than source are skipped, so interrupted delivery can be resumed.
+
+    Args:
+        max_workers (Optional[int]): Maximum of concurrent transfers.
+        max_workers_per_destination (Optional[int]): Maximum of concurrent
+            transfers to the same destination (see 'get_destination_key').
+    """
+
+    default_max_workers = 8
+    default_max_workers_per_destination = 4
+
+    def __init__(self, max_workers=None, max_workers_per_destination=None):
+        if max_workers is None:
+            max_workers = self.default_max_workers
+        if max_workers_per_destination is None:
+            max_workers_per_destination = (
+                self.default_max_workers_per_destination
+            )
+        self.max_workers = max(1, max_workers)
+        self.max_workers_per_destination = max(1, max_workers_per_destination)
+        self.report_items = collections.defaultdict(list)
+        self._transfers = collections.OrderedDict()
+
+    @property
+    def transfers(self):
+        """Planned transfers.
+
+        Returns:
+            list[DeliveryTransfer]: Planned transfers.
+        """
+
+        return list(self._transfers.values())
+
+    def add_transfer(self, src_path, dst_path):
+        """Plan transfer of file.
+
+        Args:
+            src_path (str): Source file path.
+            dst_path (str): Destination file path.
+
+        Returns:
+            bool: Transfer was added, False if destination is already
+                planned.
+        """
+
+        src_path = os.path.normpath(src_path)
+        dst_path = os.path.normpath(dst_path)
+        key = os.path.normcase(dst_path)
+        transfer = self._transfers.get(key)
+        if transfer is None:
+            self._transfers[key] = DeliveryTransfer(src_path, dst_path)
+            return True
+
+        if os.path.normcase(transfer.src_path) != os.path.normcase(src_path):
+            self.report_items[
+                "Multiple files are delivered to the same path"
+            ].append("{} -> {}".format(src_path, dst_path))
+        return False
+
+    def get_destination_key(self, dst_path):
+        """Key of destination used to limit concurrent transfers.
+
+        Drive or network share on windows, first two directories otherwise
+        (e.g. '/mnt/client').
+
+        Args:
+            dst_path (str): Destination file path.
+
+        Returns:
+            str: Destination key.
+        """
+
+        drive, path = os.path.splitdrive(dst_path)
+        if drive:
+            return drive.lower()
+        parts = [part for part in path.replace("\\", "/").split("/") if part]
+        return "/" + "/".join(parts[:2])
+
+    def _get_ordered_transfers(self):
+        """Transfers interleaved by destination key.
+
+        Workers don't wait on limit of single destination while transfers
+        to other destinations are waiting.
+        """
+
+        transfers_by_key = collections.OrderedDict()
+        for transfer in self._transfers.values():
+            key = self.get_destination_key(transfer.dst_path)
+            transfers_by_key.setdefault(key, collections.deque()).append(
+                transfer
+            )
+
+        output = []
+        while transfers_by_key:
+            for key in list(transfers_by_key.keys()):
+                queue = transfers_by_key[key]
+                output.append((key, queue.popleft()))
+                if not queue:
+                    transfers_by_key.pop(key)
+        return output
+
+    def _process_transfer(self, transfer, semaphore):
+        with semaphore:
+            return _transfer_file(transfer.src_path, transfer.dst_path)
+
+    def process(self, progress_callback=None):
+        """Process planned transfers.
+
+        Errors are stored to 'report_items'.
+
+        Args:
+            progress_callback (Optional[Callable[[int, int], None]]): Called
+                in current thread after each processed transfer with count
+                of processed transfers and count of all transfers.
+
+        Returns:
+            dict[str, int]: Count of 'transferred', 'skipped' and 'failed'
+                transfers.
+        """
+
+        counts = {"transferred": 0, "skipped": 0, "failed": 0}
+        transfers = self._get_ordered_transfers()
+        if not transfers:
+            return counts
+
+        semaphores = {
+            key: threading.Semaphore(self.max_workers_per_destination)
+            for key, _ in transfers
+        }
+        total = len(transfers)
+        max_workers = min(self.max_workers, total)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._process_transfer, transfer, semaphores[key]
+                ): transfer
+                for key, transfer in transfers
+            }
+            for processed, future in enumerate(as_completed(futures), 1):
+                transfer = futures[future]
+                try:
+                    transferred = future.result()
+                except Exception as exc:
+                    counts["failed"] += 1
+                    self.report_items["Failed to deliver files"].append(
+                        "{} -> {}: {}".format(
+                            transfer.src_path, transfer.dst_path, exc
+                        )
+                    )
+                else:
+                    if transferred:
+                        counts["transferred"] += 1
+                    else:
+                        counts["skipped"] += 1
+
+                if progress_callback is not None:
+                    progress_callback(processed, total)
+        return counts
+
+
 def get_format_dict(anatomy, location_path):
     """Returns replaced root values from user provider value.
 
@@ -120,7 +352,8 @@ def deliver_single_file(
     anatomy_data,
     format_dict,
     report_items,
-    log
+    log,
+    executor=None
 ):
     """Copy single file to calculated path based on template
 
@@ -134,6 +367,8 @@ def deliver_single_file(
         format_dict (dict): root dictionary with names and values
         report_items (collections.defaultdict): to return error messages
         log (logging.Logger): for log printing
+        executor (Optional[DeliveryExecutor]): file is only planned to
+            be transferred by the executor if passed
 
     Returns:
         (collections.defaultdict, int)
@@ -160,6 +395,10 @@ def deliver_single_file(
     # Remove newlines from the end of the string to avoid OSError during copy
     delivery_path = delivery_path.rstrip()
 
+    if executor is not None:
+        executor.add_transfer(src_path, delivery_path)
+        return report_items, 1
+
     delivery_folder = os.path.dirname(delivery_path)
     if not os.path.exists(delivery_folder):
         os.makedirs(delivery_folder)
@@ -180,7 +419,8 @@ def deliver_sequence(
     report_items,
     log,
     has_renumbered_frame=False,
-    new_frame_start=0
+    new_frame_start=0,
+    executor=None
 ):
     """ For Pype2(mainly - works in 3 too) where representation might not
         contain files.
@@ -200,21 +440,27 @@ def deliver_sequence(
         format_dict (dict): root dictionary with names and values
         report_items (collections.defaultdict): to return error messages
         log (logging.Logger): for log printing
+        executor (Optional[DeliveryExecutor]): files are only planned to
+            be transferred by the executor if passed
 
     Returns:
         (collections.defaultdict, int)
     """
 
     src_path = os.path.normpath(src_path.replace("\\", "/"))
+    dir_path, file_name = os.path.split(str(src_path))
 
-    def hash_path_exist(myPath):
-        res = myPath.replace('#', '*')
-        glob_search_results = glob.glob(res)
-        if len(glob_search_results) > 0:
-            return True
-        return False
+    # Directory is listed only once for existence check and sequence
+    try:
+        file_names = os.listdir(dir_path)
+    except OSError:
+        file_names = []
 
-    if not hash_path_exist(src_path):
+    file_name_pattern = file_name.replace("#", "*")
+    if not any(
+        fnmatch.fnmatch(name, file_name_pattern)
+        for name in file_names
+    ):
         msg = "{} doesn't exist for {}".format(
             src_path, repre["_id"])
         report_items["Source file was not found"].append(msg)
@@ -241,8 +487,6 @@ def deliver_sequence(
         report_items[""].append(msg)
         return report_items, 0
 
-    dir_path, file_name = os.path.split(str(src_path))
-
     context = repre["context"]
     ext = context.get("ext", context.get("representation"))
 
@@ -256,13 +500,14 @@ def deliver_sequence(
     # context.representation could be .psd
     ext = ext.replace("..", ".")
 
-    src_collections, remainder = clique.assemble(os.listdir(dir_path))
+    # Frame is digits right before extension
+    frame_pattern = r"(?P<index>(?P<padding>0*)\d+)(?={}$)".format(
+        re.escape(ext)
+    )
+    src_index = FileSequenceIndex.from_paths(file_names, frame_pattern)
     src_collection = None
-    for col in src_collections:
-        if col.tail != ext:
-            continue
-
-        src_collection = col
+    for sequence in src_index.get_sequences(minimum_items=2):
+        src_collection = sequence
         break
 
     if src_collection is None:
@@ -290,15 +535,15 @@ def deliver_sequence(
         padding=dst_padding
     )
 
-    if not os.path.exists(delivery_folder):
+    if executor is None and not os.path.exists(delivery_folder):
         os.makedirs(delivery_folder)
 
     src_head = src_collection.head
     src_tail = src_collection.tail
     uploaded = 0
-    first_frame = min(src_collection.indexes)
-    for index in src_collection.indexes:
-        src_padding = src_collection.format("{padding}") % index
+    first_frame = src_collection.frame_start
+    for index in src_collection.frames:
+        src_padding = src_collection.format_frame(index)
         src_file_name = "{}{}{}".format(src_head, src_padding, src_tail)
         src = os.path.normpath(
             os.path.join(dir_path, src_file_name)
@@ -317,8 +562,11 @@ def deliver_sequence(
                 return report_items, 0
         dst_padding = dst_collection.format("{padding}") % dst_index
         dst = "{}{}{}".format(dst_head, dst_padding, dst_tail)
-        log.debug("Copying single: {} -> {}".format(src, dst))
-        _copy_file(src, dst)
+        if executor is not None:
+            executor.add_transfer(src, dst)
+        else:
+            log.debug("Copying single: {} -> {}".format(src, dst))
+            _copy_file(src, dst)
 
         uploaded += 1
 
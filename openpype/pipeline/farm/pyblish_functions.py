@@ -16,7 +16,7 @@ from openpype.client import (
     get_last_version_by_subset_name,
     get_representations
 )
-from openpype.lib import Logger
+from openpype.lib import Logger, FileSequenceIndex
 from openpype.pipeline.publish import KnownPublishError
 from openpype.pipeline.farm.patterning import match_aov_pattern
 
@@ -58,6 +58,133 @@ def remap_source(path, anatomy):
     return source
 
 
+# Digits are matched the same way as 'clique.DIGITS_PATTERN' does
+DIGITS_PATTERN = re.compile(r"\d+")
+
+
+def assemble_expected_files(files):
+    """Assemble expected files into collections and remainders.
+
+    Faster alternative of 'clique.assemble' for long lists of rendered
+    files. Files are grouped by 'FileSequenceIndex' where frame is the last
+    group of digits in file name, so each file is matched only once and is
+    not compared with other collections. Result is the same as
+    'clique.assemble' returns, which is used as fallback when files could be
+    grouped in multiple ways (e.g. files differ in digits other than frame
+    or frames use mixed padding).
+
+    Args:
+        files (Iterable[str]): Expected files.
+
+    Returns:
+        tuple[list[clique.Collection], list[str]]: Collections and
+            remainders.
+    """
+
+    files = list(files)
+    index = FileSequenceIndex()
+    remainder = []
+    # Padding and first file of sequences by head and tail
+    groups = {}
+    # Sequences and files with digits in order of first occurrence
+    ordered_items = []
+    ungrouped_files = set()
+    # Owners by key describing all their variants with one group of
+    #   digits changed
+    owners_by_variant_key = {}
+    for filepath in files:
+        parsed = index.parse_path(filepath)
+        if parsed is None:
+            if DIGITS_PATTERN.search(filepath) is None:
+                remainder.append(filepath)
+                continue
+            if filepath in ungrouped_files:
+                continue
+            ungrouped_files.add(filepath)
+            owner = text = filepath
+
+        else:
+            head, tail, padding, _ = parsed
+            owner = (head, tail)
+            group = groups.get(owner)
+            if group is not None:
+                # Mixed padding is merged by clique
+                if group[0] != padding:
+                    return clique.assemble(files)
+                continue
+
+            groups[owner] = (padding, filepath)
+            text = "{}\0{}".format(head, tail)
+
+        # Files which differ only in one group of digits outside of frame
+        #   could be assembled into other collections
+        masked_text = DIGITS_PATTERN.sub("#", text)
+        digits = DIGITS_PATTERN.findall(text)
+        for idx in range(len(digits)):
+            variant_key = (
+                masked_text, idx, tuple(digits[:idx] + digits[idx + 1:])
+            )
+            if owners_by_variant_key.setdefault(variant_key, owner) != owner:
+                return clique.assemble(files)
+        ordered_items.append(owner)
+
+    index.add_paths(
+        filepath
+        for filepath in files
+        if filepath not in ungrouped_files
+    )
+
+    collections = []
+    for owner in ordered_items:
+        group = groups.get(owner)
+        if group is None:
+            remainder.append(owner)
+            continue
+
+        sequence = index.get_sequence(group[1])
+        if len(sequence) < 2:
+            remainder.append(group[1])
+        else:
+            collections.append(clique.Collection(
+                sequence.head,
+                sequence.tail,
+                sequence.padding,
+                set(sequence.frames)
+            ))
+    return collections, remainder
+
+
+def _remap_staging_dir(staging_dir, anatomy, remapped_dirs, log):
+    """Remap staging directory to rootless path.
+
+    Args:
+        staging_dir (str): Staging directory.
+        anatomy (Anatomy): Project anatomy.
+        remapped_dirs (dict[str, str]): Already remapped directories, so
+            roots are resolved only once for each directory.
+        log (logging.Logger): Logger used for warnings.
+
+    Returns:
+        str: Rootless staging directory or unchanged directory if root
+            was not found.
+    """
+
+    if staging_dir in remapped_dirs:
+        return remapped_dirs[staging_dir]
+
+    success, rootless_staging_dir = (
+        anatomy.find_root_template_from_path(staging_dir)
+    )
+    if not success:
+        log.warning((
+            "Could not find root path for remapping \"{}\"."
+            " This may cause issues on farm."
+        ).format(staging_dir))
+        rootless_staging_dir = staging_dir
+    remapped_dirs[staging_dir] = rootless_staging_dir
+    return rootless_staging_dir
+
+
 def extend_frames(asset, subset, start, end):
     """Get latest version of asset nad update frame range.
 
@@ -319,13 +446,15 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
     """
     representations = []
     host_name = os.environ.get("AVALON_APP", "")
-    collections, remainders = clique.assemble(exp_files)
+    collections, remainders = assemble_expected_files(exp_files)
 
     log = Logger.get_logger("farm_publishing")
+    remapped_dirs = {}
 
     # create representation for every collected sequence
     for collection in collections:
         ext = collection.tail.lstrip(".")
+        collection_files = list(collection)
         preview = False
         # TODO 'useSequenceForReview' is temporary solution which does
         #   not work for 100% of cases. We must be able to tell what
@@ -340,24 +469,19 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
                 )
                 preview = True
             else:
-                render_file_name = list(collection)[0]
+                render_file_name = collection_files[0]
                 # if filtered aov name is found in filename, toggle it for
                 # preview video rendering
                 preview = match_aov_pattern(
                     host_name, aov_filter, render_file_name
                 )
 
-        staging = os.path.dirname(list(collection)[0])
-        success, rootless_staging_dir = (
-            anatomy.find_root_template_from_path(staging)
+        staging = _remap_staging_dir(
+            os.path.dirname(collection_files[0]),
+            anatomy,
+            remapped_dirs,
+            log
         )
-        if success:
-            staging = rootless_staging_dir
-        else:
-            log.warning((
-                "Could not find root path for remapping \"{}\"."
-                " This may cause issues on farm."
-            ).format(staging))
 
         frame_start = int(skeleton_data.get("frameStartHandle"))
         if skeleton_data.get("slate"):
@@ -368,7 +492,7 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
         rep = {
             "name": ext,
             "ext": ext,
-            "files": [os.path.basename(f) for f in list(collection)],
+            "files": [os.path.basename(f) for f in collection_files],
             "frameStart": frame_start,
             "frameEnd": int(skeleton_data.get("frameEndHandle")),
             # If expectedFile are absolute, we need only filenames
@@ -399,17 +523,9 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
     for remainder in remainders:
         ext = remainder.split(".")[-1]
 
-        staging = os.path.dirname(remainder)
-        success, rootless_staging_dir = (
-            anatomy.find_root_template_from_path(staging)
+        staging = _remap_staging_dir(
+            os.path.dirname(remainder), anatomy, remapped_dirs, log
         )
-        if success:
-            staging = rootless_staging_dir
-        else:
-            log.warning((
-                "Could not find root path for remapping \"{}\"."
-                " This may cause issues on farm."
-            ).format(staging))
 
         rep = {
             "name": ext,
@@ -546,10 +662,32 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
     exp_files = instance.data["expectedFiles"]
     log = Logger.get_logger("farm_publishing")
 
+    # create subset name `familyTaskSubset_AOV`
+    # TODO refactor/remove me
+    family = skeleton["family"]
+    if not subset.startswith(family):
+        group_name = '{}{}{}{}{}'.format(
+            family,
+            task[0].upper(), task[1:],
+            subset[0].upper(), subset[1:])
+    else:
+        group_name = subset
+
+    app = os.environ.get("AVALON_APP", "")
+
+    # Render product "colorspace" data copied to representations
+    colorspace_by_product_name = {}
+    products = additional_data["renderProducts"].layer_data.products
+    for product in products:
+        colorspace_by_product_name.setdefault(
+            product.productName, product.colorspace
+        )
+
+    remapped_dirs = {}
     instances = []
     # go through AOVs in expected files
     for aov, files in exp_files[0].items():
-        cols, rem = clique.assemble(files)
+        cols, rem = assemble_expected_files(files)
         # we shouldn't have any reminders. And if we do, it should
         # be just one item for single frame renders.
         if not cols and rem:
@@ -567,17 +705,6 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
             ext = cols[0].tail.lstrip(".")
             col = list(cols[0])
 
-        # create subset name `familyTaskSubset_AOV`
-        # TODO refactor/remove me
-        family = skeleton["family"]
-        if not subset.startswith(family):
-            group_name = '{}{}{}{}{}'.format(
-                family,
-                task[0].upper(), task[1:],
-                subset[0].upper(), subset[1:])
-        else:
-            group_name = subset
-
         # if there are multiple cameras, we need to add camera name
         if isinstance(col, (list, tuple)):
             cam = [c for c in cameras if c in col[0]]
@@ -600,15 +727,10 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
         else:
             staging = os.path.dirname(col)
 
-        try:
-            staging = remap_source(staging, anatomy)
-        except ValueError as e:
-            log.warning(e)
+        staging = _remap_staging_dir(staging, anatomy, remapped_dirs, log)
 
         log.info("Creating data for: {}".format(subset_name))
 
-        app = os.environ.get("AVALON_APP", "")
-
         if isinstance(col, list):
             render_file_name = os.path.basename(col[0])
         else:
@@ -637,12 +759,7 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
             files = os.path.basename(col)
 
         # Copy render product "colorspace" data to representation.
-        colorspace = ""
-        products = additional_data["renderProducts"].layer_data.products
-        for product in products:
-            if product.productName == aov:
-                colorspace = product.colorspace
-                break
+        colorspace = colorspace_by_product_name.get(aov, "")
 
         rep = {
             "name": ext,
@@ -685,7 +802,7 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
         if new_instance.get("extendFrames", False):
             copy_extend_frames(new_instance, rep)
         instances.append(new_instance)
-        log.debug("instances:{}".format(instances))
+    log.debug("instances:{}".format(instances))
     return instances
 
 
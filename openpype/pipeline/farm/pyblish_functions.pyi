@@ -1,6 +1,7 @@
+import clique
 import pyblish.api
 from openpype.pipeline import Anatomy
-from typing import Tuple, Union, List
+from typing import Iterable, Tuple, Union, List
 
 
 class TimeData:
@@ -16,6 +17,7 @@ class TimeData:
     ...
 
 def remap_source(source: str, anatomy: Anatomy): ...
+def assemble_expected_files(files: Iterable[str]) -> Tuple[List[clique.Collection], List[str]]: ...
 def extend_frames(asset: str, subset: str, start: int, end: int) -> Tuple[int, int]: ...
 def get_time_data_from_instance_or_context(instance: pyblish.api.Instance) -> TimeData: ...
 def get_transferable_representations(instance: pyblish.api.Instance) -> list: ...
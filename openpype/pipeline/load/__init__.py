@@ -27,6 +27,7 @@ from .utils import (
     get_representation_path_from_context,
     get_representation_path,
     get_representation_path_with_anatomy,
+    get_representation_paths,
 
     is_compatible_loader,
 
@@ -37,6 +38,9 @@ from .utils import (
     any_outdated_containers,
     get_outdated_containers,
     filter_containers,
+    ContainersVersionsCache,
+    get_containers_versions_cache,
+    reset_containers_versions_cache,
 )
 
 from .plugins import (
@@ -81,6 +85,7 @@ __all__ = (
     "get_representation_path_from_context",
     "get_representation_path",
     "get_representation_path_with_anatomy",
+    "get_representation_paths",
 
     "is_compatible_loader",
 
@@ -91,6 +96,9 @@ __all__ = (
     "any_outdated_containers",
     "get_outdated_containers",
     "filter_containers",
+    "ContainersVersionsCache",
+    "get_containers_versions_cache",
+    "reset_containers_versions_cache",
 
     # plugins.py
     "LoaderPlugin",
@@ -2,6 +2,7 @@ import os
 import platform
 import copy
 import getpass
+import time
 import logging
 import inspect
 import collections
@@ -18,6 +19,7 @@ from openpype.client import (
     get_hero_version_by_subset_id,
     get_version_by_name,
     get_last_versions,
+    get_subset_ids_with_new_versions,
     get_representations,
     get_representation_by_id,
     get_representation_by_name,
@@ -611,6 +613,88 @@ def get_representation_path_with_anatomy(repre_doc, anatomy):
     return path.normalized()
 
 
+def get_representation_paths(
+    project_name,
+    repre_docs,
+    anatomy=None,
+    roots=None,
+    check_existence=False,
+    workers=8
+):
+    """Receive paths of multiple representations at once.
+
+    Batched variant of 'get_representation_path_with_anatomy'.
+    Representations are grouped by their template so each template is
+    parsed only once and all representations of the group are filled with
+    the same roots.
+
+    Args:
+        project_name (str): Project name.
+        repre_docs (Iterable[Dict[str, Any]]): Representation documents.
+        anatomy (Optional[Anatomy]): Project anatomy object. Created if not
+            passed and 'roots' are not passed.
+        roots (Optional[Dict[str, Any]]): Roots used to fill paths, e.g.
+            roots of other site. Roots of anatomy are used if not passed.
+        check_existence (Optional[bool]): Check if resolved paths exist.
+            Filesystem is accessed by multiple threads.
+        workers (Optional[int]): Number of threads used for existence
+            check.
+
+    Returns:
+        Dict[ObjectId, Union[TemplateResult, None]]: Path by representation
+            id. Value is None when representation template can't be filled
+            or when path does not exist and 'check_existence' is enabled.
+    """
+
+    if roots is None:
+        if anatomy is None:
+            anatomy = Anatomy(project_name)
+        roots = anatomy.roots
+
+    output = {}
+    repre_docs_by_template = collections.defaultdict(list)
+    for repre_doc in repre_docs:
+        output[repre_doc["_id"]] = None
+        template = repre_doc.get("data", {}).get("template")
+        if template and repre_doc.get("context"):
+            repre_docs_by_template[template].append(repre_doc)
+
+    for template, template_repre_docs in repre_docs_by_template.items():
+        fill_data = []
+        for repre_doc in template_repre_docs:
+            data = dict(repre_doc["context"])
+            data["root"] = roots
+            fill_data.append(data)
+
+        results = StringTemplate(template).format_many(fill_data)
+        for repre_doc, result in zip(template_repre_docs, results):
+            if result.solved:
+                output[repre_doc["_id"]] = result.normalized()
+
+    if check_existence:
+        _filter_existing_representation_paths(output, workers)
+    return output
+
+
+def _filter_existing_representation_paths(paths_by_repre_id, workers):
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = list({
+        path
+        for path in paths_by_repre_id.values()
+        if path is not None
+    })
+    if not paths:
+        return
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        existing = dict(zip(paths, executor.map(os.path.exists, paths)))
+
+    for repre_id, path in paths_by_repre_id.items():
+        if path is not None and not existing[path]:
+            paths_by_repre_id[repre_id] = None
+
+
 def get_representation_path(representation, root=None, dbcon=None):
     """Get filename from representation document
 
@@ -815,15 +899,15 @@ def loaders_from_representation(loaders, representation):
     return loaders_from_repre_context(loaders, context)
 
 
-def any_outdated_containers(host=None, project_name=None):
+def any_outdated_containers(host=None, project_name=None, incremental=False):
     """Check if there are any outdated containers in scene."""
 
-    if get_outdated_containers(host, project_name):
+    if get_outdated_containers(host, project_name, incremental):
         return True
     return False
 
 
-def get_outdated_containers(host=None, project_name=None):
+def get_outdated_containers(host=None, project_name=None, incremental=False):
     """Collect outdated containers from host scene.
 
     Currently registered host and project in global session are used if
@@ -832,6 +916,8 @@ def get_outdated_containers(host=None, project_name=None):
     Args:
         host (ModuleType): Host implementation with 'ls' function available.
         project_name (str): Name of project in which context we are.
+        incremental (Optional[bool]): Use cached last versions of subsets,
+            see 'filter_containers'.
     """
 
     if host is None:
@@ -846,10 +932,178 @@ def get_outdated_containers(host=None, project_name=None):
         containers = host.get_containers()
     else:
         containers = host.ls()
-    return filter_containers(containers, project_name).outdated
+    return filter_containers(containers, project_name, incremental).outdated
+
+
+class ContainersVersionsCache(object):
+    """Cache of data needed to find outdated containers in a project.
+
+    Representation to version and version to subset relations don't change,
+    they are queried only for ids which are not cached yet. Last versions of
+    cached subsets are queried again only for subsets which have new
+    versions since their last refresh (watermark).
+
+    Deleted representations and versions are not detected, use
+    'reset_containers_versions_cache' to clear the cache.
 
+    Args:
+        project_name (str): Project name.
+    """
+
+    # Seconds subtracted from watermark to cover differences of clock on
+    #   machines which create versions
+    watermark_margin = 120
+
+    def __init__(self, project_name):
+        self.project_name = project_name
+        self._version_id_by_repre_id = {}
+        self._subset_id_by_version_id = {}
+        self._hero_version_ids = set()
+        self._last_version_id_by_subset_id = {}
+        self._watermark_by_subset_id = {}
+
+    def refresh(self, repre_ids):
+        """Query data which are missing or changed for representations.
+
+        Args:
+            repre_ids (Iterable[str]): Representation ids of containers.
+        """
+
+        refresh_time = time.time()
+        missing_repre_ids = {
+            repre_id
+            for repre_id in repre_ids
+            if repre_id not in self._version_id_by_repre_id
+        }
+        if missing_repre_ids:
+            repre_docs = get_representations(
+                self.project_name,
+                representation_ids=missing_repre_ids,
+                fields=["_id", "parent"]
+            )
+            for repre_doc in repre_docs:
+                self._version_id_by_repre_id[str(repre_doc["_id"])] = (
+                    repre_doc["parent"]
+                )
+
+        missing_version_ids = {
+            self._version_id_by_repre_id[repre_id]
+            for repre_id in missing_repre_ids
+            if repre_id in self._version_id_by_repre_id
+        }
+        missing_version_ids -= self._hero_version_ids
+        missing_version_ids -= set(self._subset_id_by_version_id)
+        if missing_version_ids:
+            version_docs = get_versions(
+                self.project_name,
+                version_ids=missing_version_ids,
+                hero=True,
+                fields=["_id", "parent", "type"]
+            )
+            for version_doc in version_docs:
+                if version_doc["type"] == "hero_version":
+                    self._hero_version_ids.add(version_doc["_id"])
+                else:
+                    self._subset_id_by_version_id[version_doc["_id"]] = (
+                        version_doc["parent"]
+                    )
+
+        subset_ids = set()
+        for repre_id in repre_ids:
+            version_id = self._version_id_by_repre_id.get(repre_id)
+            subset_id = self._subset_id_by_version_id.get(version_id)
+            if subset_id is not None:
+                subset_ids.add(subset_id)
+
+        changed_subset_ids = subset_ids - set(self._watermark_by_subset_id)
+        cached_subset_ids = subset_ids - changed_subset_ids
+        if cached_subset_ids:
+            watermark = min(
+                self._watermark_by_subset_id[subset_id]
+                for subset_id in cached_subset_ids
+            )
+            changed_subset_ids |= get_subset_ids_with_new_versions(
+                self.project_name,
+                cached_subset_ids,
+                watermark - self.watermark_margin
+            )
+
+        if changed_subset_ids:
+            last_versions = get_last_versions(
+                self.project_name,
+                subset_ids=changed_subset_ids,
+                fields=["_id"]
+            )
+            for subset_id in changed_subset_ids:
+                last_version_doc = last_versions.get(subset_id)
+                if last_version_doc is None:
+                    self._last_version_id_by_subset_id.pop(subset_id, None)
+                else:
+                    self._last_version_id_by_subset_id[subset_id] = (
+                        last_version_doc["_id"]
+                    )
+
+        for subset_id in subset_ids:
+            self._watermark_by_subset_id[subset_id] = refresh_time
+
+    def get_version_id(self, repre_id):
+        """Version id of representation or None if was not found."""
+        return self._version_id_by_repre_id.get(repre_id)
+
+    def version_exists(self, version_id):
+        return (
+            version_id in self._subset_id_by_version_id
+            or version_id in self._hero_version_ids
+        )
 
-def filter_containers(containers, project_name):
+    def is_version_outdated(self, version_id):
+        """Version is not last version of its subset.
+
+        Hero versions are never outdated.
+        """
+
+        subset_id = self._subset_id_by_version_id.get(version_id)
+        if subset_id is None:
+            return False
+        last_version_id = self._last_version_id_by_subset_id.get(subset_id)
+        return last_version_id is not None and last_version_id != version_id
+
+
+_containers_versions_caches = {}
+
+
+def get_containers_versions_cache(project_name):
+    """Cache of data to find outdated containers shared in process.
+
+    Args:
+        project_name (str): Project name.
+
+    Returns:
+        ContainersVersionsCache: Cache of the project.
+    """
+
+    cache = _containers_versions_caches.get(project_name)
+    if cache is None:
+        cache = ContainersVersionsCache(project_name)
+        _containers_versions_caches[project_name] = cache
+    return cache
+
+
+def reset_containers_versions_cache(project_name=None):
+    """Clear cache of data to find outdated containers.
+
+    Args:
+        project_name (Optional[str]): Clear cache only of the project. All
+            caches are cleared if not passed.
+    """
+
+    if project_name is None:
+        _containers_versions_caches.clear()
+    else:
+        _containers_versions_caches.pop(project_name, None)
+
+
+def filter_containers(containers, project_name, incremental=False):
     """Filter containers and split them into 4 categories.
 
     Categories are 'latest', 'outdated', 'invalid' and 'not_found'.
@@ -857,10 +1111,16 @@ def filter_containers(containers, project_name):
     'invalid' are invalid containers (invalid content) and 'not_found' has
     some missing entity in database.
 
+    With 'incremental' are used data cached in 'ContainersVersionsCache'
+    from previous calls and only missing or changed data are queried, which
+    is useful for checks running repeatedly on the same scene (e.g. on save
+    or open).
+
     Args:
         containers (Iterable[dict]): List of containers referenced into scene.
         project_name (str): Name of project in which context shoud look for
             versions.
+        incremental (Optional[bool]): Use cached data from previous calls.
 
     Returns:
         ContainersFilterResult: Named tuple with 'latest', 'outdated',
@@ -891,56 +1151,11 @@ def filter_containers(containers, project_name):
             invalid_containers.extend(containers)
         return output
 
-    repre_docs = get_representations(
-        project_name,
-        representation_ids=repre_ids,
-        fields=["_id", "parent"]
-    )
-    # Store representations by stringified representation id
-    repre_docs_by_str_id = {}
-    repre_docs_by_version_id = collections.defaultdict(list)
-    for repre_doc in repre_docs:
-        repre_id = str(repre_doc["_id"])
-        version_id = repre_doc["parent"]
-        repre_docs_by_str_id[repre_id] = repre_doc
-        repre_docs_by_version_id[version_id].append(repre_doc)
-
-    # Query version docs to get it's subset ids
-    # - also query hero version to be able identify if representation
-    #   belongs to existing version
-    version_docs = get_versions(
-        project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True,
-        fields=["_id", "parent", "type"]
-    )
-    verisons_by_id = {}
-    versions_by_subset_id = collections.defaultdict(list)
-    hero_version_ids = set()
-    for version_doc in version_docs:
-        version_id = version_doc["_id"]
-        # Store versions by their ids
-        verisons_by_id[version_id] = version_doc
-        # There's no need to query subsets for hero versions
-        #   - they are considered as latest?
-        if version_doc["type"] == "hero_version":
-            hero_version_ids.add(version_id)
-            continue
-        subset_id = version_doc["parent"]
-        versions_by_subset_id[subset_id].append(version_doc)
-
-    last_versions = get_last_versions(
-        project_name,
-        subset_ids=versions_by_subset_id.keys(),
-        fields=["_id"]
-    )
-    # Figure out which versions are outdated
-    outdated_version_ids = set()
-    for subset_id, last_version_doc in last_versions.items():
-        for version_doc in versions_by_subset_id[subset_id]:
-            version_id = version_doc["_id"]
-            if version_id != last_version_doc["_id"]:
-                outdated_version_ids.add(version_id)
+    if incremental:
+        cache = get_containers_versions_cache(project_name)
+    else:
+        cache = ContainersVersionsCache(project_name)
+    cache.refresh(repre_ids)
 
     # Based on all collected data figure out which containers are outdated
     #   - log out if there are missing representation or version documents
@@ -951,8 +1166,8 @@ def filter_containers(containers, project_name):
             invalid_containers.append(container)
             continue
 
-        repre_doc = repre_docs_by_str_id.get(repre_id)
-        if not repre_doc:
+        version_id = cache.get_version_id(repre_id)
+        if version_id is None:
             log.debug((
                 "Container '{}' has an invalid representation."
                 " It is missing in the database."
@@ -960,11 +1175,10 @@ def filter_containers(containers, project_name):
             not_found_containers.append(container)
             continue
 
-        version_id = repre_doc["parent"]
-        if version_id in outdated_version_ids:
+        if cache.is_version_outdated(version_id):
             outdated_containers.append(container)
 
-        elif version_id not in verisons_by_id:
+        elif not cache.version_exists(version_id):
             log.debug((
                 "Representation on container '{}' has an invalid version."
                 " It is missing in the database."
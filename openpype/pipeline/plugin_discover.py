@@ -1,4 +1,5 @@
 import os
+import time
 import inspect
 import traceback
 
@@ -6,6 +7,7 @@ from openpype.lib import Logger
 from openpype.lib.python_module_tools import (
     modules_from_path,
     classes_from_module,
+    get_imported_files_cache_info,
 )
 
 log = Logger.get_logger(__name__)
@@ -25,6 +27,10 @@ class DiscoverResult:
         self.duplicated_plugins = []
         self.abstract_plugins = []
         self.ignored_plugins = set()
+        # Discovery statistics
+        self.discover_time = 0.0
+        self.imported_files_count = 0
+        self.cached_files_count = 0
         # Store loaded modules to keep them in memory
         self._modules = set()
 
@@ -45,6 +51,15 @@ class DiscoverResult:
     def get_report(self, only_errors=True, exc_info=True, full_report=False):
         lines = []
         if not only_errors:
+            lines.append((
+                "*** Discovery took {:.3f}s"
+                " ({} files imported, {} files reused from cache)"
+            ).format(
+                self.discover_time,
+                self.imported_files_count,
+                self.cached_files_count
+            ))
+
             # Successfully discovered plugins
             if self.plugins or full_report:
                 lines.append(
@@ -100,8 +115,9 @@ class PluginDiscoverContext(object):
     """Store and discover registered types nad registered paths to types.
 
     Keeps in memory all registered types and their paths. Paths are dynamically
-    loaded on discover so different discover calls won't return the same
-    class objects even if were loaded from same file.
+    loaded on discover. Files which did not change since previous discover
+    are not executed again, their modules from previous discover are reused.
+    Use 'force' to execute all files.
     """
 
     def __init__(self):
@@ -126,7 +142,8 @@ class PluginDiscoverContext(object):
         superclass,
         allow_duplicates=True,
         ignore_classes=None,
-        return_report=False
+        return_report=False,
+        force=False
     ):
         """Find and return subclasses of `superclass`
 
@@ -136,6 +153,8 @@ class PluginDiscoverContext(object):
             ignore_classes (list): List of classes that will be ignored
                 and not added to result.
             return_report (bool): Output will be full report if set to 'True'.
+            force (bool): Import all files from paths even if they did not
+                change since previous discover.
 
         Returns:
             Union[DiscoverResult, list[Any]]: Object holding successfully
@@ -143,6 +162,7 @@ class PluginDiscoverContext(object):
                 abstract implementation and duplicated plugin.
         """
 
+        start_time = time.time()
         if not ignore_classes:
             ignore_classes = []
 
@@ -168,7 +188,17 @@ class PluginDiscoverContext(object):
 
         # Include plug-ins from registered paths
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            cache_info = get_imported_files_cache_info()
+            modules, crashed = modules_from_path(
+                path, use_cache=True, force=force
+            )
+            new_cache_info = get_imported_files_cache_info()
+            result.cached_files_count += (
+                new_cache_info["hits"] - cache_info["hits"]
+            )
+            result.imported_files_count += (
+                new_cache_info["imports"] - cache_info["imports"]
+            )
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
@@ -194,6 +224,7 @@ class PluginDiscoverContext(object):
 
                     result.plugins.append(cls)
 
+        result.discover_time = time.time() - start_time
         # Store in memory last result to keep in memory loaded modules
         self._last_discovered_results[superclass] = result
         self._last_discovered_plugins[superclass] = list(
@@ -273,7 +304,8 @@ def discover(
     superclass,
     allow_duplicates=True,
     ignore_classes=None,
-    return_report=False
+    return_report=False,
+    force=False
 ):
     """Find and return subclasses of `superclass`
 
@@ -283,6 +315,8 @@ def discover(
         ignore_classes (list): List of classes that will be ignored
             and not added to result.
         return_report (bool): Output will be full report if set to 'True'.
+        force (bool): Import all files from paths even if they did not
+            change since previous discover.
 
     Returns:
         Union[DiscoverResult, list[Any]]: Object holding successfully
@@ -295,7 +329,8 @@ def discover(
         superclass,
         allow_duplicates,
         ignore_classes,
-        return_report
+        return_report,
+        force
     )
 
 
@@ -36,6 +36,7 @@ from .lib import (
     context_plugin_should_run,
     get_instance_staging_dir,
     get_publish_repre_path,
+    get_file_sequence_index,
 
     apply_plugin_settings_automatically,
     get_plugin_settings,
@@ -84,6 +85,7 @@ __all__ = (
     "context_plugin_should_run",
     "get_instance_staging_dir",
     "get_publish_repre_path",
+    "get_file_sequence_index",
 
     "apply_plugin_settings_automatically",
     "get_plugin_settings",
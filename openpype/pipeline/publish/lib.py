@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 import inspect
 import copy
 import tempfile
@@ -11,14 +12,16 @@ import pyblish.api
 
 from openpype.lib import (
     Logger,
-    import_filepath,
+    import_filepath_cached,
     filter_profiles,
     is_func_signature_supported,
+    FileSequenceIndex,
 )
 from openpype.settings import (
     get_project_settings,
     get_system_settings,
 )
+from openpype.client.entity_cache import entity_cache
 from openpype.pipeline import (
     tempdir,
     Anatomy
@@ -265,17 +268,22 @@ def load_help_content_from_plugin(plugin):
     return load_help_content_from_filepath(filepath)
 
 
-def publish_plugins_discover(paths=None):
+def publish_plugins_discover(paths=None, force=False):
     """Find and return available pyblish plug-ins
 
     Overridden function from `pyblish` module to be able to collect
         crashed files and reason of their crash.
 
+    Modules of files which did not change since previous discovery are
+        reused, so their plugin classes are not created again.
+
     Arguments:
         paths (list, optional): Paths to discover plug-ins from.
             If no paths are provided, all paths are searched.
+        force (bool, optional): Import all files even if they did not change.
     """
 
+    start_time = time.time()
     # The only difference with `pyblish.api.discover`
     result = DiscoverResult(pyblish.api.Plugin)
 
@@ -309,7 +317,13 @@ def publish_plugins_discover(paths=None):
                 continue
 
             try:
-                module = import_filepath(abspath, mod_name)
+                module, from_cache = import_filepath_cached(
+                    abspath, mod_name, force
+                )
+                if from_cache:
+                    result.cached_files_count += 1
+                else:
+                    result.imported_files_count += 1
 
                 # Store reference to original module, to avoid
                 # garbage collection from collecting it's global
@@ -362,6 +376,7 @@ def publish_plugins_discover(paths=None):
         filter_(plugins)
 
     result.plugins = plugins
+    result.discover_time = time.time() - start_time
 
     return result
 
@@ -546,14 +561,15 @@ def remote_publish(log):
     # Error exit as soon as any error occurs.
     error_format = "Failed {plugin.__name__}: {error}\n{error.traceback}"
 
-    for result in pyblish.util.publish_iter():
-        if not result["error"]:
-            continue
+    with entity_cache(os.environ.get("AVALON_PROJECT")):
+        for result in pyblish.util.publish_iter():
+            if not result["error"]:
+                continue
 
-        error_message = error_format.format(**result)
-        log.error(error_message)
-        # 'Fatal Error: ' is because of Deadline
-        raise RuntimeError("Fatal Error: {}".format(error_message))
+            error_message = error_format.format(**result)
+            log.error(error_message)
+            # 'Fatal Error: ' is because of Deadline
+            raise RuntimeError("Fatal Error: {}".format(error_message))
 
 
 def get_errored_instances_from_context(context, plugin=None):
@@ -981,6 +997,35 @@ def add_repre_files_for_cleanup(instance, repre):
         instance.context.data["cleanupFullPaths"].append(expected_file)
 
 
+def get_file_sequence_index(context, dirpath, force=False):
+    """Index of file sequences in directory shared in publish context.
+
+    Directory is scanned only once during publishing and the index is reused
+    by all plugins asking for the same directory. Directory is scanned again
+    if it was modified since the index was created.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+        dirpath (str): Path to directory.
+        force (Optional[bool]): Scan directory even if index is cached.
+
+    Returns:
+        FileSequenceIndex: Index of files in the directory.
+    """
+
+    indexes = context.data.setdefault("fileSequenceIndexes", {})
+    key = os.path.normcase(os.path.normpath(dirpath))
+    index = indexes.get(key)
+    if (
+        force
+        or index is None
+        or index.dir_mtime != os.stat(dirpath).st_mtime
+    ):
+        index = FileSequenceIndex.from_directory(dirpath)
+        indexes[key] = index
+    return index
+
+
 def get_publish_instance_label(instance):
     """Try to get label from pyblish instance.
 
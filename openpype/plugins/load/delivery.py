@@ -13,12 +13,13 @@ from openpype.lib import (
     collect_frames,
     get_datetime_data,
 )
-from openpype.pipeline.load import get_representation_path_with_anatomy
+from openpype.pipeline.load import get_representation_paths
 from openpype.pipeline.delivery import (
     get_format_dict,
     check_destination_path,
     deliver_single_file,
     deliver_sequence,
+    DeliveryExecutor,
 )
 
 
@@ -193,15 +194,26 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         format_dict = get_format_dict(self.anatomy, self.root_line_edit.text())
         renumber_frame = self.renumber_frame.isChecked()
         frame_offset = self.first_frame_start.value()
-        for repre in self._representations:
-            if repre["name"] not in selected_repres:
+        # Transfers of all representations are planned first and copied
+        #   concurrently at the end
+        executor = DeliveryExecutor()
+        repres = [
+            repre
+            for repre in self._representations
+            if repre["name"] in selected_repres
+        ]
+        repre_paths = get_representation_paths(
+            self.anatomy.project_name, repres, anatomy=self.anatomy
+        )
+        for repre in repres:
+            repre_path = repre_paths[repre["_id"]]
+            if repre_path is None:
+                msg = "Couldn't resolve path of representation"
+                report_items[msg].append(str(repre["_id"]))
                 continue
 
-            repre_path = get_representation_path_with_anatomy(
-                repre, self.anatomy
-            )
-
             anatomy_data = copy.deepcopy(repre["context"])
+            anatomy_data["root"] = self.anatomy.roots
             new_report_items = check_destination_path(str(repre["_id"]),
                                                       self.anatomy,
                                                       anatomy_data,
@@ -256,20 +268,32 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
 
                     if frame is not None:
                         anatomy_data["frame"] = frame
-                    new_report_items, uploaded = deliver_single_file(*args)
+                    new_report_items, _ = deliver_single_file(
+                        *args, executor=executor
+                    )
                     report_items.update(new_report_items)
-                    self._update_progress(uploaded)
             else:  # fallback for Pype2 and representations without files
                 frame = repre['context'].get('frame')
                 if frame:
                     repre["context"]["frame"] = len(str(frame)) * "#"
 
                 if not frame:
-                    new_report_items, uploaded = deliver_single_file(*args)
+                    new_report_items, _ = deliver_single_file(
+                        *args, executor=executor
+                    )
                 else:
-                    new_report_items, uploaded = deliver_sequence(*args)
+                    new_report_items, _ = deliver_sequence(
+                        *args, executor=executor
+                    )
                 report_items.update(new_report_items)
-                self._update_progress(uploaded)
+
+        counts = executor.process(self._update_progress)
+        for header, items in executor.report_items.items():
+            report_items[header].extend(items)
+        self.log.debug((
+            "Delivered files: {transferred}, already delivered: {skipped},"
+            " failed: {failed}"
+        ).format(**counts))
 
         self.text_area.setText(self._format_report(report_items))
         self.text_area.setVisible(True)
@@ -349,12 +373,13 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.template_label.setText(template_value)
             self.btn_delivery.setEnabled(bool(self._get_selected_repres()))
 
-    def _update_progress(self, uploaded):
-        """Update progress bar after each repre copied."""
-        self.currently_uploaded += uploaded
+    def _update_progress(self, processed, total):
+        """Update progress bar after each file delivered."""
+        self.currently_uploaded = processed
 
-        ratio = self.currently_uploaded / self.files_selected
-        self.progress_bar.setValue(ratio * self.progress_bar.maximum())
+        ratio = processed / total
+        self.progress_bar.setValue(int(ratio * self.progress_bar.maximum()))
+        QtWidgets.QApplication.processEvents()
 
     def _format_report(self, report_items):
         """Format final result and error details as html."""
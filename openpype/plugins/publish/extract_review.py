@@ -5,6 +5,7 @@ import json
 import shutil
 import subprocess
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import six
 import clique
@@ -25,6 +26,7 @@ from openpype.lib.transcoding import (
     convert_input_paths_for_ffmpeg,
     get_transcode_temp_directory,
 )
+from openpype.lib.media_probe_cache import get_media_probe_cache_info
 from openpype.pipeline.publish import (
     KnownPublishError,
     get_publish_instance_label,
@@ -76,6 +78,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Count of output definitions rendered at the same time
+    output_workers = 1
+    # Threads used by single ffmpeg process (0 lets ffmpeg decide)
+    ffmpeg_threads = 0
+    # Render compatible outputs with single ffmpeg process (decode once)
+    merge_compatible_outputs = False
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -85,6 +93,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         # Run processing
         self.main_process(instance)
+        self.log.debug("Media probe cache: {}".format(
+            get_media_probe_cache_info()
+        ))
 
         # Make sure cleanup happens and pop representations with "delete" tag.
         for repre in tuple(instance.data["representations"]):
@@ -218,7 +229,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
             instance, profile_outputs
         )
 
-        for repre, output_defs in outputs_per_repres:
+        repres_count = len(outputs_per_repres)
+        for repre_idx, item in enumerate(outputs_per_repres):
+            repre, output_defs = item
+            self.log.info("Processing representation \"{}\" ({}/{})".format(
+                repre["name"], repre_idx + 1, repres_count
+            ))
             # Check if input should be preconverted before processing
             # Store original staging dir (it's value may change)
             src_repre_staging_dir = repre["stagingDir"]
@@ -279,7 +295,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 convert_input_paths_for_ffmpeg(
                     input_filepaths,
                     new_staging_dir,
-                    self.log
+                    self.log,
+                    progress_callback=self._get_conversion_progress_callback(
+                        repre["name"]
+                    )
                 )
 
             try:
@@ -301,6 +320,23 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     if os.path.exists(new_staging_dir):
                         shutil.rmtree(new_staging_dir)
 
+    def _get_conversion_progress_callback(self, repre_name):
+        """Log progress of conversion each 10 percent."""
+        last_logged = [-1]
+
+        def _callback(done_count, total):
+            percent = int(done_count * 100 / total)
+            step = percent // 10
+            if step == last_logged[0]:
+                return
+            last_logged[0] = step
+            self.log.info(
+                "Representation \"{}\" conversion: {}/{} files ({}%)".format(
+                    repre_name, done_count, total, percent
+                )
+            )
+        return _callback
+
     def _render_output_definitions(
         self,
         instance,
@@ -310,130 +346,313 @@ class ExtractReview(pyblish.api.InstancePlugin):
         layer_name
     ):
         fill_data = copy.deepcopy(instance.data["anatomyData"])
-        for _output_def in output_definitions:
-            output_def = copy.deepcopy(_output_def)
-            # Make sure output definition has "tags" key
-            if "tags" not in output_def:
-                output_def["tags"] = []
-
-            if "burnins" not in output_def:
-                output_def["burnins"] = []
-
-            # Create copy of representation
-            new_repre = copy.deepcopy(repre)
-            # Make sure new representation has origin staging dir
-            #   - this is because source representation may change
-            #       it's staging dir because of ffmpeg conversion
-            new_repre["stagingDir"] = src_repre_staging_dir
-
-            # Remove "delete" tag from new repre if there is
-            if "delete" in new_repre["tags"]:
-                new_repre["tags"].remove("delete")
-
-            # Add additional tags from output definition to representation
-            for tag in output_def["tags"]:
-                if tag not in new_repre["tags"]:
-                    new_repre["tags"].append(tag)
-
-            # Add burnin link from output definition to representation
-            for burnin in output_def["burnins"]:
-                if burnin not in new_repre.get("burnins", []):
-                    if not new_repre.get("burnins"):
-                        new_repre["burnins"] = []
-                    new_repre["burnins"].append(str(burnin))
+        outputs_count = len(output_definitions)
+        # Arguments of all outputs are prepared first, then are outputs
+        #   rendered (concurrently if enabled) and representations are added
+        #   in order of output definitions
+        render_items = []
+        files_to_clean = set()
+        try:
+            for output_idx, _output_def in enumerate(output_definitions):
+                output_def = copy.deepcopy(_output_def)
+                render_item = self._prepare_output_render(
+                    instance,
+                    repre,
+                    src_repre_staging_dir,
+                    output_def,
+                    fill_data,
+                    layer_name,
+                    files_to_clean
+                )
+                if render_item is None:
+                    break
+                render_item["label"] = "\"{}\" ({}/{})".format(
+                    output_def["filename_suffix"],
+                    output_idx + 1,
+                    outputs_count
+                )
+                render_items.append(render_item)
 
-            self.log.debug(
-                "Linked burnins: `{}`".format(new_repre.get("burnins"))
+            self._run_output_renders(
+                self._create_render_jobs(render_items)
             )
 
+        finally:
+            # delete files added to fill gaps
+            for filepath in files_to_clean:
+                if os.path.exists(filepath):
+                    os.unlink(filepath)
+
+        for render_item in render_items:
+            new_repre = render_item["new_repre"]
+            # adding representation
             self.log.debug(
-                "New representation tags: `{}`".format(
-                    new_repre.get("tags"))
+                "Adding new representation: {}".format(new_repre)
             )
+            instance.data["representations"].append(new_repre)
 
-            temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
-            if temp_data["input_is_sequence"]:
-                self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
-                    files=temp_data["origin_repre"]["files"],
-                    staging_dir=new_repre["stagingDir"],
-                    start_frame=temp_data["frame_start"],
-                    end_frame=temp_data["frame_end"]
-                )
+            add_repre_files_for_cleanup(instance, new_repre)
+
+    def _create_render_jobs(self, render_items):
+        """Create ffmpeg commands to render prepared outputs.
+
+        When 'merge_compatible_outputs' is enabled, outputs with the same
+        input and frame range are rendered by single ffmpeg process which
+        decodes the input only once. Outputs which can't be merged are
+        rendered separately.
 
-            # create or update outputName
-            output_name = new_repre.get("outputName", "")
-            output_ext = new_repre["ext"]
-            if output_name:
-                output_name += "_"
-            output_name += output_def["filename_suffix"]
-            if temp_data["without_handles"]:
-                output_name += "_noHandles"
-
-            # add outputName to anatomy format fill_data
-            fill_data.update({
-                "output": output_name,
-                "ext": output_ext
+        Returns:
+            list[dict[str, Any]]: Jobs with label, command and commands
+                used if merged command fails.
+        """
+        groups = []
+        groups_by_key = {}
+        for render_item in render_items:
+            merge_key = None
+            if self.merge_compatible_outputs:
+                merge_key = self._get_output_merge_key(render_item)
+
+            if merge_key is None:
+                groups.append([render_item])
+                continue
+
+            group = groups_by_key.get(merge_key)
+            if group is None:
+                group = []
+                groups_by_key[merge_key] = group
+                groups.append(group)
+            group.append(render_item)
+
+        jobs = []
+        for group in groups:
+            commands = [
+                render_item["new_repre"]["ffmpeg_cmd"]
+                for render_item in group
+            ]
+            label = ", ".join(render_item["label"] for render_item in group)
+            if len(group) == 1:
+                jobs.append({
+                    "label": label,
+                    "command": commands[0],
+                    "fallback_commands": []
+                })
+                continue
+
+            merged_args = self.ffmpeg_multi_output_args([
+                render_item["ffmpeg_parts"]
+                for render_item in group
+            ])
+            jobs.append({
+                "label": label,
+                "command": " ".join(merged_args),
+                "fallback_commands": commands
             })
+        return jobs
 
-            try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
-                    output_def,
-                    instance,
-                    new_repre,
-                    temp_data,
-                    fill_data,
-                    layer_name,
-                )
-            except ZeroDivisionError:
-                # TODO recalculate width and height using OIIO before
-                #   conversion
-                if 'exr' in temp_data["origin_repre"]["ext"]:
-                    self.log.warning(
-                        (
-                            "Unsupported compression on input files."
-                            " Skipping!!!"
-                        ),
-                        exc_info=True
-                    )
-                    return
-                raise NotImplementedError
+    def _get_output_merge_key(self, render_item):
+        """Key of outputs which can be rendered by single ffmpeg process.
 
-            subprcs_cmd = " ".join(ffmpeg_args)
+        Returns:
+            Union[tuple, None]: Key or None if output can't be merged
+                with other outputs.
+        """
+        input_args, video_filters, audio_filters, output_args = (
+            render_item["ffmpeg_parts"]
+        )
+        # Audio inputs and filters are mapped per output
+        if audio_filters:
+            return None
+
+        input_paths = [arg for arg in input_args if arg.startswith("-i ")]
+        if len(input_paths) != 1:
+            return None
+
+        # Filters with labeled pads can't be chained in split graph
+        for value in video_filters:
+            if "[" in value or ";" in value:
+                return None
+
+        for arg in output_args:
+            if arg.split(" ")[0] in ("-map", "-filter_complex", "-lavfi"):
+                return None
+
+        return (
+            tuple(input_args),
+            render_item["frame_start"],
+            render_item["frame_end"],
+        )
+
+    def _run_output_renders(self, render_jobs):
+        """Run ffmpeg for prepared outputs.
 
+        Outputs are rendered concurrently if 'output_workers' is higher
+        than 1.
+        """
+        def _render(render_job):
+            self.log.info("Rendering output {}".format(render_job["label"]))
+            subprcs_cmd = render_job["command"]
             # run subprocess
             self.log.debug("Executing: {}".format(subprcs_cmd))
+            try:
+                run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+                return
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+            except RuntimeError:
+                if not render_job["fallback_commands"]:
+                    raise
+                self.log.warning((
+                    "Rendering of merged outputs failed."
+                    " Rendering outputs separately."
+                ), exc_info=True)
+
+            for subprcs_cmd in render_job["fallback_commands"]:
+                self.log.debug("Executing: {}".format(subprcs_cmd))
+                run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+
+        workers = min(self.output_workers or 1, len(render_jobs))
+        if workers <= 1:
+            for render_job in render_jobs:
+                _render(render_job)
+            return
 
-            # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
-
-            new_repre.update({
-                "fps": temp_data["fps"],
-                "name": "{}_{}".format(output_name, output_ext),
-                "outputName": output_name,
-                "outputDef": output_def,
-                "frameStartFtrack": temp_data["output_frame_start"],
-                "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
-            })
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_render, render_job)
+                for render_job in render_jobs
+            ]
+        # Raise first error in order of output definitions
+        for future in futures:
+            future.result()
 
-            # Force to pop these key if are in new repre
-            new_repre.pop("thumbnail", None)
-            if "clean_name" in new_repre.get("tags", []):
-                new_repre.pop("outputName")
+    def _prepare_output_render(
+        self,
+        instance,
+        repre,
+        src_repre_staging_dir,
+        output_def,
+        fill_data,
+        layer_name,
+        files_to_clean
+    ):
+        """Prepare new representation and ffmpeg command of one output.
 
-            # adding representation
-            self.log.debug(
-                "Adding new representation: {}".format(new_repre)
+        Returns:
+            Union[dict[str, Any], None]: Render data or None if outputs
+                can't be rendered.
+        """
+        # Make sure output definition has "tags" key
+        if "tags" not in output_def:
+            output_def["tags"] = []
+
+        if "burnins" not in output_def:
+            output_def["burnins"] = []
+
+        # Create copy of representation
+        new_repre = copy.deepcopy(repre)
+        # Make sure new representation has origin staging dir
+        #   - this is because source representation may change
+        #       it's staging dir because of ffmpeg conversion
+        new_repre["stagingDir"] = src_repre_staging_dir
+
+        # Remove "delete" tag from new repre if there is
+        if "delete" in new_repre["tags"]:
+            new_repre["tags"].remove("delete")
+
+        # Add additional tags from output definition to representation
+        for tag in output_def["tags"]:
+            if tag not in new_repre["tags"]:
+                new_repre["tags"].append(tag)
+
+        # Add burnin link from output definition to representation
+        for burnin in output_def["burnins"]:
+            if burnin not in new_repre.get("burnins", []):
+                if not new_repre.get("burnins"):
+                    new_repre["burnins"] = []
+                new_repre["burnins"].append(str(burnin))
+
+        self.log.debug(
+            "Linked burnins: `{}`".format(new_repre.get("burnins"))
+        )
+
+        self.log.debug(
+            "New representation tags: `{}`".format(
+                new_repre.get("tags"))
+        )
+
+        temp_data = self.prepare_temp_data(instance, repre, output_def)
+        if temp_data["input_is_sequence"]:
+            self.log.debug("Checking sequence to fill gaps in sequence..")
+            files_to_clean.update(self.fill_sequence_gaps(
+                files=temp_data["origin_repre"]["files"],
+                staging_dir=new_repre["stagingDir"],
+                start_frame=temp_data["frame_start"],
+                end_frame=temp_data["frame_end"]
+            ))
+
+        # create or update outputName
+        output_name = new_repre.get("outputName", "")
+        output_ext = new_repre["ext"]
+        if output_name:
+            output_name += "_"
+        output_name += output_def["filename_suffix"]
+        if temp_data["without_handles"]:
+            output_name += "_noHandles"
+
+        # add outputName to anatomy format fill_data
+        fill_data.update({
+            "output": output_name,
+            "ext": output_ext
+        })
+
+        try:  # temporary until oiiotool is supported cross platform
+            ffmpeg_parts = self._ffmpeg_arguments(
+                output_def,
+                instance,
+                new_repre,
+                temp_data,
+                fill_data,
+                layer_name,
             )
-            instance.data["representations"].append(new_repre)
+        except ZeroDivisionError:
+            # TODO recalculate width and height using OIIO before
+            #   conversion
+            if 'exr' in temp_data["origin_repre"]["ext"]:
+                self.log.warning(
+                    (
+                        "Unsupported compression on input files."
+                        " Skipping!!!"
+                    ),
+                    exc_info=True
+                )
+                return None
+            raise NotImplementedError
 
-            add_repre_files_for_cleanup(instance, new_repre)
+        ffmpeg_args = self.ffmpeg_full_args(
+            *copy.deepcopy(ffmpeg_parts)
+        )
+        subprcs_cmd = " ".join(ffmpeg_args)
+
+        new_repre.update({
+            "fps": temp_data["fps"],
+            "name": "{}_{}".format(output_name, output_ext),
+            "outputName": output_name,
+            "outputDef": output_def,
+            "frameStartFtrack": temp_data["output_frame_start"],
+            "frameEndFtrack": temp_data["output_frame_end"],
+            "ffmpeg_cmd": subprcs_cmd
+        })
+
+        # Force to pop these key if are in new repre
+        new_repre.pop("thumbnail", None)
+        if "clean_name" in new_repre.get("tags", []):
+            new_repre.pop("outputName")
+
+        return {
+            "new_repre": new_repre,
+            "ffmpeg_parts": ffmpeg_parts,
+            "frame_start": temp_data["output_frame_start"],
+            "frame_end": temp_data["output_frame_end"],
+        }
 
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
@@ -564,6 +783,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
             new_repre (dict): Representation representing output of this
                 process.
             temp_data (dict): Base data for successful process.
+
+        Returns:
+            tuple[list[str], list[str], list[str], list[str]]: Input
+                arguments, video filters, audio filters and output arguments
+                with output filepath.
         """
 
         # Get FFmpeg arguments from profile presets
@@ -736,6 +960,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 for arg in reversed(color_args):
                     ffmpeg_video_filters.insert(0, arg)
 
+        # Limit threads of ffmpeg when outputs are rendered concurrently
+        if self.ffmpeg_threads and not any(
+            arg.startswith("-threads") for arg in ffmpeg_output_args
+        ):
+            ffmpeg_output_args.extend(["-threads", str(self.ffmpeg_threads)])
+
         # Add argument to override output file
         ffmpeg_output_args.append("-y")
 
@@ -744,7 +974,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        ffmpeg_output_args = self._move_filters_from_output_args(
+            ffmpeg_video_filters,
+            ffmpeg_audio_filters,
+            ffmpeg_output_args
+        )
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -792,22 +1027,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
-        output_args = self.split_ffmpeg_args(output_args)
-
-        video_args_dentifiers = ["-vf", "-filter:v"]
-        audio_args_dentifiers = ["-af", "-filter:a"]
-        for arg in tuple(output_args):
-            for identifier in video_args_dentifiers:
-                if arg.startswith("{} ".format(identifier)):
-                    output_args.remove(arg)
-                    arg = arg.replace(identifier, "").strip()
-                    video_filters.append(arg)
-
-            for identifier in audio_args_dentifiers:
-                if arg.startswith("{} ".format(identifier)):
-                    output_args.remove(arg)
-                    arg = arg.replace(identifier, "").strip()
-                    audio_filters.append(arg)
+        output_args = self._move_filters_from_output_args(
+            video_filters, audio_filters, output_args
+        )
 
         all_args = [
             subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
@@ -825,6 +1047,92 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         return all_args
 
+    def ffmpeg_multi_output_args(self, outputs_args):
+        """Arguments rendering multiple outputs with single ffmpeg process.
+
+        Input is decoded once and split to output branches using
+        '-filter_complex'. Video filters shared by all outputs are applied
+        before the split. All outputs must have the same input arguments
+        and must not have audio filters.
+
+        Args:
+            outputs_args (list[tuple]): Input arguments, video filters,
+                audio filters and output arguments of each output.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        input_args = outputs_args[0][0]
+        filters_per_output = [item[1] for item in outputs_args]
+
+        common_filters = []
+        for filters in zip(*filters_per_output):
+            if any(value != filters[0] for value in filters):
+                break
+            common_filters.append(filters[0])
+
+        outputs_count = len(outputs_args)
+        split_filters = list(common_filters)
+        split_filters.append("split={}".format(outputs_count))
+        graph = [
+            "[0:v]{}{}".format(
+                ",".join(split_filters),
+                "".join("[s{}]".format(idx) for idx in range(outputs_count))
+            )
+        ]
+        for idx, filters in enumerate(filters_per_output):
+            branch_filters = filters[len(common_filters):] or ["null"]
+            graph.append("[s{}]{}[v{}]".format(
+                idx, ",".join(branch_filters), idx
+            ))
+
+        all_args = [
+            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg")),
+            "-y"
+        ]
+        all_args.extend(input_args)
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(";".join(graph)))
+        for idx, output_args in enumerate(item[3] for item in outputs_args):
+            all_args.extend(["-map", "\"[v{}]\"".format(idx)])
+            # Keep audio of video input, single output would use it too
+            output_path = output_args[-1].strip("\"")
+            output_ext = os.path.splitext(output_path)[-1].lower()
+            if (
+                "-an" not in output_args
+                and output_ext not in IMAGE_EXTENSIONS
+            ):
+                all_args.extend(["-map", "\"0:a:0?\""])
+            all_args.extend(arg for arg in output_args if arg != "-y")
+
+        return all_args
+
+    def _move_filters_from_output_args(
+        self, video_filters, audio_filters, output_args
+    ):
+        """Move video and audio filters from output arguments to filters.
+
+        Returns:
+            list[str]: Output arguments without filters.
+        """
+        output_args = self.split_ffmpeg_args(output_args)
+
+        video_args_dentifiers = ["-vf", "-filter:v"]
+        audio_args_dentifiers = ["-af", "-filter:a"]
+        for arg in tuple(output_args):
+            for identifier in video_args_dentifiers:
+                if arg.startswith("{} ".format(identifier)):
+                    output_args.remove(arg)
+                    arg = arg.replace(identifier, "").strip()
+                    video_filters.append(arg)
+
+            for identifier in audio_args_dentifiers:
+                if arg.startswith("{} ".format(identifier)):
+                    output_args.remove(arg)
+                    arg = arg.replace(identifier, "").strip()
+                    audio_filters.append(arg)
+        return output_args
+
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
         """Fill missing files in sequence by duplicating existing ones.
@@ -154,6 +154,26 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         "family", "hierarchy", "username", "user", "output"
     ]
 
+    # Number of concurrent file transfers per destination root. Default
+    #   value '1' transfers files sequentially.
+    transfer_workers_per_root = 1
+    # Checksum algorithm calculated during file transfers ('sha1', 'md5',
+    #   'xxhash'). Checksums are not calculated when empty.
+    transfer_checksum_algorithm = None
+    # Mode used for copied files ('copy', 'reflink', 'copy_file_range').
+    #   Reflink and copy_file_range fall back to copy per file when
+    #   destination filesystem does not support them.
+    transfer_copy_mode = "copy"
+    # Log progress of file transfers. Sizes of all source files are queried
+    #   before transfer when enabled.
+    transfer_log_progress = False
+
+    _copy_modes_by_name = {
+        "copy": FileTransaction.MODE_COPY,
+        "reflink": FileTransaction.MODE_REFLINK,
+        "copy_file_range": FileTransaction.MODE_COPY_FILE_RANGE,
+    }
+
     def process(self, instance):
 
         # Instance should be integrated on a farm
@@ -177,9 +197,18 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        progress_callback = None
+        if self.transfer_log_progress:
+            progress_callback = self._on_transfer_progress
+
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            workers_per_root=self.transfer_workers_per_root,
+            progress_callback=progress_callback,
+            checksum_algorithm=self.transfer_checksum_algorithm or None
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -200,6 +229,37 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # the try, except.
         file_transactions.finalize()
 
+    def _get_copy_mode(self):
+        copy_mode = self._copy_modes_by_name.get(self.transfer_copy_mode)
+        if copy_mode is None:
+            self.log.warning(
+                "Unknown transfer copy mode '{}'. Using 'copy'.".format(
+                    self.transfer_copy_mode))
+            copy_mode = FileTransaction.MODE_COPY
+        return copy_mode
+
+    def _on_transfer_progress(self, progress):
+        """Log progress of file transfers.
+
+        Progress is logged only on each 10% of transferred files to avoid
+        flooding of the log with long sequences.
+        """
+
+        total = progress["total_files"]
+        done = progress["transferred_files"]
+        step = max(1, total // 10)
+        if done != total and done % step:
+            return
+
+        self.log.debug(
+            "Transferred {}/{} files ({:.1f} MB at {:.1f} MB/s)".format(
+                done,
+                total,
+                progress["transferred_bytes"] / 1048576.0,
+                progress["throughput"] / 1048576.0
+            )
+        )
+
     def filter_representations(self, instance):
         # Prepare repsentations that should be integrated
         repres = instance.data.get("representations")
@@ -267,6 +327,8 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
         }
 
+        copy_mode = self._get_copy_mode()
+
         # Prepare all representations
         prepared_representations = []
         for repre in filtered_repres:
@@ -281,7 +343,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
             for src, dst in prepared["transfers"]:
                 # todo: add support for hardlink transfers
-                file_transactions.add(src, dst)
+                file_transactions.add(src, dst, mode=copy_mode)
 
             prepared_representations.append(prepared)
 
@@ -292,14 +354,14 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         resource_destinations = set()
 
         file_copy_modes = [
-            ("transfers", FileTransaction.MODE_COPY),
+            ("transfers", copy_mode),
             ("hardlinks", FileTransaction.MODE_HARDLINK)
         ]
-        for files_type, copy_mode in file_copy_modes:
+        for files_type, files_copy_mode in file_copy_modes:
             for src, dst in instance.data.get(files_type, []):
                 self._validate_path_in_project_roots(anatomy, dst)
 
-                file_transactions.add(src, dst, mode=copy_mode)
+                file_transactions.add(src, dst, mode=files_copy_mode)
                 resource_destinations.add(os.path.abspath(dst))
 
         # Bulk write to the database
@@ -320,6 +382,11 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             "Backed up existing files: {}".format(file_transactions.backups))
         self.log.debug(
             "Transferred files: {}".format(file_transactions.transferred))
+        if self.transfer_checksum_algorithm:
+            instance.data["transferChecksums"] = file_transactions.checksums
+        if copy_mode != FileTransaction.MODE_COPY:
+            self.log.debug(
+                "Transfer modes: {}".format(file_transactions.transfer_log))
         self.log.debug("Retrieving Representation Site Sync information ...")
 
         # Get the accessible sites for Site Sync
@@ -736,22 +803,23 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
+            index_key = "udim" if is_udim else "frame"
+            frames_data = []
             for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+                frame_data = dict(template_data)
+                frame_data[index_key] = index
+                frames_data.append(frame_data)
+            # Keep last index in template data as it would be after filling
+            #   the template for each index one by one
+            template_data[index_key] = destination_indexes[-1]
+
+            dst_filepaths = path_template_obj.format_many(
+                frames_data, strict=True
+            )
+            self.log.debug(
+                "Template filled: {}".format(str(dst_filepaths[0]))
+            )
+            repre_context = dst_filepaths[0].used_values
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
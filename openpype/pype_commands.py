@@ -93,12 +93,11 @@ class PypeCommands:
             LaunchTypes,
         )
         from openpype.modules import ModulesManager
+        from openpype.client.entity_cache import entity_cache
         from openpype.pipeline import (
             install_openpype_plugins,
             get_global_context,
         )
-        from openpype.tools.utils.host_tools import show_publish
-        from openpype.tools.utils.lib import qt_app_context
 
         # Register target and host
         import pyblish.api
@@ -150,6 +149,9 @@ class PypeCommands:
             print(plugin)
 
         if gui:
+            from openpype.tools.utils.host_tools import show_publish
+            from openpype.tools.utils.lib import qt_app_context
+
             with qt_app_context():
                 show_publish()
         else:
@@ -157,11 +159,13 @@ class PypeCommands:
             error_format = ("Failed {plugin.__name__}: "
                             "{error} -- {error.traceback}")
 
-            for result in pyblish.util.publish_iter():
-                if result["error"]:
-                    log.error(error_format.format(**result))
-                    # uninstall()
-                    sys.exit(1)
+            project_name = get_global_context()["project_name"]
+            with entity_cache(project_name):
+                for result in pyblish.util.publish_iter():
+                    if result["error"]:
+                        log.error(error_format.format(**result))
+                        # uninstall()
+                        sys.exit(1)
 
         log.info("Publish finished.")
 
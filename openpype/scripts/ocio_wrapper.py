@@ -17,13 +17,43 @@ Providing functionality:
 - _get_views_data - python 3 - module function
                  - returning all available viewers
                    found in input config path.
+- serve - console command - python 2
+        - long-lived process answering line-delimited json
+          requests from stdin.
 """
 
+import os
+import sys
 import click
 import json
 from pathlib2 import Path
 import PyOpenColorIO as ocio
 
+# Prefix of response lines written by 'serve' command. Other lines in
+#   output of the process (e.g. from bootstrap) are ignored by client.
+SERVE_RESPONSE_PREFIX = "__ocio_wrapper_response__:"
+
+# Loaded configs by path and modification time
+_CONFIGS_CACHE = {}
+
+
+def _get_config(config_path):
+    """Load config from file and cache it until the file is modified.
+
+    Args:
+        config_path (Union[str, Path]): path string leading to config.ocio
+
+    Returns:
+        ocio.Config: Loaded config.
+    """
+    config_path = str(config_path)
+    mtime = os.path.getmtime(config_path)
+    cached = _CONFIGS_CACHE.get(config_path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, ocio.Config.CreateFromFile(config_path))
+        _CONFIGS_CACHE[config_path] = cached
+    return cached[1]
+
 
 @click.group()
 def main():
@@ -104,7 +134,7 @@ def _get_colorspace_data(config_path):
         raise IOError(
             f"Input path `{config_path}` should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     colorspace_data = {
         "roles": {},
@@ -201,7 +231,7 @@ def _get_views_data(config_path):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     data_ = {}
     for display in config.getDisplays():
@@ -274,7 +304,7 @@ def _get_version_data(config_path):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     return {
         "major": config.getMajorVersion(),
@@ -347,7 +377,7 @@ def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
         raise IOError(
             f"Input path `{config_path}` should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     # TODO: use `parseColorSpaceFromString` instead if ocio v1
     colorspace = config.getColorSpaceFromFilepath(str(filepath))
@@ -376,7 +406,7 @@ def _get_display_view_colorspace_name(config_path, display, view):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config.CreateFromFile(str(config_path))
+    config = _get_config(config_path)
     colorspace = config.getDisplayViewColorSpaceName(display, view)
 
     return colorspace
@@ -429,5 +459,95 @@ def get_display_view_colorspace_name(in_path, out_path,
 
     print(f"Display view colorspace saved to '{out_path}'")
 
+
+# Functions available in 'serve' command by command group and command name
+_SERVE_COMMANDS = {
+    ("config", "get_colorspace"): _get_colorspace_data,
+    ("config", "get_views"): _get_views_data,
+    ("config", "get_version"): _get_version_data,
+    (
+        "config", "get_display_view_colorspace_name"
+    ): _get_display_view_colorspace_name,
+    (
+        "colorspace", "get_config_file_rules_colorspace_from_filepath"
+    ): _get_config_file_rules_colorspace_from_filepath,
+}
+# Options of console commands which have different name in functions
+_SERVE_ARGS_MAPPING = {
+    "in_path": "config_path",
+}
+
+
+def _process_serve_request(request):
+    """Process single request of 'serve' command.
+
+    Args:
+        request (dict): Request with 'id', 'command_group', 'command'
+            and 'kwargs' keys.
+
+    Returns:
+        dict: Response with 'id' and 'result' or 'error' key.
+    """
+    response = {"id": request.get("id")}
+    command_key = (request.get("command_group"), request.get("command"))
+    func = _SERVE_COMMANDS.get(command_key)
+    if func is None:
+        response["error"] = "Unknown command '{}'".format(
+            " ".join(str(item) for item in command_key)
+        )
+        return response
+
+    kwargs = {
+        _SERVE_ARGS_MAPPING.get(key, key): value
+        for key, value in request.get("kwargs", {}).items()
+    }
+    try:
+        response["result"] = func(**kwargs)
+    except Exception as exc:
+        response["error"] = "{}: {}".format(exc.__class__.__name__, exc)
+    return response
+
+
+@main.command(
+    name="serve",
+    help=(
+        "answer line-delimited json requests from stdin "
+        "until stdin is closed"
+    )
+)
+def serve():
+    """Answer requests from stdin until stdin is closed.
+
+    Each request is json on single line with 'id', 'command_group', 'command'
+    and 'kwargs' keys, e.g. '{"id": 1, "command_group": "config",
+    "command": "get_views", "kwargs": {"in_path": "<path>"}}'.
+    Each response is written on single line with 'SERVE_RESPONSE_PREFIX'
+    followed by json with 'id' and 'result' or 'error' keys.
+
+    Loaded configs are kept in memory so following requests for the same
+    config are answered without loading the config again.
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py serve
+    """
+    # Anything printed during processing must not break the responses
+    output = sys.stdout
+    sys.stdout = sys.stderr
+    for line in iter(sys.stdin.readline, ""):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+        except ValueError as exc:
+            response = {"id": None, "error": "Invalid request: {}".format(exc)}
+        else:
+            response = _process_serve_request(request)
+
+        output.write(SERVE_RESPONSE_PREFIX + json.dumps(response) + "\n")
+        output.flush()
+
+
 if __name__ == '__main__':
     main()
@@ -21,6 +21,8 @@ from .lib import (
     get_global_settings,
     get_system_settings,
     get_project_settings,
+    get_system_settings_view,
+    get_project_settings_view,
     get_current_project_settings,
     get_anatomy_settings,
     get_local_settings,
@@ -53,6 +55,8 @@ __all__ = (
     "get_global_settings",
     "get_system_settings",
     "get_project_settings",
+    "get_system_settings_view",
+    "get_project_settings_view",
     "get_current_project_settings",
     "get_anatomy_settings",
     "get_local_settings",
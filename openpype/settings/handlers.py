@@ -294,6 +294,31 @@ class SettingsHandler(object):
         """
         pass
 
+    def get_system_settings_revision(self):
+        """Revision of studio system settings overrides.
+
+        Revision changes when overrides change, e.g. on save. It can be used
+        to find out if values resolved from overrides are outdated.
+
+        Returns:
+            Union[int, None]: Revision or None if handler does not support
+                revisions.
+        """
+        return None
+
+    def get_project_settings_revision(self, project_name):
+        """Revision of project settings overrides.
+
+        Args:
+            project_name(str, null): Project name or None for studio
+                overrides of default project settings.
+
+        Returns:
+            Union[int, None]: Revision or None if handler does not support
+                revisions.
+        """
+        return None
+
     # Getters for specific version overrides
     @abstractmethod
     def get_studio_system_settings_overrides_for_version(self, version):
@@ -554,6 +579,15 @@ class LocalSettingsHandler:
         """Studio overrides of system settings."""
         pass
 
+    def get_local_settings_revision(self):
+        """Revision of local settings.
+
+        Returns:
+            Union[int, None]: Revision or None if handler does not support
+                revisions.
+        """
+        return None
+
 
 class CacheValues:
     cache_lifetime = 10
@@ -563,6 +597,8 @@ class CacheValues:
         self.creation_time = None
         self.version = None
         self.last_saved_info = None
+        # Changed each time data change
+        self.revision = 0
 
     def data_copy(self):
         if not self.data:
@@ -573,6 +609,7 @@ class CacheValues:
         self.data = data
         self.creation_time = datetime.datetime.now()
         self.version = version
+        self.revision += 1
 
     def update_last_saved_info(self, last_saved_info):
         self.last_saved_info = last_saved_info
@@ -587,7 +624,10 @@ class CacheValues:
                 if value:
                     data = json.loads(value)
 
+        if data != self.data or version != self.version:
+            self.revision += 1
         self.data = data
+        self.creation_time = datetime.datetime.now()
         self.version = version
 
     def to_json_string(self):
@@ -601,7 +641,7 @@ class CacheValues:
         return delta > self.cache_lifetime
 
     def set_outdated(self):
-        self.create_time = None
+        self.creation_time = None
 
 
 class MongoSettingsHandler(SettingsHandler):
@@ -1346,6 +1386,18 @@ class MongoSettingsHandler(SettingsHandler):
 
     def get_studio_system_settings_overrides(self, return_version):
         """Studio overrides of system settings."""
+        self._refresh_system_settings_cache()
+        cache = self.system_settings_cache
+        data = cache.data_copy()
+        if return_version:
+            return data, cache.version
+        return data
+
+    def get_system_settings_revision(self):
+        self._refresh_system_settings_cache()
+        return self.system_settings_cache.revision
+
+    def _refresh_system_settings_cache(self):
         if self.system_settings_cache.is_outdated:
             globals_document = self.get_global_settings_doc()
             document, version = self._get_system_settings_overrides_doc()
@@ -1364,12 +1416,6 @@ class MongoSettingsHandler(SettingsHandler):
                 last_saved_info
             )
 
-        cache = self.system_settings_cache
-        data = cache.data_copy()
-        if return_version:
-            return data, cache.version
-        return data
-
     def _get_system_settings_overrides_doc(self):
         document = (
             self._get_studio_system_settings_overrides_for_version()
@@ -1394,6 +1440,18 @@ class MongoSettingsHandler(SettingsHandler):
         return self.system_settings_cache.last_saved_info.copy()
 
     def _get_project_settings_overrides(self, project_name, return_version):
+        self._refresh_project_settings_cache(project_name)
+        cache = self.project_settings_cache[project_name]
+        data = cache.data_copy()
+        if return_version:
+            return data, cache.version
+        return data
+
+    def get_project_settings_revision(self, project_name):
+        self._refresh_project_settings_cache(project_name)
+        return self.project_settings_cache[project_name].revision
+
+    def _refresh_project_settings_cache(self, project_name):
         if self.project_settings_cache[project_name].is_outdated:
             document, version = self._get_project_settings_overrides_doc(
                 project_name
@@ -1408,12 +1466,6 @@ class MongoSettingsHandler(SettingsHandler):
                 last_saved_info
             )
 
-        cache = self.project_settings_cache[project_name]
-        data = cache.data_copy()
-        if return_version:
-            return data, cache.version
-        return data
-
     def _get_project_settings_overrides_doc(self, project_name):
         document = self._get_project_settings_overrides_for_version(
             project_name
@@ -1852,6 +1904,14 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
 
     def get_local_settings(self):
         """Local settings for local site id."""
+        self._refresh_local_settings_cache()
+        return self.local_settings_cache.data_copy()
+
+    def get_local_settings_revision(self):
+        self._refresh_local_settings_cache()
+        return self.local_settings_cache.revision
+
+    def _refresh_local_settings_cache(self):
         if self.local_settings_cache.is_outdated:
             document = self.collection.find_one({
                 "type": LOCAL_SETTING_KEY,
@@ -1859,5 +1919,3 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
             })
 
             self.local_settings_cache.update_from_document(document, None)
-
-        return self.local_settings_cache.data_copy()
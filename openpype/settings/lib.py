@@ -5,6 +5,12 @@ import logging
 import platform
 import copy
 
+try:
+    from types import MappingProxyType
+except ImportError:
+    # Python 2 fallback, views are not read-only
+    MappingProxyType = None
+
 from openpype import AYON_SERVER_ENABLED
 
 from .exceptions import (
@@ -47,6 +53,9 @@ _SETTINGS_HANDLER = None
 # Handler of local settings
 _LOCAL_SETTINGS_HANDLER = None
 
+# Resolved settings by arguments used to resolve them
+_RESOLVED_SETTINGS_CACHE = {}
+
 
 def clear_metadata_from_settings(values):
     """Remove all metadata keys from loaded settings."""
@@ -186,6 +195,7 @@ def save_studio_settings(data):
 
     _SETTINGS_HANDLER.save_change_log(None, changes, "system")
     _SETTINGS_HANDLER.save_studio_settings(data)
+    clear_settings_cache()
     if warnings:
         raise SaveWarningExc(warnings)
 
@@ -246,6 +256,7 @@ def save_project_settings(project_name, overrides):
                 warnings.extend(exc.warnings)
     _SETTINGS_HANDLER.save_change_log(project_name, changes, "project")
     _SETTINGS_HANDLER.save_project_settings(project_name, overrides)
+    clear_settings_cache()
 
     if warnings:
         raise SaveWarningExc(warnings)
@@ -523,6 +534,21 @@ def _get_local_settings():
     return _LOCAL_SETTINGS_HANDLER.get_local_settings()
 
 
+@require_local_handler
+def _get_local_settings_revision():
+    return _LOCAL_SETTINGS_HANDLER.get_local_settings_revision()
+
+
+@require_handler
+def _get_system_settings_revision():
+    return _SETTINGS_HANDLER.get_system_settings_revision()
+
+
+@require_handler
+def _get_project_settings_revision(project_name):
+    return _SETTINGS_HANDLER.get_project_settings_revision(project_name)
+
+
 def get_local_settings():
     if not AYON_SERVER_ENABLED:
         return _get_local_settings()
@@ -539,6 +565,7 @@ def reset_default_settings():
     """Reset cache of default settings. Can't be used now."""
     global _DEFAULT_SETTINGS
     _DEFAULT_SETTINGS = None
+    clear_settings_cache()
 
 
 def _get_default_settings():
@@ -922,8 +949,115 @@ def apply_local_settings_on_project_settings(
         sync_server_config["remote_site"] = remote_site
 
 
+class _ResolvedSettings(object):
+    """Resolved settings with revisions of overrides used to resolve them."""
+
+    def __init__(self, revision, value):
+        self.revision = revision
+        self.value = value
+        self._view = None
+
+    @property
+    def view(self):
+        if self._view is None:
+            self._view = freeze_settings(self.value)
+        return self._view
+
+
+def freeze_settings(value):
+    """Create read-only view of settings.
+
+    Dictionaries are converted to 'MappingProxyType' and lists to tuples.
+    Views can't be modified and are not copied when returned from cache.
+
+    Args:
+        value (Any): Settings value.
+
+    Returns:
+        Any: Read-only view of value.
+    """
+
+    if isinstance(value, dict):
+        frozen = {
+            key: freeze_settings(item)
+            for key, item in value.items()
+        }
+        if MappingProxyType is None:
+            return frozen
+        return MappingProxyType(frozen)
+
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_settings(item) for item in value)
+    return value
+
+
+def clear_settings_cache():
+    """Clear cache of resolved settings.
+
+    Cache is validated with revisions of overrides on each call so clearing
+    is needed only when defaults change.
+    """
+
+    _RESOLVED_SETTINGS_CACHE.clear()
+
+
+def _get_settings_revision(project_names, exclude_locals):
+    """Revision of overrides which affect resolved settings.
+
+    Args:
+        project_names (Union[list[Union[str, None]], None]): Projects of
+            which overrides are used. 'None' in list is used for studio
+            project overrides. System overrides are used if 'None' is passed.
+        exclude_locals (bool): Local settings are not used.
+
+    Returns:
+        Union[tuple, None]: Revision or None if handlers don't support it.
+    """
+
+    if project_names is None:
+        revisions = [_get_system_settings_revision()]
+    else:
+        revisions = [
+            _get_project_settings_revision(project_name)
+            for project_name in project_names
+        ]
+    if not exclude_locals:
+        revisions.append(_get_local_settings_revision())
+
+    if None in revisions:
+        return None
+    return tuple(revisions)
+
+
+def _get_resolved_settings(key, revision, resolve_func):
+    if revision is None:
+        return _ResolvedSettings(None, resolve_func())
+
+    item = _RESOLVED_SETTINGS_CACHE.get(key)
+    if item is None or item.revision != revision:
+        item = _ResolvedSettings(revision, resolve_func())
+        _RESOLVED_SETTINGS_CACHE[key] = item
+    return item
+
+
+def _get_resolved_system_settings(clear_metadata, exclude_locals):
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    return _get_resolved_settings(
+        ("system", clear_metadata, exclude_locals),
+        _get_settings_revision(None, exclude_locals),
+        lambda: _resolve_system_settings(clear_metadata, exclude_locals)
+    )
+
+
 def _get_system_settings(clear_metadata=True, exclude_locals=None):
     """System settings with applied studio overrides."""
+    item = _get_resolved_system_settings(clear_metadata, exclude_locals)
+    return copy.deepcopy(item.value)
+
+
+def _resolve_system_settings(clear_metadata, exclude_locals):
     default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
     studio_values = get_studio_system_settings_overrides()
     result = apply_overrides(default_values, studio_values)
@@ -933,10 +1067,6 @@ def _get_system_settings(clear_metadata=True, exclude_locals=None):
         clear_metadata_from_settings(result)
 
     # Apply local settings
-    # Default behavior is based on `clear_metadata` value
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
     if not exclude_locals:
         # TODO local settings may be required to apply for environments
         local_settings = get_local_settings()
@@ -947,6 +1077,20 @@ def _get_system_settings(clear_metadata=True, exclude_locals=None):
 
 def get_default_project_settings(clear_metadata=True, exclude_locals=None):
     """Project settings with applied studio's default project overrides."""
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    item = _get_resolved_settings(
+        ("default_project", clear_metadata, exclude_locals),
+        _get_settings_revision([None], exclude_locals),
+        lambda: _resolve_default_project_settings(
+            clear_metadata, exclude_locals
+        )
+    )
+    return copy.deepcopy(item.value)
+
+
+def _resolve_default_project_settings(clear_metadata, exclude_locals):
     default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
     studio_values = get_studio_project_settings_overrides()
     result = apply_overrides(default_values, studio_values)
@@ -955,9 +1099,6 @@ def get_default_project_settings(clear_metadata=True, exclude_locals=None):
         clear_metadata_from_settings(result)
 
     # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
     if not exclude_locals:
         local_settings = get_local_settings()
         apply_local_settings_on_project_settings(
@@ -1024,16 +1165,38 @@ def get_anatomy_settings(
     return result
 
 
-def _get_project_settings(
-    project_name, clear_metadata=True, exclude_locals=None
+def _get_resolved_project_settings(
+    project_name, clear_metadata, exclude_locals
 ):
-    """Project settings with applied studio and project overrides."""
     if not project_name:
         raise ValueError(
             "Must enter project name."
             " Call `get_default_project_settings` to get project defaults."
         )
 
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    return _get_resolved_settings(
+        ("project", project_name, clear_metadata, exclude_locals),
+        _get_settings_revision([None, project_name], exclude_locals),
+        lambda: _resolve_project_settings(
+            project_name, clear_metadata, exclude_locals
+        )
+    )
+
+
+def _get_project_settings(
+    project_name, clear_metadata=True, exclude_locals=None
+):
+    """Project settings with applied studio and project overrides."""
+    item = _get_resolved_project_settings(
+        project_name, clear_metadata, exclude_locals
+    )
+    return copy.deepcopy(item.value)
+
+
+def _resolve_project_settings(project_name, clear_metadata, exclude_locals):
     studio_overrides = get_default_project_settings(False)
     project_overrides = get_project_settings_overrides(
         project_name
@@ -1046,9 +1209,6 @@ def _get_project_settings(
         clear_metadata_from_settings(result)
 
     # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
     if not exclude_locals:
         local_settings = get_local_settings()
         apply_local_settings_on_project_settings(
@@ -1129,16 +1289,63 @@ def get_general_environments():
 
 
 def get_system_settings(*args, **kwargs):
-    if not AYON_SERVER_ENABLED:
-        return _get_system_settings(*args, **kwargs)
+    from openpype.lib.startup_profiler import startup_phase
+
+    with startup_phase("settings.system"):
+        if not AYON_SERVER_ENABLED:
+            return _get_system_settings(*args, **kwargs)
 
-    default_settings = get_default_settings()[SYSTEM_SETTINGS_KEY]
-    return get_ayon_system_settings(default_settings)
+        default_settings = get_default_settings()[SYSTEM_SETTINGS_KEY]
+        return get_ayon_system_settings(default_settings)
 
 
 def get_project_settings(project_name, *args, **kwargs):
+    from openpype.lib.startup_profiler import startup_phase
+
+    with startup_phase("settings.project"):
+        if not AYON_SERVER_ENABLED:
+            return _get_project_settings(project_name, *args, **kwargs)
+
+        default_settings = get_default_settings()[PROJECT_SETTINGS_KEY]
+        return get_ayon_project_settings(default_settings, project_name)
+
+
+def get_system_settings_view(exclude_locals=False):
+    """Read-only view of system settings.
+
+    Same values as 'get_system_settings' returns but without copying them
+    on each call. Should be used where settings are only read many times,
+    use 'get_system_settings' if values must be modified.
+
+    Args:
+        exclude_locals (bool): Local settings are not applied.
+
+    Returns:
+        Mapping[str, Any]: Read-only system settings.
+    """
+
     if not AYON_SERVER_ENABLED:
-        return _get_project_settings(project_name, *args, **kwargs)
+        return _get_resolved_system_settings(True, exclude_locals).view
+    return freeze_settings(get_system_settings())
+
+
+def get_project_settings_view(project_name, exclude_locals=False):
+    """Read-only view of project settings.
+
+    Same values as 'get_project_settings' returns but without copying them
+    on each call. Should be used where settings are only read many times,
+    use 'get_project_settings' if values must be modified.
 
-    default_settings = get_default_settings()[PROJECT_SETTINGS_KEY]
-    return get_ayon_project_settings(default_settings, project_name)
+    Args:
+        project_name (str): Project name.
+        exclude_locals (bool): Local settings are not applied.
+
+    Returns:
+        Mapping[str, Any]: Read-only project settings.
+    """
+
+    if not AYON_SERVER_ENABLED:
+        return _get_resolved_project_settings(
+            project_name, True, exclude_locals
+        ).view
+    return freeze_settings(get_project_settings(project_name))
@@ -17,6 +17,7 @@ from openpype.client import (
     get_asset_by_id,
     get_subsets,
 )
+from openpype.client.entity_cache import entity_cache
 from openpype.lib.events import EventSystem
 from openpype.lib.attribute_definitions import (
     UIDef,
@@ -317,7 +318,13 @@ class PublishReportMaker:
             reports.append(self._publish_discover_result)
 
         crashed_file_paths = {}
+        discover_times = {}
         for report in reports:
+            discover_times[report.superclass.__name__] = {
+                "time": report.discover_time,
+                "imported_files": report.imported_files_count,
+                "cached_files": report.cached_files_count,
+            }
             items = report.crashed_file_paths.items()
             for filepath, exc_info in items:
                 crashed_file_paths[filepath] = "".join(
@@ -329,6 +336,7 @@ class PublishReportMaker:
             "instances": instances_details,
             "context": self._extract_context_data(self._current_context),
             "crashed_file_paths": crashed_file_paths,
+            "discover_times": discover_times,
             "id": uuid.uuid4().hex,
             "report_version": "1.0.0"
         }
@@ -2225,7 +2233,7 @@ class PublisherController(BasePublisherController):
         self._publish_up_validation = False
         self._publish_comment_is_set = False
 
-        self._main_thread_iter = self._publish_iterator()
+        self._main_thread_iter = self._publish_iterator_with_entity_cache()
         self._publish_context = pyblish.api.Context()
         # Make sure "comment" is set on publish context
         self._publish_context.data["comment"] = ""
@@ -2372,6 +2380,24 @@ class PublisherController(BasePublisherController):
             return True
         return False
 
+    def _publish_iterator_with_entity_cache(self):
+        """Publish iterator with entity cache of current project.
+
+        Publish plugins query the same documents repeatedly. Cache is active
+        until publishing finishes or is reset.
+        """
+
+        last_item = None
+        with entity_cache(self.project_name):
+            for item in self._publish_iterator():
+                if self.publish_has_finished:
+                    last_item = item
+                    break
+                yield item
+
+        if last_item is not None:
+            yield last_item
+
     def _publish_iterator(self):
         """Main logic center of publishing.
 
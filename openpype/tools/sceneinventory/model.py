@@ -14,6 +14,7 @@ from openpype.client import (
     get_last_version_by_subset_id,
     get_representation_by_id,
 )
+from openpype.client.entity_cache import entity_cache
 from openpype.pipeline import (
     get_current_project_name,
     schema,
@@ -199,6 +200,11 @@ class InventoryModel(TreeModel):
     def refresh(self, selected=None, items=None):
         """Refresh the model"""
 
+        # Containers of the same subsets and assets query the same documents
+        with entity_cache(get_current_project_name()):
+            self._refresh(selected, items)
+
+    def _refresh(self, selected, items):
         host = registered_host()
         # for debugging or testing, injecting items from outside
         if items is None:
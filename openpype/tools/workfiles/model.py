@@ -14,6 +14,7 @@ from openpype.style import (
     get_disabled_entity_icon_color,
 )
 from openpype.pipeline import get_representation_path
+from openpype.pipeline.load import get_representation_paths
 
 log = logging.getLogger(__name__)
 
@@ -354,10 +355,16 @@ class PublishFilesModel(QtGui.QStandardItemModel):
                 filtered_repre_docs.append(repre_doc)
 
         # Collect paths of representations
+        paths_by_repre_id = get_representation_paths(
+            self.project_name, filtered_repre_docs, anatomy=self._anatomy
+        )
         for repre_doc in filtered_repre_docs:
-            path = get_representation_path(
-                repre_doc, root=self._anatomy.roots
-            )
+            path = paths_by_repre_id[repre_doc["_id"]]
+            if path is None:
+                # Fallback for representations without template in data
+                path = get_representation_path(
+                    repre_doc, root=self._anatomy.roots
+                )
             output.append((path, repre_doc["_id"]))
         return output
 
@@ -352,6 +352,20 @@ class ExtractReviewProfileModel(BaseSettingsModel):
 class ExtractReviewModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = Field(True)
+    output_workers: int = Field(
+        1, ge=1, le=32, title="Outputs rendered at the same time"
+    )
+    ffmpeg_threads: int = Field(
+        0, ge=0, le=256, title="Threads per ffmpeg process (0 is auto)"
+    )
+    merge_compatible_outputs: bool = Field(
+        False,
+        title="Render compatible outputs in single ffmpeg process",
+        description=(
+            "Outputs with the same input, frame range and without audio"
+            " inputs decode the source only once."
+        )
+    )
     profiles: list[ExtractReviewProfileModel] = Field(
         default_factory=list,
         title="Profiles"
@@ -512,6 +526,53 @@ class IntegrateProductGroupProfile(BaseSettingsModel):
     template: str = Field("", title="Template")
 
 
+def integrate_checksum_algorithm_enum():
+    return [
+        {"value": "", "label": "Disabled"},
+        {"value": "sha1", "label": "SHA1"},
+        {"value": "md5", "label": "MD5"},
+        {"value": "xxhash", "label": "xxHash (requires xxhash module)"},
+    ]
+
+
+def integrate_copy_mode_enum():
+    return [
+        {"value": "copy", "label": "Copy"},
+        {"value": "reflink", "label": "Reflink (copy-on-write clone)"},
+        {
+            "value": "copy_file_range",
+            "label": "Copy file range (server-side copy)"
+        },
+    ]
+
+
+class IntegrateAssetModel(BaseSettingsModel):
+    """Files are transferred sequentially when 'Transfer workers per root'
+    is set to 1.
+
+    Reflink and copy_file_range fall back to a regular copy per file when
+    the destination filesystem does not support them.
+    """
+
+    _isGroup = True
+    transfer_workers_per_root: int = Field(
+        1, ge=1, le=64, title="Transfer workers per root"
+    )
+    transfer_checksum_algorithm: str = Field(
+        "",
+        title="Transfer checksum",
+        enum_resolver=integrate_checksum_algorithm_enum
+    )
+    transfer_copy_mode: str = Field(
+        "copy",
+        title="Transfer copy mode",
+        enum_resolver=integrate_copy_mode_enum
+    )
+    transfer_log_progress: bool = Field(
+        False, title="Log transfer progress"
+    )
+
+
 class IntegrateProductGroupModel(BaseSettingsModel):
     """Group published products by filtering logic.
 
@@ -674,6 +735,10 @@ class PublishPuginsModel(BaseSettingsModel):
         default_factory=PreIntegrateThumbnailsModel,
         title="Override Integrate Thumbnail Representations"
     )
+    IntegrateAsset: IntegrateAssetModel = Field(
+        default_factory=IntegrateAssetModel,
+        title="Integrate Asset"
+    )
     IntegrateProductGroup: IntegrateProductGroupModel = Field(
         default_factory=IntegrateProductGroupModel,
         title="Integrate Product Group"
@@ -754,6 +819,9 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractReview": {
         "enabled": True,
+        "output_workers": 1,
+        "ffmpeg_threads": 0,
+        "merge_compatible_outputs": False,
         "profiles": [
             {
                 "product_types": [],
@@ -916,6 +984,12 @@ DEFAULT_PUBLISH_VALUES = {
         "enabled": True,
         "integrate_profiles": []
     },
+    "IntegrateAsset": {
+        "transfer_workers_per_root": 1,
+        "transfer_checksum_algorithm": "",
+        "transfer_copy_mode": "copy",
+        "transfer_log_progress": False
+    },
     "IntegrateProductGroup": {
         "product_grouping_profiles": [
             {
@@ -96,6 +96,7 @@ Attributes:
 import os
 import re
 import sys
+import contextlib
 import platform
 import traceback
 import subprocess
@@ -137,6 +138,68 @@ sys.path.insert(0, vendor_python_path)
 # - common contains common code for bootstraping and OpenPype processes
 sys.path.insert(0, os.path.join(OPENPYPE_ROOT, "common"))
 
+
+def _start_startup_profiler():
+    """Start startup profiler when '--profile-startup' is passed.
+
+    Profiler must be started before any other import. Output path can be
+    passed as '--profile-startup=<path>' or with 'OPENPYPE_PROFILE_STARTUP'
+    environment variable. Environment variable is removed so subprocesses
+    are not profiled.
+    """
+    output_path = os.environ.pop("OPENPYPE_PROFILE_STARTUP", None)
+    enabled = bool(output_path)
+    if output_path == "1":
+        output_path = None
+
+    for arg in tuple(sys.argv):
+        if arg == "--profile-startup":
+            enabled = True
+            sys.argv.remove(arg)
+        elif arg.startswith("--profile-startup="):
+            enabled = True
+            output_path = arg.split("=", 1)[-1] or None
+            sys.argv.remove(arg)
+
+    if not enabled:
+        return None
+
+    import importlib.util
+
+    profiler_path = os.path.join(
+        OPENPYPE_ROOT, "openpype", "lib", "startup_profiler.py"
+    )
+    if not os.path.exists(profiler_path):
+        print(f"!!! Startup profiler not found at {profiler_path}")
+        return None
+
+    spec = importlib.util.spec_from_file_location(
+        "_openpype_startup_profiler", profiler_path
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.start_startup_profiler(output_path)
+
+
+startup_profiler = _start_startup_profiler()
+
+
+def _register_startup_profiler():
+    """Pass running startup profiler to bootstrapped OpenPype."""
+    if startup_profiler is None:
+        return
+    from openpype.lib.startup_profiler import set_startup_profiler
+
+    set_startup_profiler(startup_profiler)
+
+
+def _startup_phase(name):
+    """Measure startup phase if startup is profiled."""
+    if startup_profiler is None:
+        return contextlib.nullcontext()
+    return startup_profiler.phase(name)
+
+
 import blessed  # noqa: E402
 import certifi  # noqa: E402
 
@@ -1021,7 +1084,8 @@ def boot():
         if "_tests" not in avalon_db:
             os.environ["AVALON_DB"] = avalon_db + "_tests"
 
-    global_settings = get_openpype_global_settings(openpype_mongo)
+    with _startup_phase("settings.global"):
+        global_settings = get_openpype_global_settings(openpype_mongo)
 
     _print(">>> run disk mapping command ...")
     run_disk_mapping_commands(global_settings)
@@ -1071,7 +1135,10 @@ def boot():
     if getattr(sys, 'frozen', False):
         # find versions of OpenPype to be used with frozen code
         try:
-            version_path = _find_frozen_openpype(use_version, use_staging)
+            with _startup_phase("bootstrap"):
+                version_path = _find_frozen_openpype(
+                    use_version, use_staging
+                )
         except OpenPypeVersionNotFound as exc:
             _boot_handle_missing_version(local_version, str(exc))
             sys.exit(1)
@@ -1089,7 +1156,8 @@ def boot():
         _print("--- version is valid")
     else:
         try:
-            version_path = _bootstrap_from_code(use_version)
+            with _startup_phase("bootstrap"):
+                version_path = _bootstrap_from_code(use_version)
 
         except OpenPypeVersionNotFound as exc:
             _boot_handle_missing_version(local_version, str(exc))
@@ -1116,13 +1184,15 @@ def boot():
         pass
 
     _print(">>> loading environments ...")
-    # Avalon environments must be set before avalon module is imported
-    _print("  - for Avalon ...")
-    set_avalon_environments()
-    _print("  - global OpenPype ...")
-    set_openpype_global_environments()
-    _print("  - for modules ...")
-    set_modules_environments()
+    with _startup_phase("environments"):
+        _register_startup_profiler()
+        # Avalon environments must be set before avalon module is imported
+        _print("  - for Avalon ...")
+        set_avalon_environments()
+        _print("  - global OpenPype ...")
+        set_openpype_global_environments()
+        _print("  - for modules ...")
+        set_modules_environments()
 
     assert version_path, "Version path not defined."
 
@@ -1147,9 +1217,11 @@ def boot():
         for i in info:
             t.echo(i)
 
-    from openpype import cli
+    with _startup_phase("cli.import"):
+        from openpype import cli
     try:
-        cli.main(obj={}, prog_name="openpype")
+        with _startup_phase("cli.command"):
+            cli.main(obj={}, prog_name="openpype")
     except Exception:  # noqa
         exc_info = sys.exc_info()
         _print("!!! OpenPype crashed:", True)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of expected files resolution in farm publish functions.
+
+Synthetic render with 50 AOVs and 2000 frames is resolved with
+'create_instances_for_aov' (files of each AOV) and with
+'prepare_representations' (all files in one list). Both functions are
+measured with 'assemble_expected_files'. Anatomy, render products and
+colorspace plugin are replaced by minimal objects, database is not used.
+
+With '--legacy' the functions are measured also with 'clique.assemble' which
+was used before. It takes more than 10 minutes with default values
+(50 AOVs x 2000 frames), 'prepare_representations' is not measured
+with 'clique.assemble' for that reason.
+
+Run:
+    python tests/benchmarks/benchmark_farm_expected_files.py [aovs] [frames]
+        [--legacy]
+"""
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)
+)))
+sys.path.insert(0, REPO_ROOT)
+# Avoid connection to database when logger is created
+os.environ.setdefault("OPENPYPE_MONGO", "mongodb://localhost:27017")
+os.environ["AVALON_TASK"] = "lighting"
+os.environ["AVALON_APP"] = "maya"
+
+import clique  # noqa: E402
+
+from openpype.pipeline.farm import pyblish_functions  # noqa: E402
+
+PROJECT_ROOT = "/mnt/projects"
+
+
+class _Anatomy(object):
+    def find_root_template_from_path(self, path):
+        if path.startswith(PROJECT_ROOT):
+            return True, "{root[work]}" + path[len(PROJECT_ROOT):]
+        return False, path
+
+
+class _Product(object):
+    def __init__(self, name):
+        self.productName = name
+        self.colorspace = "ACEScg"
+
+
+class _LayerData(object):
+    def __init__(self, aovs):
+        self.products = [_Product(aov) for aov in aovs]
+
+
+class _RenderProducts(object):
+    def __init__(self, aovs):
+        self.layer_data = _LayerData(aovs)
+
+
+class _Context(object):
+    def __init__(self):
+        self.data = {"anatomy": _Anatomy()}
+
+
+class _Instance(object):
+    def __init__(self, expected_files, aovs):
+        self.context = _Context()
+        self.data = {
+            "expectedFiles": [expected_files],
+            "renderProducts": _RenderProducts(aovs),
+            "colorspaceConfig": PROJECT_ROOT + "/ocio/config.ocio",
+            "colorspaceDisplay": "sRGB",
+            "colorspaceView": "ACES",
+            "cameras": ["shotCam"],
+        }
+
+
+class _ColormanagedPlugin(object):
+    def set_representation_colorspace(self, *args, **kwargs):
+        pass
+
+
+def _get_skeleton(frame_start, frame_end):
+    return {
+        "subset": "renderMain",
+        "family": "render",
+        "families": ["render"],
+        "frameStartHandle": frame_start,
+        "frameEndHandle": frame_end,
+        "fps": 25,
+        "useSequenceForReview": True,
+        "colorspace": "ACEScg",
+    }
+
+
+def _measure(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(aovs_count=50, frames_count=2000, legacy=False):
+    frame_start = 1001
+    frame_end = frame_start + frames_count - 1
+    aovs = ["aov{:02d}".format(idx) for idx in range(aovs_count)]
+    expected_files = {
+        aov: [
+            "{}/sh010/render/v001/{}/sh010_shotCam_{}_v001.{:04d}.exr".format(
+                PROJECT_ROOT, aov, aov, frame
+            )
+            for frame in range(frame_start, frame_end + 1)
+        ]
+        for aov in aovs
+    }
+    all_files = [
+        filepath
+        for files in expected_files.values()
+        for filepath in files
+    ]
+    instance = _Instance(expected_files, aovs)
+    aov_filter = {"maya": [".*aov00.*"]}
+
+    def _create_instances():
+        pyblish_functions.create_instances_for_aov(
+            instance,
+            _get_skeleton(frame_start, frame_end),
+            aov_filter,
+            [],
+            False
+        )
+
+    def _prepare_representations():
+        pyblish_functions.prepare_representations(
+            _get_skeleton(frame_start, frame_end),
+            all_files,
+            _Anatomy(),
+            aov_filter,
+            [],
+            False,
+            None,
+            _ColormanagedPlugin()
+        )
+
+    print("AOVs: {}  Frames: {}  Expected files: {}".format(
+        aovs_count, frames_count, len(all_files)
+    ))
+    assemble_funcs = [
+        ("assemble_expected_files", pyblish_functions.assemble_expected_files)
+    ]
+    if legacy:
+        assemble_funcs.append(("clique.assemble", clique.assemble))
+
+    for label, assemble_func in assemble_funcs:
+        pyblish_functions.assemble_expected_files = assemble_func
+        try:
+            per_aov = _measure(_create_instances)
+            flat = None
+            if assemble_func is not clique.assemble:
+                flat = _measure(_prepare_representations)
+        finally:
+            pyblish_functions.assemble_expected_files = assemble_funcs[0][1]
+
+        print((
+            "{:<24} create_instances_for_aov {:>8.3f} s"
+            "  prepare_representations {}"
+        ).format(
+            label,
+            per_aov,
+            "skipped" if flat is None else "{:>8.3f} s".format(flat)
+        ))
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    main(
+        *[int(arg) for arg in args[:2]],
+        legacy="--legacy" in sys.argv
+    )
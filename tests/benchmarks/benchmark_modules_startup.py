@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Startup benchmark of modules manager with and without lazy loading.
+
+Short CLI commands of 'openpype_console' create 'ModulesManager' and use one
+or two modules. Each measurement runs in a new python process which loads
+modules, creates the manager and accesses a single module, as a CLI command
+would. Lazy loading is enabled with 'OPENPYPE_LAZY_MODULES' environment
+variable. Studio addon paths and settings from database are not used.
+
+Run:
+    python tests/benchmarks/benchmark_modules_startup.py [runs] [module]
+"""
+import os
+import sys
+import json
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)
+)))
+
+CHILD_SCRIPT = """
+import sys
+import json
+import time
+
+start = time.perf_counter()
+from openpype.settings import lib
+from openpype.modules import base
+
+base.get_dynamic_modules_dirs = lambda: []
+system_settings = lib.load_openpype_default_settings()["system_settings"]
+settings_loaded = time.perf_counter()
+
+manager = base.ModulesManager(_system_settings=system_settings)
+manager_created = time.perf_counter()
+module = manager.get_enabled_module(sys.argv[1])
+module_used = time.perf_counter()
+
+print(json.dumps({
+    "manager": manager_created - settings_loaded,
+    "module": module_used - manager_created,
+    "total": module_used - start,
+    "found": module is not None,
+    "imported": len([
+        name
+        for name in sys.modules
+        if name.startswith(("openpype.modules.", "openpype.hosts."))
+    ]),
+}))
+"""
+
+
+def _run(lazy, module_name):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (REPO_ROOT, env.get("PYTHONPATH")) if path
+    )
+    env.pop("OPENPYPE_LAZY_MODULES", None)
+    if lazy:
+        env["OPENPYPE_LAZY_MODULES"] = "1"
+    # Avoid connection to database when logger is created
+    env.setdefault("OPENPYPE_MONGO", "mongodb://localhost:27017")
+    output = subprocess.check_output(
+        [sys.executable, "-c", CHILD_SCRIPT, module_name],
+        env=env,
+        stderr=subprocess.DEVNULL
+    )
+    return json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+
+def _median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main(runs=5, module_name="deadline"):
+    print("Runs: {}  Accessed module: {}".format(runs, module_name))
+    for label, lazy in (("Eager", False), ("Lazy", True)):
+        results = [_run(lazy, module_name) for _ in range(runs)]
+        print((
+            "{:<6} total {:>8.1f} ms  manager {:>7.1f} ms"
+            "  module access {:>7.1f} ms  imported packages {:>4}"
+        ).format(
+            label,
+            _median([item["total"] for item in results]) * 1000,
+            _median([item["manager"] for item in results]) * 1000,
+            _median([item["module"] for item in results]) * 1000,
+            results[-1]["imported"],
+        ))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:3]
+    main(*([int(args[0])] + args[1:] if args else []))
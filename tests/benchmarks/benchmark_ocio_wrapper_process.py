@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of ocio wrapper queries used by hosts without PyOpenColorIO.
+
+Per-query latency is measured for:
+- new process for each query which writes result to temp json file
+- persistent process answering queries over stdin/stdout
+- persistent process behind cache of results
+
+Ocio wrapper script is launched with current python executable, OpenPype
+bootstrap which precedes each query of new process in production is not
+included. Requires PyOpenColorIO, click and pathlib2. Config created from
+built-in OCIO config is used if config path is not passed.
+
+Run:
+    python tests/benchmarks/benchmark_ocio_wrapper_process.py [config_path]
+        [queries]
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)
+)))
+sys.path.insert(0, REPO_ROOT)
+# Avoid connection to database when logger is created
+os.environ.setdefault("OPENPYPE_MONGO", "mongodb://localhost:27017")
+
+from openpype.pipeline import colorspace  # noqa: E402
+
+QUERIES = [
+    ("config", "get_views", {}),
+    ("config", "get_colorspace", {}),
+    ("config", "get_version", {}),
+    (
+        "colorspace",
+        "get_config_file_rules_colorspace_from_filepath",
+        {"filepath": "/renders/sh010_beauty.1001.exr"}
+    ),
+]
+
+
+def _create_config(tmpdir):
+    import PyOpenColorIO as ocio
+
+    config = ocio.Config.CreateFromBuiltinConfig(
+        "cg-config-v1.0.0_aces-v1.3_ocio-v2.1"
+    )
+    config_path = os.path.join(tmpdir, "config.ocio")
+    with open(config_path, "w") as stream:
+        stream.write(config.serialize())
+    return config_path
+
+
+def _get_queries(config_path, count):
+    output = []
+    for idx in range(count):
+        command_group, command, kwargs = QUERIES[idx % len(QUERIES)]
+        kwargs = dict(kwargs)
+        if command_group == "colorspace" or command == "get_version":
+            kwargs["config_path"] = config_path
+        else:
+            kwargs["in_path"] = config_path
+        output.append((command_group, command, kwargs))
+    return output
+
+
+def _run_new_process(script_path, command_group, command, kwargs):
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
+        out_path = tmp.name
+    try:
+        args = [sys.executable, script_path, command_group, command]
+        for key, value in kwargs.items():
+            args.extend(("--{}".format(key), value))
+        args.extend(("--out_path", out_path))
+        subprocess.check_call(args, stdout=subprocess.DEVNULL)
+        with open(out_path, "r") as stream:
+            return json.load(stream)
+    finally:
+        os.remove(out_path)
+
+
+def _measure(label, queries, func):
+    start = time.perf_counter()
+    for command_group, command, kwargs in queries:
+        func(command_group, command, kwargs)
+    elapsed = time.perf_counter() - start
+    print("{:<28} total {:>8.3f} s  per query {:>9.3f} ms".format(
+        label, elapsed, elapsed / len(queries) * 1000
+    ))
+
+
+def main(config_path=None, queries_count=40):
+    script_path = colorspace.get_ocio_config_script_path()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if not config_path:
+            config_path = _create_config(tmpdir)
+        queries = _get_queries(config_path, queries_count)
+        print("Config: {}  Queries: {}".format(config_path, queries_count))
+
+        _measure(
+            "new process per query",
+            queries,
+            lambda *args: _run_new_process(script_path, *args)
+        )
+
+        process = colorspace.OCIOWrapperProcess(
+            args=[sys.executable, script_path, "serve"],
+            env=dict(os.environ)
+        )
+        try:
+            # Start process before measurement, it happens only once
+            process.start()
+            _measure(
+                "persistent process",
+                queries,
+                lambda group, command, kwargs: process.request(
+                    group, command, **kwargs
+                )
+            )
+
+            colorspace.CachedData.ocio_wrapper_process = process
+            colorspace.CachedData.ocio_wrapper_results = {}
+            _measure(
+                "persistent process + cache",
+                queries,
+                lambda group, command, kwargs: (
+                    colorspace._get_wrapped_with_subprocess(
+                        group, command, **kwargs
+                    )
+                )
+            )
+        finally:
+            process.stop()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(
+        args[0] if args else None,
+        int(args[1]) if len(args) > 1 else 40
+    )
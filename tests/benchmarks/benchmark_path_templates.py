@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Micro-benchmark of publish path template formatting.
+
+Compares per-path cost of formatting a publish path for each frame of
+a sequence the old way (template parsed for each object, data deep
+copied for each frame) with cached parsed templates and 'format_many'.
+
+Run:
+    python tests/benchmarks/benchmark_path_templates.py [frames]
+"""
+import os
+import sys
+import copy
+import time
+
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)
+    )))
+)
+
+from openpype.lib.path_templates import (  # noqa: E402
+    StringTemplate,
+    TemplatesDict,
+    clear_templates_cache,
+    get_templates_cache_info,
+)
+
+TEMPLATES = {
+    "publish": {
+        "folder": (
+            "{root[work]}/{project[name]}/{hierarchy}/{asset}"
+            "/publish/{family}/{subset}/v{version:0>3}"
+        ),
+        "file": (
+            "{project[code]}_{asset}_{subset}_v{version:0>3}"
+            "<_{output}><.{frame:0>4}><_{udim}>.{ext}"
+        ),
+        "path": (
+            "{root[work]}/{project[name]}/{hierarchy}/{asset}"
+            "/publish/{family}/{subset}/v{version:0>3}"
+            "/{project[code]}_{asset}_{subset}_v{version:0>3}"
+            "<_{output}><.{frame:0>4}><_{udim}>.{ext}"
+        ),
+    },
+    "work": {
+        "folder": "{root[work]}/{project[name]}/{hierarchy}/{asset}/work",
+        "file": "{project[code]}_{asset}_{task[name]}_v{version:0>3}.{ext}",
+        "path": (
+            "{root[work]}/{project[name]}/{hierarchy}/{asset}/work"
+            "/{project[code]}_{asset}_{task[name]}_v{version:0>3}.{ext}"
+        ),
+    },
+}
+
+TEMPLATE_DATA = {
+    "root": {"work": "/mnt/projects"},
+    "project": {"name": "benchmark", "code": "bm"},
+    "hierarchy": "shots/sq010",
+    "asset": "sh0010",
+    "family": "render",
+    "subset": "renderMain",
+    "version": 12,
+    "ext": "exr",
+    "task": {"name": "comp", "type": "Compositing"},
+    "representation": "exr",
+}
+
+
+def _before(frames):
+    output = []
+    for frame in frames:
+        # Each template object parsed its template again
+        clear_templates_cache()
+        templates = TemplatesDict(copy.deepcopy(TEMPLATES))
+        data = copy.deepcopy(TEMPLATE_DATA)
+        data["frame"] = frame
+        output.append(templates.format(data)["publish"]["path"])
+    return output
+
+
+def _after(frames):
+    templates = TemplatesDict(copy.deepcopy(TEMPLATES))
+    frames_data = []
+    for frame in frames:
+        data = dict(TEMPLATE_DATA)
+        data["frame"] = frame
+        frames_data.append(data)
+    return templates.format_many(("publish", "path"), frames_data)
+
+
+def _measure(func, frames):
+    start = time.perf_counter()
+    result = func(frames)
+    return time.perf_counter() - start, result
+
+
+def main(frame_count=2000):
+    frames = list(range(1001, 1001 + frame_count))
+    before_time, before_result = _measure(_before, frames)
+    clear_templates_cache()
+    after_time, after_result = _measure(_after, frames)
+
+    assert [str(item) for item in before_result] == [
+        str(item) for item in after_result
+    ]
+
+    print("Frames: {}".format(frame_count))
+    print("Before: {:.2f} us per path".format(
+        before_time / frame_count * 1000000))
+    print("After:  {:.2f} us per path".format(
+        after_time / frame_count * 1000000))
+    print("Speedup: {:.1f}x".format(before_time / after_time))
+
+    # Creating the same template again hits the cache
+    StringTemplate(TEMPLATES["publish"]["path"])
+    print("Templates cache: {}".format(get_templates_cache_info()))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Micro-benchmark of project settings resolution during publish.
+
+Publish plugins, launch hooks and addons query project settings many times
+per process. Compares resolving settings on each call (defaults copied and
+overrides merged again) with cached resolved settings returned as a copy
+or as a read-only view. Mongo is replaced by in-memory overrides.
+
+Run:
+    python tests/benchmarks/benchmark_settings.py [calls per publish]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)
+    )))
+)
+
+from openpype.settings import lib  # noqa: E402
+
+PROJECT_NAME = "benchmark"
+
+
+class InMemorySettingsHandler(object):
+    def get_studio_project_settings_overrides(self, return_version):
+        return {"global": {"publish": {"ValidateVersion": {"enabled": False}}}}
+
+    def get_project_settings_overrides(self, project_name, return_version):
+        return {"maya": {"publish": {"ValidateMeshUVs": {"enabled": False}}}}
+
+    def get_project_settings_revision(self, project_name):
+        return 1
+
+
+def _before(calls):
+    return [
+        lib._resolve_project_settings(PROJECT_NAME, True, True)
+        for _ in range(calls)
+    ]
+
+
+def _after_copy(calls):
+    return [
+        lib.get_project_settings(PROJECT_NAME, exclude_locals=True)
+        for _ in range(calls)
+    ]
+
+
+def _after_view(calls):
+    return [
+        lib.get_project_settings_view(PROJECT_NAME, exclude_locals=True)
+        for _ in range(calls)
+    ]
+
+
+def _measure(func, calls):
+    lib.clear_settings_cache()
+    start = time.perf_counter()
+    result = func(calls)
+    duration = time.perf_counter() - start
+    publish_settings = result[-1]["global"]["publish"]
+    assert publish_settings["ValidateVersion"]["enabled"] is False
+
+    # Results are kept alive as plugins keep them during publish
+    lib.clear_settings_cache()
+    tracemalloc.start()
+    result = func(calls)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak
+
+
+def main(calls=50):
+    lib._SETTINGS_HANDLER = InMemorySettingsHandler()
+    lib._DEFAULT_SETTINGS = lib.load_openpype_default_settings()
+
+    print("Calls per publish: {}".format(calls))
+    for label, func in (
+        ("Resolve each call", _before),
+        ("Cached copy", _after_copy),
+        ("Cached view", _after_view),
+    ):
+        duration, peak = _measure(func, calls)
+        print("{:<18} {:>9.2f} ms  peak memory {:>8.2f} MB".format(
+            label, duration * 1000, peak / (1024.0 * 1024.0)
+        ))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Test suite for opt-in entity cache."""
+import mongomock
+import pyblish.api
+
+from openpype.client.entity_cache import (
+    cached_entity_query,
+    entity_cache,
+    invalidate_entity_cache,
+    get_entity_cache_info,
+)
+
+CALLS = []
+
+
+@cached_entity_query
+def get_fake_asset(project_name, asset_name, fields=None):
+    CALLS.append(asset_name)
+    return {"name": asset_name, "data": {"fps": 25}}
+
+
+@cached_entity_query
+def get_fake_assets(project_name, asset_names=None):
+    CALLS.append(tuple(asset_names))
+    return ({"name": name} for name in asset_names)
+
+
+def test_entity_cache_scope():
+    CALLS[:] = []
+    get_fake_asset("project", "sh010")
+    get_fake_asset("project", "sh010")
+    # Cache is not active outside of scope
+    assert len(CALLS) == 2
+    assert get_entity_cache_info("project") is None
+
+    with entity_cache("project"):
+        asset_doc = get_fake_asset("project", "sh010", fields=["name"])
+        asset_doc["data"]["fps"] = 50
+        cached_doc = get_fake_asset("project", "sh010", fields=["name"])
+        # Returned documents are copies
+        assert cached_doc["data"]["fps"] == 25
+        # Different project is not cached
+        get_fake_asset("other", "sh010", fields=["name"])
+
+        assert list(get_fake_assets("project", ["a", "b"])) == [
+            {"name": "a"}, {"name": "b"}
+        ]
+        assert list(get_fake_assets("project", ["a", "b"])) == [
+            {"name": "a"}, {"name": "b"}
+        ]
+
+        info = get_entity_cache_info("project")
+        assert info["hits"] == 2
+        assert info["misses"] == 2
+
+        invalidate_entity_cache("project")
+        get_fake_asset("project", "sh010", fields=["name"])
+        assert get_entity_cache_info("project")["invalidations"] == 1
+
+    assert len(CALLS) == 2 + 4
+    assert get_entity_cache_info("project") is None
+
+
+def test_entity_cache_ttl():
+    CALLS[:] = []
+    with entity_cache("project", ttl=0):
+        get_fake_asset("project", "sh020")
+        get_fake_asset("project", "sh020")
+    assert len(CALLS) == 2
+
+
+def test_remote_publish_uses_entity_cache(monkeypatch):
+    from openpype.client import get_asset_by_name
+    from openpype.client.mongo import entities as mongo_entities
+    from openpype.pipeline.publish.lib import remote_publish
+
+    collection = mongomock.MongoClient().avalon.test_project
+    collection.insert_one({"type": "asset", "name": "sh010", "data": {}})
+    find_one = collection.find_one
+    queries = []
+
+    def _find_one(*args, **kwargs):
+        queries.append(args)
+        return find_one(*args, **kwargs)
+
+    monkeypatch.setattr(collection, "find_one", _find_one)
+    monkeypatch.setattr(
+        mongo_entities, "get_project_connection", lambda _: collection
+    )
+    monkeypatch.setenv("AVALON_PROJECT", "test_project")
+
+    asset_docs = []
+
+    class CollectAssetDoc(pyblish.api.ContextPlugin):
+        order = pyblish.api.CollectorOrder
+
+        def process(self, context):
+            asset_docs.append(get_asset_by_name("test_project", "sh010"))
+
+    class ValidateAssetDoc(CollectAssetDoc):
+        order = pyblish.api.ValidatorOrder
+
+    monkeypatch.setattr(
+        pyblish.api, "discover", lambda: [CollectAssetDoc, ValidateAssetDoc]
+    )
+    remote_publish(None)
+
+    assert [asset_doc["name"] for asset_doc in asset_docs] == [
+        "sh010", "sh010"
+    ]
+    # Second plugin received the document from cache
+    assert len(queries) == 1
+    assert get_entity_cache_info("test_project") is None
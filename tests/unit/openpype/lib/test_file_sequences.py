@@ -0,0 +1,95 @@
+"""Test file sequence index is same as 'clique.assemble'."""
+import clique
+import pytest
+
+from openpype.lib import collect_frames
+from openpype.lib.file_sequences import (
+    FileSequenceIndex,
+    DOT_FRAME_PATTERN,
+)
+
+
+def _clique_data(files, minimum_items=2, patterns=None):
+    collections, remainders = clique.assemble(
+        files, minimum_items=minimum_items, patterns=patterns
+    )
+    return (
+        sorted(
+            (item.head, item.tail, item.padding, list(item.indexes))
+            for item in collections
+        ),
+        sorted(remainders)
+    )
+
+
+def _index_data(files, minimum_items=2, pattern=None):
+    index = FileSequenceIndex.from_paths(files, pattern)
+    sequences = index.get_sequences(minimum_items)
+    remainders = list(index.remainders)
+    for sequence in index.sequences:
+        if sequence not in sequences:
+            remainders.extend(sequence)
+    return (
+        sorted(
+            (item.head, item.tail, item.padding, item.frames)
+            for item in sequences
+        ),
+        sorted(remainders)
+    )
+
+
+@pytest.mark.parametrize("files", [
+    ["beauty.{:04d}.exr".format(frame) for frame in range(1001, 1011)]
+    + ["beauty.1015.exr", "specular.1001.exr", "review.mov"],
+    # Mixed padding
+    ["beauty.{}.exr".format(frame) for frame in (98, 99, 100)]
+    + ["beauty.0998.exr", "beauty.0999.exr"],
+    # Digits in name
+    ["sh010_light01_v001.{:04d}.exr".format(frame) for frame in (1, 2, 3)],
+])
+def test_index_matches_clique(files):
+    patterns = [clique.PATTERNS["frames"]]
+    assert (
+        _index_data(files, pattern=DOT_FRAME_PATTERN)
+        == _clique_data(files, patterns=patterns)
+    )
+
+
+def test_collect_frames():
+    files = [
+        "/out/beauty.{}.exr".format(frame) for frame in (98, 99, 100, 1000)
+    ] + ["/out/beauty.0998.exr", "/out/beauty.0999.exr"]
+    collections, _ = clique.assemble(
+        files, minimum_items=1, patterns=[clique.PATTERNS["frames"]]
+    )
+    expected = {}
+    for collection in collections:
+        for frame in collection.indexes:
+            frame = collection.format("{padding}") % frame
+            expected[collection.head + frame + collection.tail] = frame
+
+    assert collect_frames(files) == expected
+    assert collect_frames(["/out/review.mov"]) == {"/out/review.mov": None}
+
+
+def test_directory_index(tmp_path):
+    for frame in (1001, 1002, 1003, 1007, 1008):
+        tmp_path.joinpath("beauty.{:04d}.exr".format(frame)).touch()
+    tmp_path.joinpath("beauty.mov").touch()
+    tmp_path.joinpath("subdir.1001.exr").mkdir()
+
+    index = FileSequenceIndex.from_directory(str(tmp_path))
+    assert index.remainders == ["beauty.mov"]
+    assert len(index.sequences) == 1
+
+    sequence = index.get_sequence("beauty.1007.exr")
+    assert sequence is index.sequences[0]
+    assert index.get_sequence("beauty.1004.exr") is None
+    assert index.get_frame("beauty.1008.exr") == 1008
+    assert sequence.get_ranges() == [(1001, 1003), (1007, 1008)]
+    assert sequence.get_path(1002) == "beauty.1002.exr"
+    assert sequence.get_path(1005) is None
+    assert sequence.get_missing_frames() == [1004, 1005, 1006]
+    assert sequence.get_missing_frames(999, 1010) == [
+        999, 1000, 1004, 1005, 1006, 1009, 1010
+    ]
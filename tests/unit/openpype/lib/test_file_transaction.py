@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""Test suite for FileTransaction."""
+import os
+import hashlib
+
+import pytest
+
+from openpype.lib import file_transaction
+from openpype.lib.file_transaction import FileTransaction
+
+
+def _create_sources(tmp_path, count):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    sources = []
+    for idx in range(count):
+        path = src_dir / "file.{:04d}.exr".format(idx)
+        path.write_bytes("content {}".format(idx).encode("utf-8"))
+        sources.append(path)
+    return sources
+
+
+def test_parallel_transfer_with_checksums(tmp_path):
+    sources = _create_sources(tmp_path, 20)
+    dst_dir = tmp_path / "dst"
+    progress_items = []
+
+    transaction = FileTransaction(
+        workers_per_root=4,
+        progress_callback=progress_items.append,
+        checksum_algorithm="sha1"
+    )
+    for src in sources:
+        transaction.add(str(src), str(dst_dir / src.name))
+    transaction.process()
+    transaction.finalize()
+
+    assert len(transaction.transferred) == len(sources)
+    assert len(progress_items) == len(sources)
+    last_progress = max(
+        progress_items, key=lambda item: item["transferred_files"])
+    assert last_progress["transferred_files"] == len(sources)
+    assert last_progress["transferred_bytes"] == last_progress["total_bytes"]
+
+    checksums = transaction.checksums
+    for src in sources:
+        dst = dst_dir / src.name
+        assert dst.read_bytes() == src.read_bytes()
+        expected = hashlib.sha1(src.read_bytes()).hexdigest()
+        assert checksums[str(dst)] == expected
+
+
+def test_parallel_transfer_rollback_restores_backups(tmp_path):
+    sources = _create_sources(tmp_path, 5)
+    dst_dir = tmp_path / "dst"
+    dst_dir.mkdir()
+    existing = dst_dir / sources[0].name
+    existing.write_bytes(b"original")
+
+    transaction = FileTransaction(workers_per_root=2)
+    for src in sources:
+        transaction.add(str(src), str(dst_dir / src.name))
+    # Missing source makes the transaction fail
+    transaction.add(str(tmp_path / "missing.exr"), str(dst_dir / "miss.exr"))
+
+    with pytest.raises(IOError):
+        transaction.process()
+    transaction.rollback()
+
+    assert existing.read_bytes() == b"original"
+    remaining = sorted(path.name for path in dst_dir.iterdir())
+    assert remaining == [existing.name]
+
+
+def test_unknown_checksum_algorithm():
+    with pytest.raises(ValueError):
+        FileTransaction(checksum_algorithm="unknown")
+
+
+@pytest.mark.parametrize("mode", [
+    FileTransaction.MODE_REFLINK,
+    FileTransaction.MODE_COPY_FILE_RANGE,
+])
+def test_clone_modes_transfer_files(tmp_path, mode):
+    sources = _create_sources(tmp_path, 3)
+    dst_dir = tmp_path / "dst"
+
+    transaction = FileTransaction(checksum_algorithm="md5")
+    for src in sources:
+        transaction.add(str(src), str(dst_dir / src.name), mode=mode)
+    transaction.process()
+
+    # Used mode depends on filesystem, unsupported modes fall back
+    #   to cheaper method per file
+    used_modes = {item[2] for item in transaction.transfer_log}
+    assert used_modes <= {"reflink", "copy_file_range", "copy"}
+    assert len(transaction.transfer_log) == len(sources)
+    for src in sources:
+        dst = dst_dir / src.name
+        assert dst.read_bytes() == src.read_bytes()
+        expected = hashlib.md5(src.read_bytes()).hexdigest()
+        assert transaction.checksums[str(dst)] == expected
+
+
+def _partial_copy_file_range(src_fd, dst_fd, count):
+    # Copy only first bytes and stop early without an error
+    if os.lseek(dst_fd, 0, os.SEEK_CUR) > 0:
+        return 0
+    data = os.read(src_fd, 3)
+    return os.write(dst_fd, data)
+
+
+def test_incomplete_copy_file_range_falls_back_to_copy(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        os, "copy_file_range", _partial_copy_file_range, raising=False
+    )
+    sources = _create_sources(tmp_path, 2)
+    dst_dir = tmp_path / "dst"
+
+    transaction = FileTransaction()
+    for src in sources:
+        transaction.add(
+            str(src),
+            str(dst_dir / src.name),
+            mode=FileTransaction.MODE_COPY_FILE_RANGE
+        )
+    transaction.process()
+
+    assert {item[2] for item in transaction.transfer_log} == {"copy"}
+    for src in sources:
+        assert (dst_dir / src.name).read_bytes() == src.read_bytes()
+
+
+def test_failed_fallback_does_not_leave_file(tmp_path, monkeypatch):
+    def copyfile(src, dst):
+        with open(dst, "wb") as stream:
+            stream.write(b"partial")
+        raise IOError("Disk is full")
+
+    monkeypatch.setattr(
+        os, "copy_file_range", _partial_copy_file_range, raising=False
+    )
+    monkeypatch.setattr(file_transaction, "copyfile", copyfile)
+    sources = _create_sources(tmp_path, 1)
+    dst_dir = tmp_path / "dst"
+
+    transaction = FileTransaction()
+    transaction.add(
+        str(sources[0]),
+        str(dst_dir / sources[0].name),
+        mode=FileTransaction.MODE_COPY_FILE_RANGE
+    )
+    with pytest.raises(IOError):
+        transaction.process()
+    transaction.rollback()
+
+    assert list(dst_dir.iterdir()) == []
@@ -0,0 +1,73 @@
+"""Test queued mongo log handler."""
+import logging
+
+import mongomock
+import pytest
+
+from openpype.lib.log import QueuedMongoHandler, MongoFormatter
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    import log4mongo.handlers
+
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(log4mongo.handlers, "_connection", client)
+    return client["logs_db"]["logs"]
+
+
+def _create_logger(handler):
+    logger = logging.getLogger("test_queued_mongo_handler")
+    logger.handlers = [handler]
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    return logger
+
+
+def test_records_are_inserted_in_batches(collection):
+    handler = QueuedMongoHandler(
+        batch_size=10,
+        flush_interval=60,
+        database_name="logs_db",
+        collection="logs",
+        formatter=MongoFormatter()
+    )
+    logger = _create_logger(handler)
+    for idx in range(25):
+        logger.debug("Record %s", idx)
+    handler.flush()
+
+    documents = list(collection.find({}, sort=[("_id", 1)]))
+    assert [doc["message"] for doc in documents] == [
+        "Record {}".format(idx) for idx in range(25)
+    ]
+    # Document shape of 'MongoFormatter' is kept
+    assert documents[0]["level"] == "DEBUG"
+    assert documents[0]["loggerName"] == "test_queued_mongo_handler"
+    assert "process_id" in documents[0]
+    handler.close()
+
+
+def test_full_queue_drops_records(collection):
+    handler = QueuedMongoHandler(
+        queue_size=5,
+        flush_interval=60,
+        full_queue_timeout=0,
+        database_name="logs_db",
+        collection="logs",
+        formatter=MongoFormatter()
+    )
+    # Stop background thread so queue is not consumed
+    handler._stopped.set()
+    handler._thread.join()
+
+    logger = _create_logger(handler)
+    for idx in range(8):
+        logger.info("Record %s", idx)
+    logger.error("Error record")
+
+    assert handler.dropped_count == 4
+    handler.close()
+    messages = [doc["message"] for doc in collection.find()]
+    assert len(messages) == 6
+    assert "Log queue was full, 4 records were dropped." in messages
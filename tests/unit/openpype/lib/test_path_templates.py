@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Test suite for template formatting."""
+import pytest
+
+from openpype.lib.path_templates import (
+    StringTemplate,
+    TemplatesDict,
+    TemplateUnsolved,
+    clear_templates_cache,
+    get_templates_cache_info,
+)
+
+
+def test_parsed_template_is_cached():
+    clear_templates_cache()
+    template = "{root}/{asset}<_{output}>/{asset}.{frame:0>4}.exr"
+    first = StringTemplate(template)
+    second = StringTemplate(template)
+
+    info = get_templates_cache_info()
+    assert info["misses"] == 1
+    assert info["hits"] == 1
+
+    data = {"root": "/mnt", "asset": "sh010", "frame": 7}
+    assert first.format(data) == second.format(data)
+    assert first.format(data) == "/mnt/sh010/sh010.0007.exr"
+
+
+def test_templates_format_many():
+    templates = TemplatesDict({
+        "publish": {
+            "path": "{root}/{asset}/{asset}.{frame:0>4}.{ext}",
+        },
+        "work": {
+            "path": "{root}/{asset}/work/{task}",
+        },
+    })
+    base_data = {"root": "/mnt", "asset": "sh010", "ext": "exr"}
+    frames_data = []
+    for frame in range(1, 4):
+        data = dict(base_data)
+        data["frame"] = frame
+        frames_data.append(data)
+
+    results = templates.format_many(("publish", "path"), frames_data)
+    expected = [
+        templates.format(data)["publish"]["path"]
+        for data in frames_data
+    ]
+    assert results == expected
+    assert results[0].used_values["frame"] == "0001"
+
+    with pytest.raises(TemplateUnsolved):
+        templates.format_many(("work", "path"), frames_data)
@@ -0,0 +1,62 @@
+"""Test cache of modules imported from python files."""
+from openpype.lib.python_module_tools import (
+    ImportedFilesCache,
+    clear_imported_files_cache,
+    get_imported_files_cache_info,
+    modules_from_path,
+)
+
+PLUGIN_CONTENT = """
+class MyPlugin(object):
+    enabled = True
+    families = ["{family}"]
+"""
+
+
+def _write_plugin(dirpath, family):
+    filepath = dirpath / "my_plugin.py"
+    filepath.write_text(PLUGIN_CONTENT.format(family=family))
+    return str(filepath)
+
+
+def test_imported_files_cache(tmp_path):
+    cache = ImportedFilesCache()
+    filepath = _write_plugin(tmp_path, "review")
+
+    module, from_cache = cache.import_filepath(filepath, "my_plugin")
+    assert not from_cache
+
+    # Unchanged file is not executed again and classes are reused
+    cached_module, from_cache = cache.import_filepath(filepath, "my_plugin")
+    assert from_cache
+    assert cached_module is module
+    assert cached_module.MyPlugin is module.MyPlugin
+
+    forced_module, from_cache = cache.import_filepath(
+        filepath, "my_plugin", force=True
+    )
+    assert not from_cache
+    assert forced_module is not module
+
+    # Changed file is executed again
+    _write_plugin(tmp_path, "reviews")
+    new_module, from_cache = cache.import_filepath(filepath, "my_plugin")
+    assert not from_cache
+    assert new_module is not forced_module
+    assert new_module.MyPlugin.families == ["reviews"]
+    assert cache.info() == {"hits": 1, "imports": 3, "size": 1}
+
+
+def test_modules_from_path_cache(tmp_path):
+    _write_plugin(tmp_path, "review")
+
+    clear_imported_files_cache()
+    modules, crashed = modules_from_path(str(tmp_path), use_cache=True)
+    assert not crashed
+    cached_modules, _ = modules_from_path(str(tmp_path), use_cache=True)
+    assert cached_modules[0][1] is modules[0][1]
+    assert get_imported_files_cache_info()["hits"] == 1
+
+    new_modules, _ = modules_from_path(str(tmp_path))
+    assert new_modules[0][1] is not modules[0][1]
+    clear_imported_files_cache()
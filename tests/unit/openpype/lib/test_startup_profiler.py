@@ -0,0 +1,149 @@
+"""Test startup profiler and import-time budget of farm-side commands.
+
+Farm tests import everything 'publish' and 'extractenvironments' commands
+of 'pype_commands' import in a new process with '-X importtime'. Wall-clock
+budget test depends on the machine, it runs only when budget is set with
+'OPENPYPE_STARTUP_IMPORT_BUDGET_MS' environment variable.
+"""
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+from openpype.lib.startup_profiler import (
+    StartupProfiler,
+    get_startup_profiler,
+    set_startup_profiler,
+    startup_phase,
+    parse_importtime_output,
+    aggregate_import_records,
+)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)))
+
+# Import budget of farm-side commands in milliseconds
+FARM_IMPORT_BUDGET_MS = os.environ.get("OPENPYPE_STARTUP_IMPORT_BUDGET_MS")
+# Packages which must not be imported by farm-side commands
+FARM_FORBIDDEN_PACKAGES = {"qtpy", "PySide2", "PySide6", "PyQt5", "PyQt6"}
+FARM_IMPORTS = (
+    "import openpype.pype_commands\n"
+    "import openpype.lib\n"
+    "import openpype.lib.applications\n"
+    "import openpype.modules\n"
+    "import openpype.pipeline\n"
+    "import pyblish.api\n"
+    "import pyblish.util\n"
+)
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:        52 |         52 |     _json
+import time:       310 |        362 |   json.decoder
+import time:       120 |        120 |   json.encoder
+import time:       200 |        682 | json
+import time:        30 |         30 | openpype
+"""
+
+
+def test_parse_importtime_output():
+    records = parse_importtime_output(IMPORTTIME_OUTPUT)
+    assert [record["name"] for record in records] == [
+        "_json", "json.decoder", "json.encoder", "json", "openpype"
+    ]
+    assert [record["depth"] for record in records] == [2, 1, 1, 0, 0]
+    assert records[3]["cumulative_us"] == 682
+
+    summary = aggregate_import_records(records, top=2)
+    assert summary["modules_count"] == 5
+    assert summary["total_us"] == 712
+    assert summary["by_package"][0] == {"name": "json", "self_us": 630}
+    assert [item["name"] for item in summary["slowest"]] == [
+        "json.decoder", "json"
+    ]
+
+
+def test_startup_profiler_report(tmp_path):
+    output_path = str(tmp_path / "profile.json")
+    profiler = StartupProfiler(output_path)
+    for _ in range(2):
+        with profiler.phase("settings.system"):
+            pass
+
+    assert profiler.write_report() == output_path
+    with open(output_path, "r") as stream:
+        report = json.load(stream)
+
+    assert report["phases"][0]["name"] == "settings.system"
+    assert report["phases"][0]["count"] == 2
+    assert report["imports"]["modules_count"] == 0
+
+
+def test_startup_phase_uses_set_profiler(tmp_path):
+    profiler = StartupProfiler(str(tmp_path / "profile.json"))
+    set_startup_profiler(profiler)
+    try:
+        assert get_startup_profiler() is profiler
+        with startup_phase("settings.system"):
+            pass
+    finally:
+        set_startup_profiler(None)
+
+    with startup_phase("settings.system"):
+        pass
+    assert profiler.get_report()["phases"][0]["count"] == 1
+    assert not any(
+        module is profiler for module in list(sys.modules.values())
+    )
+
+
+def _get_farm_imports_summary():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (REPO_ROOT, env.get("PYTHONPATH")) if path
+    )
+    # Avoid connection to database when logger is created
+    env.setdefault("OPENPYPE_MONGO", "mongodb://localhost:27017")
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", FARM_IMPORTS],
+        env=env,
+        cwd=REPO_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    assert process.returncode == 0, process.stderr
+
+    return aggregate_import_records(
+        parse_importtime_output(process.stderr), top=10
+    )
+
+
+def test_farm_commands_forbidden_imports():
+    summary = _get_farm_imports_summary()
+    imported_packages = {item["name"] for item in summary["by_package"]}
+    assert not imported_packages & FARM_FORBIDDEN_PACKAGES
+
+
+@pytest.mark.skipif(
+    not FARM_IMPORT_BUDGET_MS,
+    reason="Set 'OPENPYPE_STARTUP_IMPORT_BUDGET_MS' to check import budget"
+)
+def test_farm_commands_import_budget():
+    budget_ms = int(FARM_IMPORT_BUDGET_MS)
+    summary = _get_farm_imports_summary()
+    total_ms = summary["total_us"] / 1000
+    assert total_ms <= budget_ms, (
+        "Import time of farm-side commands {:.0f} ms exceeded budget {} ms."
+        " Slowest modules: {}"
+    ).format(
+        total_ms,
+        budget_ms,
+        ", ".join(
+            "{} ({} us)".format(item["name"], item["self_us"])
+            for item in summary["slowest"]
+        )
+    )
@@ -0,0 +1,136 @@
+"""Test parallel conversion of input files for ffmpeg."""
+import threading
+
+import pytest
+
+from openpype.lib import transcoding
+
+
+@pytest.fixture
+def fake_oiio(monkeypatch):
+    commands = []
+    lock = threading.Lock()
+
+    def run_subprocess(args, logger=None):
+        input_path = args[args.index("--ch") - 1]
+        if "broken" in input_path:
+            raise RuntimeError("Failed to read")
+        with lock:
+            commands.append(args)
+        return ""
+
+    def get_oiio_info_for_input(filepath, logger=None):
+        return {
+            "width": 1920,
+            "height": 1080,
+            "channelnames": ["R", "G", "B", "A"],
+            "attribs": {"compression": "dwaa", "comment": "a\"b"},
+        }
+
+    monkeypatch.setattr(transcoding, "run_subprocess", run_subprocess)
+    monkeypatch.setattr(
+        transcoding, "get_oiio_info_for_input", get_oiio_info_for_input)
+    monkeypatch.setattr(
+        transcoding, "get_oiio_tool_args", lambda *args: list(args))
+    return commands
+
+
+def test_frames_are_converted_in_parallel(fake_oiio, tmp_path):
+    input_paths = [
+        "/renders/beauty.{:04d}.exr".format(frame)
+        for frame in range(1001, 1051)
+    ]
+    progress = []
+    transcoding.convert_input_paths_for_ffmpeg(
+        input_paths,
+        str(tmp_path),
+        max_workers=4,
+        progress_callback=lambda done, total: progress.append((done, total))
+    )
+
+    assert len(fake_oiio) == len(input_paths)
+    assert progress[-1] == (50, 50)
+    for args in fake_oiio:
+        assert args[args.index("--compression") + 1] == "none"
+        assert args[args.index("--eraseattrib") + 1] == "comment"
+
+
+def test_conversion_failures_are_reported(fake_oiio, tmp_path):
+    input_paths = ["/renders/beauty.broken.exr", "/renders/beauty.1001.exr"]
+    with pytest.raises(RuntimeError) as exc_info:
+        transcoding.convert_input_paths_for_ffmpeg(
+            input_paths, str(tmp_path), max_workers=2
+        )
+    assert "beauty.broken.exr: Failed to read" in str(exc_info.value)
+
+
+def test_workers_count_is_limited_by_memory():
+    assert transcoding.get_conversion_workers_count(
+        frame_size=100, max_workers=8, memory_budget=250
+    ) == 2
+    assert transcoding.get_conversion_workers_count(
+        frame_size=100, max_workers=8, memory_budget=10
+    ) == 1
+
+
+def test_default_workers_do_not_oversubscribe_cpus(monkeypatch):
+    monkeypatch.setattr(transcoding.os, "cpu_count", lambda: 16)
+    workers = transcoding.get_conversion_workers_count()
+    assert workers == transcoding.DEFAULT_CONVERSION_WORKERS
+    assert transcoding.get_conversion_threads_count(workers) == 4
+    monkeypatch.setattr(transcoding.os, "cpu_count", lambda: 2)
+    assert transcoding.get_conversion_workers_count() == 2
+    assert transcoding.get_conversion_threads_count(32) == 1
+
+
+def test_threads_are_split_between_workers(fake_oiio, tmp_path, monkeypatch):
+    monkeypatch.setattr(transcoding.os, "cpu_count", lambda: 8)
+    input_paths = [
+        "/renders/beauty.{:04d}.exr".format(frame)
+        for frame in range(1001, 1005)
+    ]
+    transcoding.convert_input_paths_for_ffmpeg(
+        input_paths, str(tmp_path), max_workers=2
+    )
+    for args in fake_oiio:
+        assert args[args.index("--threads") + 1] == "4"
+
+
+def test_oiio_info_is_cached_until_file_changes(monkeypatch, tmp_path):
+    from openpype.lib import media_probe_cache
+
+    probe_cache = media_probe_cache.MediaProbeCache(
+        cache_dir=str(tmp_path / "cache"))
+    monkeypatch.setattr(
+        transcoding, "get_media_probe_cache", lambda: probe_cache)
+    monkeypatch.setattr(
+        transcoding, "get_oiio_tool_args", lambda *args: list(args))
+    calls = []
+
+    def run_subprocess(args, logger=None):
+        calls.append(args)
+        return (
+            "<ImageSpec version=\"26\">\n"
+            "<width>{}</width>\n"
+            "<channelnames><channelname>R</channelname></channelnames>\n"
+            "</ImageSpec>"
+        ).format(100 * len(calls))
+
+    monkeypatch.setattr(transcoding, "run_subprocess", run_subprocess)
+    filepath = tmp_path / "render.exr"
+    filepath.write_bytes(b"frame")
+
+    assert transcoding.get_oiio_info_for_input(str(filepath))["width"] == 100
+    assert transcoding.get_oiio_info_for_input(str(filepath))["width"] == 100
+    assert len(calls) == 1
+    assert probe_cache.info()["avoided_launches"] == 1
+
+    # Persisted output is used by new cache
+    probe_cache.clear()
+    assert transcoding.get_oiio_info_for_input(str(filepath))["width"] == 100
+    assert probe_cache.info()["disk_hits"] == 1
+
+    # Changed file is probed again
+    filepath.write_bytes(b"changed frame")
+    assert transcoding.get_oiio_info_for_input(str(filepath))["width"] == 200
+    assert len(calls) == 2
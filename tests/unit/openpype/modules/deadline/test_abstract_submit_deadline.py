@@ -0,0 +1,142 @@
+"""Test pooled requests and batch submission to Deadline.
+
+Local HTTP server is used as stand-in for Deadline webservice.
+"""
+import json
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+import pytest
+
+from openpype.pipeline.publish import KnownPublishError
+from openpype.modules.deadline import abstract_submit_deadline
+from openpype.modules.deadline.abstract_submit_deadline import (
+    AbstractSubmitDeadline,
+    requests_get,
+)
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _DeadlineHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, data):
+        content = json.dumps(data).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        self.server.client_ports.append(self.client_address[1])
+        self._send_json([])
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        payload = json.loads(self.rfile.read(length))
+        with self.server.lock:
+            job_id = "job_{}".format(len(self.server.jobs))
+            self.server.jobs.append((job_id, payload["JobInfo"]))
+        self._send_json({"_id": job_id, "Props": payload["JobInfo"]})
+
+
+class _Instance(object):
+    def __init__(self):
+        self.data = {}
+
+
+class _SubmitDeadline(AbstractSubmitDeadline):
+    def get_job_info(self):
+        return None
+
+    def get_plugin_info(self):
+        return {}
+
+
+@pytest.fixture
+def deadline_url():
+    server = _ThreadingHTTPServer(("127.0.0.1", 0), _DeadlineHandler)
+    server.jobs = []
+    server.client_ports = []
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    yield server, "http://127.0.0.1:{}".format(server.server_address[1])
+
+    server.shutdown()
+    server.server_close()
+    abstract_submit_deadline.close_deadline_sessions()
+
+
+def _get_plugin(url):
+    plugin = _SubmitDeadline()
+    plugin._deadline_url = url
+    plugin._instance = _Instance()
+    plugin.submit_workers = 2
+    return plugin
+
+
+def test_requests_reuse_connection(deadline_url):
+    server, url = deadline_url
+    for _ in range(3):
+        assert requests_get("{}/api/pools".format(url)).ok
+
+    assert len(set(server.client_ports)) == 1
+
+
+def test_submit_batch(deadline_url):
+    server, url = deadline_url
+    plugin = _get_plugin(url)
+    payloads = {
+        key: {"JobInfo": {"Name": key}, "PluginInfo": {}, "AuxFiles": []}
+        for key in ("export", "render_1", "render_2", "assembly")
+    }
+    payloads["assembly"]["JobInfo"]["JobDependencies"] = "external"
+    job_ids = plugin.submit_batch(payloads, {
+        "render_1": ["export"],
+        "render_2": ["export"],
+        "assembly": ["render_1", "render_2"],
+    })
+
+    jobs_by_name = {
+        job_info["Name"]: (job_id, job_info)
+        for job_id, job_info in server.jobs
+    }
+    assert list(job_ids) == list(payloads)
+    assert job_ids == {
+        name: job_id
+        for name, (job_id, _) in jobs_by_name.items()
+    }
+    assert jobs_by_name["render_1"][1]["JobDependencies"] == job_ids["export"]
+    assert jobs_by_name["assembly"][1]["JobDependencies"] == ",".join([
+        "external", job_ids["render_1"], job_ids["render_2"]
+    ])
+    # Payloads passed in are not changed
+    assert "JobDependencies" not in payloads["render_1"]["JobInfo"]
+    assert (
+        plugin._instance.data["deadlineSubmissionJob"]["_id"]
+        == job_ids["assembly"]
+    )
+
+
+def test_submit_batch_circular_dependencies(deadline_url):
+    server, url = deadline_url
+    plugin = _get_plugin(url)
+    payloads = {
+        key: {"JobInfo": {"Name": key}, "PluginInfo": {}, "AuxFiles": []}
+        for key in ("a", "b")
+    }
+    with pytest.raises(KnownPublishError):
+        plugin.submit_batch(payloads, {"a": ["b"], "b": ["a"]})
+
+    assert not server.jobs
@@ -0,0 +1,103 @@
+"""Test merging of entity changes of coalesced events in sync to avalon.
+
+Event handler is imported from loaded OpenPype modules, ftrack api must be
+available.
+"""
+import pytest
+
+pytest.importorskip("ftrack_api")
+pytest.importorskip("arrow")
+
+
+@pytest.fixture(scope="module")
+def handler():
+    from openpype.modules import load_modules
+
+    load_modules()
+    from openpype_modules.ftrack.event_handlers_server import (
+        event_sync_to_avalon
+    )
+
+    # Merging does not need session nor database connection
+    handler_cls = event_sync_to_avalon.SyncToAvalonEvent
+    return handler_cls.__new__(handler_cls)
+
+
+def _entity_info(ftrack_id, action, entity_type="Shot", changes=None):
+    changes = changes or {}
+    return {
+        "entityId": ftrack_id,
+        "action": action,
+        "entityType": "task",
+        "entity_type": entity_type,
+        "keys": list(changes.keys()),
+        "changes": changes,
+        "parents": [{"entityType": "show", "entityId": "project_id"}],
+    }
+
+
+def _get_actions(entities_info):
+    return [
+        (ent_info["entityId"], ent_info["action"])
+        for ent_info in entities_info
+    ]
+
+
+def test_added_entity_skips_updates(handler):
+    merged = handler.merge_entities_info([
+        _entity_info("sh010", "add"),
+        _entity_info(
+            "sh010", "update", changes={"name": {"old": "a", "new": "b"}}
+        ),
+    ])
+    assert _get_actions(merged) == [("sh010", "add")]
+
+
+def test_added_and_removed_entity_is_skipped(handler):
+    merged = handler.merge_entities_info([
+        _entity_info("sh010", "add"),
+        _entity_info("sh020", "update"),
+        _entity_info("sh010", "remove"),
+        _entity_info("sh030", "update"),
+        _entity_info("sh030", "remove"),
+    ])
+    assert _get_actions(merged) == [("sh020", "update"), ("sh030", "remove")]
+
+
+def test_repeated_updates_are_merged(handler):
+    merged = handler.merge_entities_info([
+        _entity_info(
+            "sh010", "update", changes={"name": {"old": "a", "new": "b"}}
+        ),
+        _entity_info(
+            "sh010", "update", changes={"fstart": {"old": 1, "new": 2}}
+        ),
+        _entity_info(
+            "sh010", "update", changes={"name": {"old": "b", "new": "c"}}
+        ),
+    ])
+    assert len(merged) == 1
+    assert merged[0]["keys"] == ["name", "fstart"]
+    assert merged[0]["changes"] == {
+        "name": {"old": "a", "new": "c"},
+        "fstart": {"old": 1, "new": 2},
+    }
+
+
+def test_task_changes_are_kept(handler):
+    entities_info = [
+        _entity_info("task_id", "add", entity_type="Task"),
+        _entity_info(
+            "task_id",
+            "update",
+            entity_type="Task",
+            changes={"name": {"old": "a", "new": "b"}}
+        ),
+        _entity_info("task_id", "remove", entity_type="Task"),
+    ]
+    merged = handler.merge_entities_info(entities_info)
+    assert _get_actions(merged) == [
+        ("task_id", "add"), ("task_id", "update"), ("task_id", "remove")
+    ]
+    # Source changes are not modified
+    assert entities_info[1]["changes"]["name"] == {"old": "a", "new": "b"}
@@ -0,0 +1,89 @@
+"""Test scheduling and journal of job queue server."""
+from openpype.modules.job_queue.job_server.jobs import JobQueue
+
+
+class FakeWorker:
+    def __init__(self, host_name, worker_id):
+        self.host_name = host_name
+        self.id = worker_id
+        self.current_job = None
+
+    def is_idle(self):
+        return self.current_job is None
+
+    def set_current_job(self, job):
+        if job is self.current_job:
+            return
+        self.current_job = job
+        if job is not None:
+            job.set_worker(self)
+
+
+def _finish_job(job_queue, worker):
+    job = worker.current_job
+    job_queue.set_job_done(job.id, True)
+    return job
+
+
+def test_jobs_are_assigned_by_priority():
+    job_queue = JobQueue()
+    low = job_queue.create_job("tvpaint", {}, priority=10)
+    first, second = job_queue.create_jobs([
+        ("tvpaint", {}, None),
+        ("tvpaint", {}, None),
+    ])
+    high = job_queue.create_job("tvpaint", {}, priority=100)
+
+    worker = FakeWorker("tvpaint", "worker")
+    job_queue.add_worker(worker)
+
+    order = []
+    for _ in range(4):
+        job_queue.assign_jobs()
+        order.append(_finish_job(job_queue, worker))
+
+    assert order == [high, first, second, low]
+    metrics = job_queue.get_metrics()["tvpaint"]
+    assert metrics["queue_depth"] == 0
+    assert metrics["submitted"] == 4
+    assert metrics["done"] == 4
+
+
+def test_journal_restores_unfinished_jobs(tmp_path):
+    journal_path = str(tmp_path / "jobs.db")
+    job_queue = JobQueue(journal_path)
+    done_job, waiting_job = job_queue.create_jobs([
+        ("tvpaint", {"value": 1}, 80),
+        ("tvpaint", {"value": 2}, None),
+    ])
+    worker = FakeWorker("tvpaint", "worker")
+    job_queue.add_worker(worker)
+    job_queue.assign_jobs()
+    assert _finish_job(job_queue, worker) is done_job
+    job_queue.close()
+
+    restored_queue = JobQueue(journal_path)
+    restored_job = restored_queue.get_job(waiting_job.id)
+    assert restored_queue.get_job(done_job.id) is None
+    assert restored_job.data == {"value": 2}
+    assert restored_job.priority == waiting_job.priority
+    assert restored_queue.get_metrics()["tvpaint"]["queue_depth"] == 1
+    restored_queue.close()
+
+
+def test_assigned_job_is_started_by_worker():
+    job_queue = JobQueue()
+    job = job_queue.create_job("tvpaint", {})
+    worker = FakeWorker("tvpaint", "worker")
+    job_queue.add_worker(worker)
+
+    job_queue.assign_jobs()
+    assert worker.current_job is job
+    # Job waits until worker confirms it was started
+    assert job_queue.get_job_status(job.id)["state"] == "waiting"
+    assert job_queue.get_metrics()["tvpaint"]["started"] == 0
+
+    job_queue.set_job_started(job.id)
+    job_queue.set_job_started(job.id)
+    assert job_queue.get_job_status(job.id)["state"] == "started"
+    assert job_queue.get_metrics()["tvpaint"]["started"] == 1
@@ -0,0 +1,206 @@
+"""Test synchronization of Kitsu project to OpenPype database.
+
+Gazu is replaced by mock returning fake project entities and database by
+mongomock collection of the project.
+"""
+import sys
+from unittest import mock
+
+import mongomock
+import pytest
+from bson.objectid import ObjectId
+
+# Gazu may not be available, module is replaced in tests anyway
+sys.modules.setdefault("gazu", mock.MagicMock())
+
+from openpype.modules.kitsu.utils import update_op_with_zou  # noqa: E402
+
+PROJECT_NAME = "test_project"
+
+
+class FakeDbcon(object):
+    """Database connection writing to mongomock collection."""
+
+    def __init__(self, collection):
+        self.Session = {}
+        self.collection = collection
+        self.bulk_writes = []
+
+    def bulk_write(self, operations):
+        self.bulk_writes.append(list(operations))
+        return self.collection.bulk_write(operations)
+
+    def insert_many(self, docs):
+        return self.collection.insert_many(docs)
+
+
+@pytest.fixture
+def collection():
+    collection = mongomock.MongoClient().avalon[PROJECT_NAME]
+    collection.insert_many([
+        {
+            "_id": ObjectId(),
+            "type": "project",
+            "name": PROJECT_NAME,
+            "config": {},
+            "data": {
+                "fps": 25.0,
+                "frameStart": 1001,
+                "frameEnd": 1100,
+                "pixelAspect": 1.0,
+                "handleStart": 0,
+                "handleEnd": 0,
+                "clipIn": 1,
+                "clipOut": 1,
+                "resolutionWidth": 1920,
+                "resolutionHeight": 1080,
+            },
+        },
+        {
+            "_id": ObjectId(),
+            "type": "asset",
+            "name": "Assets",
+            "data": {"root_of": "Assets", "tasks": {}},
+        },
+        {
+            "_id": ObjectId(),
+            "type": "asset",
+            "name": "hero",
+            "data": {"zou": {"id": "asset_id"}, "tasks": {}},
+        },
+        {
+            "_id": ObjectId(),
+            "type": "asset",
+            "name": "removed",
+            "data": {"zou": {"id": "removed_id"}, "tasks": {}},
+        },
+    ])
+    return collection
+
+
+@pytest.fixture
+def gazu(monkeypatch, collection):
+    gazu = mock.MagicMock()
+    gazu.project.all_project_status.return_value = [
+        {"id": "status_id", "name": "Open"}
+    ]
+    gazu.asset.all_assets_for_project.return_value = [{
+        "id": "asset_id",
+        "name": "hero",
+        "type": "Asset",
+        "entity_type_id": "asset_type_id",
+    }]
+    gazu.asset.all_asset_types_for_project.return_value = [
+        {"id": "asset_type_id", "name": "Character", "type": "AssetType"}
+    ]
+    gazu.shot.all_episodes_for_project.return_value = []
+    gazu.shot.all_sequences_for_project.return_value = [
+        {"id": "sequence_id", "name": "sq01", "type": "Sequence"}
+    ]
+    gazu.shot.all_shots_for_project.return_value = [{
+        "id": "shot_id",
+        "name": "sh010",
+        "type": "Shot",
+        "parent_id": "sequence_id",
+        "nb_frames": 10,
+    }]
+    gazu.task.all_tasks_for_asset.return_value = []
+    gazu.task.all_tasks_for_shot.return_value = []
+    gazu.task.all_task_types_for_project.return_value = [
+        {"name": "Animation", "short_name": "anim"}
+    ]
+    monkeypatch.setattr(update_op_with_zou, "gazu", gazu)
+
+    def get_project(project_name):
+        return collection.find_one({"type": "project"})
+
+    def get_assets(project_name, asset_names=None, fields=None):
+        query = {"type": "asset"}
+        if asset_names is not None:
+            query["name"] = {"$in": list(asset_names)}
+        return collection.find(query)
+
+    monkeypatch.setattr(update_op_with_zou, "get_project", get_project)
+    monkeypatch.setattr(update_op_with_zou, "get_assets", get_assets)
+    return gazu
+
+
+@pytest.fixture
+def zou_project():
+    # Project without code is updated in Kitsu
+    return {
+        "id": "project_id",
+        "name": PROJECT_NAME,
+        "fps": 25,
+        "resolution": "1920x1080",
+        "project_status_id": "status_id",
+    }
+
+
+def _get_asset_by_zou_id(collection, zou_id):
+    return collection.find_one({"data.zou.id": zou_id})
+
+
+def test_sync_project(collection, gazu, zou_project):
+    dbcon = FakeDbcon(collection)
+    report = update_op_with_zou.sync_project_from_kitsu(
+        dbcon, zou_project, chunk_size=3
+    )
+
+    # Root folder "Shots", asset type, sequence and shot are created
+    assert report["insert"] == 4
+    # Project and existing asset
+    assert report["update"] == 2
+    assert report["delete"] == 1
+    assert [len(operations) for operations in dbcon.bulk_writes] == [3, 3, 1]
+    gazu.project.update_project.assert_called_once()
+
+    project_doc = collection.find_one({"type": "project"})
+    assert project_doc["data"]["code"] == PROJECT_NAME
+    assert project_doc["config"]["tasks"] == {
+        "Animation": {"short_name": "anim"}
+    }
+    assert _get_asset_by_zou_id(collection, "removed_id") is None
+
+    # New docs reference each other by ids created in memory
+    shots_doc = collection.find_one({"name": "Shots"})
+    sequence_doc = _get_asset_by_zou_id(collection, "sequence_id")
+    shot_doc = _get_asset_by_zou_id(collection, "shot_id")
+    assert sequence_doc["data"]["visualParent"] == shots_doc["_id"]
+    assert sequence_doc["data"]["parents"] == ["Shots"]
+    assert shot_doc["name"] == "sq01_sh010"
+    assert shot_doc["parent"] == project_doc["_id"]
+    assert shot_doc["data"]["visualParent"] == sequence_doc["_id"]
+    assert shot_doc["data"]["parents"] == ["Shots", "sq01"]
+    assert shot_doc["data"]["frameEnd"] == 1010
+
+    asset_type_doc = _get_asset_by_zou_id(collection, "asset_type_id")
+    asset_doc = _get_asset_by_zou_id(collection, "asset_id")
+    assert asset_type_doc["data"]["visualParent"] == (
+        collection.find_one({"name": "Assets"})["_id"]
+    )
+    assert asset_doc["data"]["visualParent"] == asset_type_doc["_id"]
+    assert asset_doc["data"]["parents"] == ["Assets", "Character"]
+
+    # Synchronized project does not need new or deleted docs
+    dbcon.bulk_writes = []
+    report = update_op_with_zou.sync_project_from_kitsu(dbcon, zou_project)
+    assert report["insert"] == 0
+    assert report["delete"] == 0
+    assert len(dbcon.bulk_writes) == 1
+
+
+def test_sync_project_dry_run(collection, gazu, zou_project):
+    docs = list(collection.find())
+    dbcon = FakeDbcon(collection)
+    report = update_op_with_zou.sync_project_from_kitsu(
+        dbcon, zou_project, dry_run=True, chunk_size=3
+    )
+
+    assert report["insert"] == 4
+    assert report["update"] == 2
+    assert report["delete"] == 1
+    assert report["write_time"] == 0.0
+    assert dbcon.bulk_writes == []
+    assert list(collection.find()) == docs
+    gazu.project.update_project.assert_not_called()
@@ -0,0 +1,83 @@
+"""Test tracking of changed representations for incremental sync."""
+from datetime import datetime, timedelta
+
+import mongomock
+from bson.objectid import ObjectId
+from pymongo.errors import OperationFailure
+
+from openpype.client.mongo.operations import (
+    MongoCreateOperation,
+    MongoUpdateOperation,
+)
+from openpype.modules.sync_server.change_tracker import (
+    RepresentationChangeTracker,
+    SYNC_UPDATED_KEY,
+)
+
+
+def _create_tracker(monkeypatch):
+    collection = mongomock.MongoClient().db.project
+
+    def watch(*args, **kwargs):
+        raise OperationFailure("Change streams are not supported")
+
+    monkeypatch.setattr(collection, "watch", watch)
+    tracker = RepresentationChangeTracker(collection, watermark_overlap=0)
+    tracker.start()
+    return collection, tracker
+
+
+def test_first_call_requests_full_sync(monkeypatch):
+    _, tracker = _create_tracker(monkeypatch)
+
+    assert not tracker.uses_change_stream
+    assert tracker.pop_dirty_ids() is None
+    assert tracker.pop_dirty_ids() == []
+
+    tracker.request_full_sync()
+    assert tracker.pop_dirty_ids() is None
+
+
+def test_watermark_changes(monkeypatch):
+    collection, tracker = _create_tracker(monkeypatch)
+    old_id = ObjectId.from_datetime(datetime.utcnow() - timedelta(hours=1))
+    collection.insert_one({"_id": old_id, "type": "representation"})
+    assert tracker.pop_dirty_ids() is None
+
+    # New representation and site update of existing one
+    new_id = collection.insert_one({"type": "representation"}).inserted_id
+    collection.update_one(
+        {"_id": old_id},
+        {"$set": {SYNC_UPDATED_KEY: datetime.utcnow()}}
+    )
+    postponed_id = ObjectId()
+    tracker.add_dirty_ids([postponed_id])
+
+    assert set(tracker.pop_dirty_ids()) == {old_id, new_id, postponed_id}
+
+
+def test_watermark_changes_by_operations(monkeypatch):
+    collection, tracker = _create_tracker(monkeypatch)
+    updated_id = ObjectId.from_datetime(
+        datetime.utcnow() - timedelta(hours=1)
+    )
+    collection.insert_one({"_id": updated_id, "type": "representation"})
+    assert tracker.pop_dirty_ids() is None
+
+    # Id is generated before long transfer of files and document is
+    #   inserted after it
+    created_id = ObjectId.from_datetime(
+        datetime.utcnow() - timedelta(minutes=30)
+    )
+    collection.bulk_write([
+        MongoCreateOperation(
+            "project",
+            "representation",
+            {"_id": created_id, "type": "representation"}
+        ).to_mongo_operation(),
+        MongoUpdateOperation(
+            "project", "representation", updated_id, {"data": {}}
+        ).to_mongo_operation(),
+    ])
+
+    assert set(tracker.pop_dirty_ids()) == {created_id, updated_id}
@@ -0,0 +1,89 @@
+"""Test that static manifests of modules match their module classes."""
+import os
+import ast
+import glob
+
+import pytest
+
+from openpype.modules.base import AddonManifest, ADDON_MANIFEST_FILENAME
+from openpype.modules.interfaces import ITrayModule, IPluginPaths
+
+OPENPYPE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)))
+MANIFEST_PATHS = sorted(
+    glob.glob(os.path.join(
+        OPENPYPE_ROOT, "openpype", "modules", "*", ADDON_MANIFEST_FILENAME
+    ))
+    + glob.glob(os.path.join(
+        OPENPYPE_ROOT, "openpype", "hosts", "*", ADDON_MANIFEST_FILENAME
+    ))
+)
+
+
+def _find_class(package_dir, class_name):
+    for root, dirnames, filenames in os.walk(package_dir):
+        dirnames[:] = [
+            dirname
+            for dirname in dirnames
+            if dirname not in ("plugins", "vendor", "python2_vendor")
+        ]
+        for filename in filenames:
+            if not filename.endswith(".py"):
+                continue
+            with open(os.path.join(root, filename)) as stream:
+                tree = ast.parse(stream.read())
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef) and node.name == class_name:
+                    return node
+    return None
+
+
+def _class_values(node):
+    values = {}
+    for item in node.body:
+        if (
+            isinstance(item, ast.Assign)
+            and isinstance(item.targets[0], ast.Name)
+        ):
+            try:
+                values[item.targets[0].id] = ast.literal_eval(item.value)
+            except ValueError:
+                pass
+    return values
+
+
+def test_manifests_exist():
+    assert MANIFEST_PATHS
+
+
+@pytest.mark.parametrize("manifest_path", MANIFEST_PATHS)
+def test_manifest_matches_module_class(manifest_path):
+    package_dir = os.path.dirname(manifest_path)
+    manifest = AddonManifest.from_dirpath(package_dir)
+    assert manifest is not None
+
+    node = _find_class(package_dir, manifest.entry_point)
+    assert node is not None, "Entry point class was not found"
+
+    values = _class_values(node)
+    assert values["name"] == manifest.name
+    assert values.get("host_name") == manifest.host_name
+
+    bases = {base.id for base in node.bases if isinstance(base, ast.Name)}
+    interfaces = {
+        base for base in bases if base.startswith("I") and base[1].isupper()
+    }
+    assert interfaces == set(manifest.interfaces)
+
+    with open(os.path.join(package_dir, "__init__.py")) as stream:
+        assert manifest.entry_point in stream.read()
+
+
+def test_manifest_interfaces():
+    manifest = AddonManifest(
+        {"name": "test", "entry_point": "Test", "interfaces": ["ITrayAction"]},
+        ""
+    )
+    assert manifest.implements(ITrayModule)
+    assert not manifest.implements(IPluginPaths)
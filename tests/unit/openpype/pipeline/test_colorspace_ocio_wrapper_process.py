@@ -0,0 +1,121 @@
+"""Test persistent ocio wrapper process and cache of its results.
+
+Fake wrapper speaking the same protocol as 'ocio_wrapper.py serve' is used
+so PyOpenColorIO and OpenPype bootstrap are not needed.
+"""
+import os
+import sys
+import time
+
+import pytest
+
+from openpype.pipeline import colorspace
+from openpype.pipeline.colorspace import (
+    CachedData,
+    OCIOWrapperProcess,
+    OCIO_WRAPPER_RESPONSE_PREFIX,
+)
+
+FAKE_WRAPPER = """
+import os
+import sys
+import time
+import json
+
+print("Bootstrap output which is not a response")
+sys.stdout.flush()
+for line in iter(sys.stdin.readline, ""):
+    request = json.loads(line)
+    if request["command"] == "hang":
+        continue
+    response = {"id": request["id"]}
+    if request["command"] == "fail":
+        response["error"] = "Query failed"
+    else:
+        response["result"] = {
+            "pid": os.getpid(),
+            "command": request["command"],
+            "kwargs": request["kwargs"],
+        }
+    sys.stdout.write(PREFIX + json.dumps(response) + "\\n")
+    sys.stdout.flush()
+"""
+
+
+def _create_wrapper_process(tmp_path, timeout=None):
+    script_path = tmp_path / "fake_wrapper.py"
+    script_path.write_text("PREFIX = {!r}\n{}".format(
+        OCIO_WRAPPER_RESPONSE_PREFIX, FAKE_WRAPPER
+    ))
+    return OCIOWrapperProcess(
+        args=[sys.executable, str(script_path)],
+        env=dict(os.environ),
+        timeout=timeout,
+    )
+
+
+@pytest.fixture
+def wrapper_process(tmp_path):
+    process = _create_wrapper_process(tmp_path)
+    yield process
+    process.stop()
+
+
+def test_process_is_reused(wrapper_process):
+    first = wrapper_process.request("config", "get_views", in_path="a.ocio")
+    second = wrapper_process.request("config", "get_views", in_path="b.ocio")
+
+    assert first["pid"] == second["pid"] == wrapper_process.pid
+    assert second["kwargs"] == {"in_path": "b.ocio"}
+
+    with pytest.raises(RuntimeError, match="Query failed"):
+        wrapper_process.request("config", "fail")
+    assert wrapper_process.is_running()
+
+
+def test_process_stopped_on_timeout(tmp_path):
+    process = _create_wrapper_process(tmp_path, timeout=1)
+    process.request("config", "get_views")
+
+    start = time.time()
+    with pytest.raises(colorspace.OCIOWrapperProcessError):
+        process.request("config", "hang")
+    assert time.time() - start < 10
+    assert not process.is_running()
+
+    # Next request starts new process
+    assert process.request("config", "get_views")["pid"] == process.pid
+    process.stop()
+
+
+def test_results_cached_by_config_mtime(
+    wrapper_process, tmp_path, monkeypatch
+):
+    config_path = tmp_path / "config.ocio"
+    config_path.write_text("ocio_profile_version: 2")
+    monkeypatch.setattr(CachedData, "ocio_wrapper_process", wrapper_process)
+    monkeypatch.setattr(CachedData, "ocio_wrapper_results", {})
+
+    def _query():
+        return colorspace._get_wrapped_with_subprocess(
+            "config", "get_views", in_path=str(config_path)
+        )
+
+    first = _query()
+    wrapper_process.stop()
+    # Process is not needed for cached result
+    cached = _query()
+    assert cached == first
+    assert not wrapper_process.is_running()
+
+    # Changes of returned values do not affect cache
+    cached["kwargs"]["in_path"] = "changed"
+    first["command"] = "changed"
+    assert _query()["kwargs"]["in_path"] == str(config_path)
+    assert _query()["command"] == "get_views"
+
+    mtime = os.path.getmtime(str(config_path)) + 10
+    os.utime(str(config_path), (mtime, mtime))
+    second = _query()
+    assert second is not first
+    assert second["pid"] != first["pid"]
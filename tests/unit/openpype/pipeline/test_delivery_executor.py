@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""Test planning and concurrent processing of delivery transfers."""
+import os
+import shutil
+import logging
+import collections
+
+from openpype.pipeline.delivery import DeliveryExecutor, deliver_sequence
+
+
+def _create_sources(root, count):
+    src_dir = root / "publish"
+    src_dir.mkdir()
+    paths = []
+    for frame in range(1001, 1001 + count):
+        path = src_dir / "sh010_plate.{}.exr".format(frame)
+        path.write_text("frame {}".format(frame))
+        paths.append(str(path))
+    return paths
+
+
+def test_delivery_executor(tmp_path):
+    src_paths = _create_sources(tmp_path, 20)
+    dst_dir = tmp_path / "client" / "sh010"
+
+    executor = DeliveryExecutor(max_workers=4, max_workers_per_destination=2)
+    for src_path in src_paths:
+        dst_path = str(dst_dir / os.path.basename(src_path))
+        assert executor.add_transfer(src_path, dst_path)
+        # Same transfer is planned only once
+        assert not executor.add_transfer(src_path, dst_path)
+    # Different source to already planned destination is reported
+    executor.add_transfer(src_paths[1], str(dst_dir / "sh010_plate.1001.exr"))
+    assert len(executor.transfers) == 20
+    assert list(executor.report_items) == [
+        "Multiple files are delivered to the same path"
+    ]
+
+    progress = []
+    counts = executor.process(lambda *args: progress.append(args))
+    assert counts == {"transferred": 20, "skipped": 0, "failed": 0}
+    assert progress[-1] == (20, 20)
+    assert len(progress) == 20
+    assert (dst_dir / "sh010_plate.1005.exr").read_text() == "frame 1005"
+
+    # Resumed delivery skips identical files and replaces changed ones
+    changed_path = dst_dir / "sh010_plate.1010.exr"
+    os.remove(str(changed_path))
+    changed_path.write_text("partial")
+    (dst_dir / "sh010_plate.1011.exr").unlink()
+    counts = executor.process()
+    assert counts == {"transferred": 2, "skipped": 18, "failed": 0}
+    assert changed_path.read_text() == "frame 1010"
+
+
+def test_delivery_executor_failed_transfer(tmp_path):
+    executor = DeliveryExecutor()
+    executor.add_transfer(
+        str(tmp_path / "missing.exr"), str(tmp_path / "out" / "missing.exr")
+    )
+    counts = executor.process()
+    assert counts == {"transferred": 0, "skipped": 0, "failed": 1}
+    assert "Failed to deliver files" in executor.report_items
+
+
+def test_destination_key():
+    executor = DeliveryExecutor()
+    assert (
+        executor.get_destination_key("/mnt/client/sh010/a.exr")
+        == executor.get_destination_key("/mnt/client/sh020/b.exr")
+        == "/mnt/client"
+    )
+
+
+def test_delivery_executor_copy(tmp_path, monkeypatch):
+    from openpype.pipeline import delivery
+
+    def _create_hard_link(src_path, dst_path):
+        raise OSError("Hardlinks are not supported")
+
+    monkeypatch.setattr(delivery, "create_hard_link", _create_hard_link)
+    src_paths = _create_sources(tmp_path, 3)
+    executor = DeliveryExecutor()
+    for src_path in src_paths:
+        executor.add_transfer(
+            src_path, str(tmp_path / "client" / os.path.basename(src_path))
+        )
+
+    assert executor.process()["transferred"] == 3
+    # Copied files keep modification time so they are skipped next time
+    assert executor.process()["skipped"] == 3
+    assert sorted(os.listdir(str(tmp_path / "client"))) == [
+        os.path.basename(src_path) for src_path in src_paths
+    ]
+
+
+def test_delivery_executor_skips_newer_destination(tmp_path):
+    src_paths = _create_sources(tmp_path, 3)
+    dst_dir = tmp_path / "client"
+    dst_dir.mkdir()
+    executor = DeliveryExecutor()
+    for src_path in src_paths:
+        dst_path = str(dst_dir / os.path.basename(src_path))
+        # Older deliveries did not keep modification time of source
+        shutil.copyfile(src_path, dst_path)
+        src_mtime = os.path.getmtime(src_path)
+        os.utime(dst_path, (src_mtime + 60, src_mtime + 60))
+        executor.add_transfer(src_path, dst_path)
+
+    # Destination older than source is delivered again
+    old_path = str(dst_dir / os.path.basename(src_paths[0]))
+    src_mtime = os.path.getmtime(src_paths[0])
+    os.utime(old_path, (src_mtime - 60, src_mtime - 60))
+
+    counts = executor.process()
+    assert counts == {"transferred": 1, "skipped": 2, "failed": 0}
+
+
+class _FakeTemplate(object):
+    def __init__(self, template):
+        self.template = template
+
+    def format_strict(self, data):
+        return self.template.format(**data)
+
+
+class _FakeAnatomy(object):
+    project_name = "test_project"
+
+    def __init__(self, template):
+        self.templates = {"delivery": {"client": template}}
+        self.templates_obj = {"delivery": {"client": _FakeTemplate(template)}}
+
+
+def test_deliver_sequence_with_executor(tmp_path):
+    src_dir = tmp_path / "publish"
+    src_dir.mkdir()
+    for frame in ("0101", "0102", "0103"):
+        (src_dir / "sh010_plate.{}.exr".format(frame)).write_text("exr")
+        # Files with other extension are not part of sequence
+        (src_dir / "sh010_plate.{}.exr.tx".format(frame)).write_text("tx")
+    (src_dir / "sh010_plate.v001.exr").write_text("exr")
+
+    dst_dir = tmp_path / "client"
+    anatomy = _FakeAnatomy(str(dst_dir / "{asset}_plate.{frame}.{ext}"))
+    repre = {"_id": "repre_id", "context": {"ext": "exr"}}
+    executor = DeliveryExecutor()
+    report_items = collections.defaultdict(list)
+
+    report_items, uploaded = deliver_sequence(
+        str(src_dir / "sh010_plate.####.exr"),
+        repre,
+        anatomy,
+        "client",
+        {"asset": "sh010", "ext": "exr"},
+        None,
+        report_items,
+        logging.getLogger("test"),
+        has_renumbered_frame=True,
+        new_frame_start=1,
+        executor=executor
+    )
+
+    assert not report_items
+    assert uploaded == 3
+    # Nothing is transferred before processing
+    assert not dst_dir.exists()
+    assert sorted(
+        transfer.dst_path for transfer in executor.transfers
+    ) == [
+        str(dst_dir / "sh010_plate.{}.exr".format(frame))
+        for frame in ("0001", "0002", "0003")
+    ]
+    assert executor.process()["transferred"] == 3
+    assert sorted(os.listdir(str(dst_dir))) == [
+        "sh010_plate.0001.exr", "sh010_plate.0002.exr", "sh010_plate.0003.exr"
+    ]
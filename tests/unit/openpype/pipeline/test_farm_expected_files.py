@@ -0,0 +1,52 @@
+"""Test assembling of expected files is same as 'clique.assemble'."""
+import clique
+import pytest
+
+from openpype.pipeline.farm.pyblish_functions import assemble_expected_files
+
+
+def _to_data(result):
+    collections, remainders = result
+    return (
+        [
+            (item.head, item.tail, item.padding, list(item.indexes))
+            for item in collections
+        ],
+        remainders
+    )
+
+
+@pytest.mark.parametrize("files", [
+    # Multiple AOVs with digits in names
+    [
+        "/renders/v001/{aov}/sh010_{aov}_v001.{frame:04d}.exr".format(
+            aov=aov, frame=frame
+        )
+        for aov in ("beauty", "light01", "light02")
+        for frame in range(1001, 1011)
+    ],
+    # Single frame, review and duplicated file
+    [
+        "/renders/v001/beauty.1001.exr",
+        "/renders/v001/review.mov",
+        "/renders/v001/review.mov",
+        "/renders/v001/review.mp4",
+    ],
+    # Frames differ only in digits outside of frame
+    [
+        "/renders/cam1/beauty.1001.exr",
+        "/renders/cam2/beauty.1001.exr",
+    ],
+    # Mixed padding
+    ["/renders/beauty.{}.exr".format(frame) for frame in (998, 999, 1000)]
+    + ["/renders/beauty.0998.exr", "/renders/beauty.0999.exr"],
+    # Not padded frames with duplicated file
+    ["/renders/beauty.{}.exr".format(frame) for frame in (1, 2, 2, 10)],
+    # No frames
+    ["/renders/beauty.exr", "/renders/specular.exr"],
+])
+def test_assemble_expected_files(files):
+    assert (
+        _to_data(assemble_expected_files(files))
+        == _to_data(clique.assemble(files))
+    )
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Test incremental filtering of outdated containers."""
+import time
+import collections
+
+import pytest
+
+from openpype.pipeline.load import utils as load_utils
+from openpype.pipeline.load import (
+    filter_containers,
+    reset_containers_versions_cache,
+)
+
+PROJECT_NAME = "test_project"
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.repre_docs = {}
+        self.version_docs = {}
+        self.queries = collections.Counter()
+
+    def add_version(self, version_id, subset_id, hero=False):
+        self.version_docs[version_id] = {
+            "_id": version_id,
+            "parent": subset_id,
+            "type": "hero_version" if hero else "version",
+            "created": time.time(),
+        }
+        self.repre_docs[version_id + "_repre"] = {
+            "_id": version_id + "_repre",
+            "parent": version_id,
+        }
+
+    def get_representations(self, project_name, representation_ids, fields):
+        self.queries["representations"] += 1
+        return [
+            self.repre_docs[repre_id]
+            for repre_id in representation_ids
+            if repre_id in self.repre_docs
+        ]
+
+    def get_versions(self, project_name, version_ids, hero, fields):
+        self.queries["versions"] += 1
+        return [
+            self.version_docs[version_id]
+            for version_id in version_ids
+            if version_id in self.version_docs
+        ]
+
+    def get_last_versions(self, project_name, subset_ids, fields):
+        self.queries["last_versions"] += 1
+        output = {}
+        for version_doc in self.version_docs.values():
+            subset_id = version_doc["parent"]
+            if version_doc["type"] == "version" and subset_id in subset_ids:
+                output[subset_id] = version_doc
+        return output
+
+    def get_subset_ids_with_new_versions(
+        self, project_name, subset_ids, created_after
+    ):
+        self.queries["new_versions"] += 1
+        return {
+            version_doc["parent"]
+            for version_doc in self.version_docs.values()
+            if (
+                version_doc["parent"] in subset_ids
+                and version_doc["created"] >= created_after
+            )
+        }
+
+
+@pytest.fixture
+def database(monkeypatch):
+    database = FakeDatabase()
+    for name in (
+        "get_representations",
+        "get_versions",
+        "get_last_versions",
+        "get_subset_ids_with_new_versions",
+    ):
+        monkeypatch.setattr(load_utils, name, getattr(database, name))
+    monkeypatch.setattr(
+        load_utils.ContainersVersionsCache, "watermark_margin", 0
+    )
+    reset_containers_versions_cache()
+    yield database
+    reset_containers_versions_cache()
+
+
+def _container(name, repre_id):
+    return {"objectName": name, "representation": repre_id}
+
+
+def _names(containers):
+    return [container["objectName"] for container in containers]
+
+
+def test_incremental_filter_containers(database):
+    database.add_version("v1", "subsetA")
+    database.add_version("v2", "subsetA")
+    database.add_version("h1", "subsetA", hero=True)
+    database.add_version("v3", "subsetB")
+    containers = [
+        _container("old", "v1_repre"),
+        _container("latest", "v2_repre"),
+        _container("hero", "h1_repre"),
+        _container("other", "v3_repre"),
+        _container("missing", "unknown_repre"),
+        _container("invalid", None),
+    ]
+
+    expected = filter_containers(containers, PROJECT_NAME)
+    result = filter_containers(containers, PROJECT_NAME, incremental=True)
+    assert result == expected
+    assert _names(result.latest) == ["latest", "hero", "other"]
+    assert _names(result.outdated) == ["old"]
+    assert _names(result.not_found) == ["missing"]
+    assert _names(result.invalid) == ["invalid"]
+
+    database.queries.clear()
+    time.sleep(0.01)
+    filter_containers(containers, PROJECT_NAME, incremental=True)
+    # Only missing representation and check of new versions are queried
+    assert database.queries == {"representations": 1, "new_versions": 1}
+
+    # New version of 'subsetB' makes its container outdated
+    database.add_version("v4", "subsetB")
+    database.queries.clear()
+    result = filter_containers(containers, PROJECT_NAME, incremental=True)
+    assert _names(result.outdated) == ["old", "other"]
+    assert database.queries["last_versions"] == 1
+    assert result == filter_containers(containers, PROJECT_NAME)
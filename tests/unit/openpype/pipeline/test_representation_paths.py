@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Test suite for batched representation path resolution."""
+import os
+
+from openpype.pipeline.load import get_representation_paths
+
+
+class FakeAnatomy:
+    def __init__(self, root):
+        self.roots = {"work": root}
+
+
+def _repre_doc(repre_id, name, template=None):
+    return {
+        "_id": repre_id,
+        "name": name,
+        "context": {
+            "root": {"work": "/wrong/root"},
+            "asset": "sh010",
+            "representation": name,
+        },
+        "data": {
+            "template": (
+                template or "{root[work]}/{asset}/{asset}.{representation}"
+            )
+        },
+    }
+
+
+def test_get_representation_paths(tmp_path):
+    root = str(tmp_path)
+    (tmp_path / "sh010").mkdir()
+    (tmp_path / "sh010" / "sh010.exr").write_text("")
+    repre_docs = [
+        _repre_doc("a", "exr"),
+        _repre_doc("b", "exr"),
+        _repre_doc("c", "mov"),
+        _repre_doc("d", "abc", template="{root[work]}/{missing}.abc"),
+    ]
+
+    paths = get_representation_paths(
+        "test_project", repre_docs, anatomy=FakeAnatomy(root)
+    )
+    expected = os.path.normpath(os.path.join(root, "sh010", "sh010.exr"))
+    assert paths["a"] == expected
+    assert paths["b"] == expected
+    assert paths["c"].endswith("sh010.mov")
+    assert paths["d"] is None
+    # Documents are not modified
+    assert repre_docs[0]["context"]["root"] == {"work": "/wrong/root"}
+
+    paths = get_representation_paths(
+        "test_project",
+        repre_docs,
+        anatomy=FakeAnatomy(root),
+        check_existence=True
+    )
+    assert paths["a"] == expected
+    assert paths["c"] is None
+
+
+def test_get_representation_paths_with_roots():
+    repre_docs = [_repre_doc("a", "exr"), _repre_doc("b", "mov")]
+
+    paths = get_representation_paths(
+        "test_project", repre_docs, roots={"work": "/mnt/site"}
+    )
+    assert paths["a"] == os.path.normpath("/mnt/site/sh010/sh010.exr")
+    assert paths["b"] == os.path.normpath("/mnt/site/sh010/sh010.mov")
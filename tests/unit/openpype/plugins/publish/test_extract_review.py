@@ -1,3 +1,4 @@
+from openpype.plugins.publish import extract_review
 from openpype.plugins.publish.extract_review import ExtractReview
 
 
@@ -27,3 +28,46 @@ def test_fix_ffmpeg_full_args_filters():
     assert ret[-1] == output_arg
     assert ret[-2] == '"adeclick,adeclick"'  # TODO fix this duplication
     assert ret[-3] == "-filter:a"
+
+
+def test_merge_compatible_outputs(monkeypatch):
+    """Outputs with the same input are rendered by single process."""
+    monkeypatch.setattr(
+        extract_review, "get_ffmpeg_tool_args", lambda tool_name: ["ffmpeg"]
+    )
+    plugin = ExtractReview()
+    plugin.merge_compatible_outputs = True
+    input_args = ["-start_number 1001", "-i /in/file.%04d.exr"]
+
+    def _render_item(filters, output_path, audio_filters=None):
+        output_args = ["-c:v libx264", "-y", output_path]
+        return {
+            "label": output_path,
+            "new_repre": {"ffmpeg_cmd": output_path},
+            "ffmpeg_parts": (
+                list(input_args), filters, audio_filters or [], output_args
+            ),
+            "frame_start": 1001,
+            "frame_end": 1010,
+        }
+
+    render_items = [
+        _render_item(["lut3d=file='a.cube'", "scale=1920:1080"], "a.mp4"),
+        _render_item(["lut3d=file='a.cube'", "scale=960:540"], "b.mp4"),
+        _render_item(["lut3d=file='a.cube'"], "c.mp4", ["volume=2"]),
+    ]
+    jobs = plugin._create_render_jobs(render_items)
+    assert len(jobs) == 2
+    assert jobs[0]["fallback_commands"] == ["a.mp4", "b.mp4"]
+    assert jobs[1]["command"] == "c.mp4"
+
+    command = jobs[0]["command"]
+    assert command.count("-i ") == 1
+    assert (
+        "\"[0:v]lut3d=file='a.cube',split=2[s0][s1];"
+        "[s0]scale=1920:1080[v0];[s1]scale=960:540[v1]\""
+    ) in command
+    assert command.endswith("-c:v libx264 b.mp4")
+
+    plugin.merge_compatible_outputs = False
+    assert len(plugin._create_render_jobs(render_items)) == 3
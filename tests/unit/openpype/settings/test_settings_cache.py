@@ -0,0 +1,82 @@
+"""Test cache of resolved settings in 'openpype.settings.lib'."""
+import pytest
+
+from openpype.settings import lib
+
+
+class FakeSettingsHandler(object):
+    def __init__(self):
+        self.system_overrides = {"general": {"studio_name": "studio"}}
+        self.project_overrides = {None: {}}
+        self.revisions = {}
+        self.resolve_count = 0
+
+    def _bump(self, key):
+        self.revisions[key] = self.revisions.get(key, 0) + 1
+
+    def save_project_overrides(self, project_name, overrides):
+        self.project_overrides[project_name] = overrides
+        self._bump(project_name)
+
+    def get_studio_system_settings_overrides(self, return_version):
+        self.resolve_count += 1
+        return dict(self.system_overrides)
+
+    def get_studio_project_settings_overrides(self, return_version):
+        return dict(self.project_overrides[None])
+
+    def get_project_settings_overrides(self, project_name, return_version):
+        self.resolve_count += 1
+        return dict(self.project_overrides.get(project_name) or {})
+
+    def get_system_settings_revision(self):
+        return self.revisions.get("system", 0)
+
+    def get_project_settings_revision(self, project_name):
+        return self.revisions.get(project_name, 0)
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    handler = FakeSettingsHandler()
+    monkeypatch.setattr(lib, "_SETTINGS_HANDLER", handler)
+    monkeypatch.setattr(lib, "_DEFAULT_SETTINGS", {
+        "system_settings": {"general": {"studio_name": ""}},
+        "project_settings": {"global": {"value": 1, "items": [1, 2]}},
+    })
+    lib.clear_settings_cache()
+    yield handler
+    lib.clear_settings_cache()
+
+
+def test_resolved_settings_are_cached(handler):
+    first = lib.get_project_settings("project", exclude_locals=True)
+    first["global"]["value"] = 5
+    second = lib.get_project_settings("project", exclude_locals=True)
+
+    # Modification of returned value doesn't affect cache
+    assert second["global"]["value"] == 1
+    assert handler.resolve_count == 1
+
+
+def test_cache_is_invalidated_by_revision(handler):
+    view = lib.get_project_settings_view("project", exclude_locals=True)
+    assert view["global"]["value"] == 1
+    assert lib.get_project_settings_view(
+        "project", exclude_locals=True) is view
+
+    handler.save_project_overrides("project", {"global": {"value": 2}})
+    new_view = lib.get_project_settings_view("project", exclude_locals=True)
+    assert new_view["global"]["value"] == 2
+    assert new_view is not view
+
+
+def test_settings_view_is_read_only(handler):
+    view = lib.get_system_settings_view(exclude_locals=True)
+    assert view["general"]["studio_name"] == "studio"
+    with pytest.raises(TypeError):
+        view["general"]["studio_name"] = "other"
+
+    project_view = lib.get_project_settings_view(
+        "project", exclude_locals=True)
+    assert project_view["global"]["items"] == (1, 2)